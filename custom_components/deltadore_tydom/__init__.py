@@ -19,6 +19,7 @@ from .const import (
     CONF_ZONES_AWAY,
     CONF_ZONES_NIGHT,
     CONF_REFRESH_INTERVAL,
+    CONF_CLOUD_FAILOVER,
     LOGGER,
 )
 from .device_removal import can_remove_device
@@ -48,6 +49,18 @@ PLATFORMS: list[str] = [
 ]
 
 
+def _get_hub_entity(hass: HomeAssistant, entity_entry):
+    """Get the hub owning a registry entry and the entity it created.
+
+    Each config entry has its own hub, so with several gateways the entity
+    is looked up in its own hub only.
+    """
+    tydom_hub = hass.data.get(DOMAIN, {}).get(entity_entry.config_entry_id)
+    if tydom_hub is None:
+        return None, None
+    return tydom_hub, tydom_hub.get_entity(entity_entry.unique_id)
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Delta Dore Tydom integration."""
 
@@ -60,9 +73,19 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
         # Recharger toutes les entrées configurées
         LOGGER.info("Démarrage du rechargement de tous les appareils Tydom")
-        for entry_id, tydom_hub in hass.data[DOMAIN].items():
-            LOGGER.info("Rechargement de l'entrée de configuration: %s", entry_id)
-            await tydom_hub.reload_devices()
+        hubs = dict(hass.data[DOMAIN])
+        # Each gateway has its own connection: reload them concurrently
+        results = await asyncio.gather(
+            *(tydom_hub.reload_devices() for tydom_hub in hubs.values()),
+            return_exceptions=True,
+        )
+        for entry_id, result in zip(hubs, results):
+            if isinstance(result, BaseException):
+                LOGGER.error(
+                    "Échec du rechargement de l'entrée de configuration %s",
+                    entry_id,
+                    exc_info=result,
+                )
 
     hass.services.async_register(DOMAIN, "reload_devices", handle_reload_devices)
 
@@ -91,16 +114,12 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             LOGGER.error("No Tydom hub found")
             return
 
-        # Find the entity in the hub
-        for _entry_id, tydom_hub in hass.data[DOMAIN].items():
-            if entity_id in tydom_hub.ha_devices:
-                ha_device = tydom_hub.ha_devices[entity_id]
-                if hasattr(ha_device, "async_activate_scenario"):
-                    await ha_device.async_activate_scenario(scenario_id)
-                    LOGGER.info(
-                        "Activated scenario %s on group %s", scenario_id, entity_id
-                    )
-                    return
+        # Find the entity in the hub of its config entry
+        _tydom_hub, ha_device = _get_hub_entity(hass, entity_entry)
+        if ha_device is not None and hasattr(ha_device, "async_activate_scenario"):
+            await ha_device.async_activate_scenario(scenario_id)
+            LOGGER.info("Activated scenario %s on group %s", scenario_id, entity_id)
+            return
 
         LOGGER.error("Group entity %s not found in any hub", entity_id)
 
@@ -138,18 +157,16 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             LOGGER.error("No Tydom hub found")
             return
 
-        # Find the entity in the hub
-        for _entry_id, tydom_hub in hass.data[DOMAIN].items():
-            if entity_id in tydom_hub.ha_devices:
-                ha_device = tydom_hub.ha_devices[entity_id]
-                if hasattr(ha_device, "async_create"):
-                    await ha_device.async_create(entities=entities)
-                    LOGGER.info(
-                        "Scene %s created/updated with %d entities",
-                        entity_id,
-                        len(entities),
-                    )
-                    return
+        # Find the entity in the hub of its config entry
+        _tydom_hub, ha_device = _get_hub_entity(hass, entity_entry)
+        if ha_device is not None and hasattr(ha_device, "async_create"):
+            await ha_device.async_create(entities=entities)
+            LOGGER.info(
+                "Scene %s created/updated with %d entities",
+                entity_id,
+                len(entities),
+            )
+            return
 
         LOGGER.error("Scene entity %s not found in any hub", entity_id)
 
@@ -182,54 +199,50 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             LOGGER.error("No Tydom hub found")
             return
 
-        # Find the entity in the hub
-        for _entry_id, tydom_hub in hass.data[DOMAIN].items():
-            if hasattr(tydom_hub, "ha_devices") and entity_id in tydom_hub.ha_devices:
-                ha_device = tydom_hub.ha_devices[entity_id]
-                if hasattr(ha_device, "_device") and hasattr(
-                    ha_device._device, "group_id"
-                ):
-                    # It's a HAGroup entity
-                    try:
-                        if action == "turn_on":
-                            if hasattr(ha_device, "async_turn_on"):
-                                await ha_device.async_turn_on()
-                        elif action == "turn_off":
-                            if hasattr(ha_device, "async_turn_off"):
-                                await ha_device.async_turn_off()
-                        elif action == "open":
-                            if hasattr(ha_device, "async_open_cover"):
-                                await ha_device.async_open_cover()
-                        elif action == "close":
-                            if hasattr(ha_device, "async_close_cover"):
-                                await ha_device.async_close_cover()
-                        elif action == "stop":
-                            if hasattr(ha_device, "async_stop_cover"):
-                                await ha_device.async_stop_cover()
-                        elif action == "set_position":
-                            if hasattr(ha_device, "async_set_cover_position"):
-                                if position is None:
-                                    LOGGER.error(
-                                        "position is required for set_position action"
-                                    )
-                                    return
-                                await ha_device.async_set_cover_position(
-                                    position=position
-                                )
-                        else:
-                            LOGGER.error("Unknown action: %s", action)
+        # Find the entity in the hub of its config entry
+        _tydom_hub, ha_device = _get_hub_entity(hass, entity_entry)
+        if (
+            ha_device is not None
+            and hasattr(ha_device, "_device")
+            and hasattr(ha_device._device, "group_id")
+        ):
+            # It's a HAGroup entity
+            try:
+                if action == "turn_on":
+                    if hasattr(ha_device, "async_turn_on"):
+                        await ha_device.async_turn_on()
+                elif action == "turn_off":
+                    if hasattr(ha_device, "async_turn_off"):
+                        await ha_device.async_turn_off()
+                elif action == "open":
+                    if hasattr(ha_device, "async_open_cover"):
+                        await ha_device.async_open_cover()
+                elif action == "close":
+                    if hasattr(ha_device, "async_close_cover"):
+                        await ha_device.async_close_cover()
+                elif action == "stop":
+                    if hasattr(ha_device, "async_stop_cover"):
+                        await ha_device.async_stop_cover()
+                elif action == "set_position":
+                    if hasattr(ha_device, "async_set_cover_position"):
+                        if position is None:
+                            LOGGER.error("position is required for set_position action")
                             return
-                        LOGGER.info("Action %s executed on group %s", action, entity_id)
-                        return
-                    except Exception as e:
-                        LOGGER.error(
-                            "Error executing action %s on group %s: %s",
-                            action,
-                            entity_id,
-                            e,
-                            exc_info=True,
-                        )
-                        return
+                        await ha_device.async_set_cover_position(position=position)
+                else:
+                    LOGGER.error("Unknown action: %s", action)
+                    return
+                LOGGER.info("Action %s executed on group %s", action, entity_id)
+                return
+            except Exception as e:
+                LOGGER.error(
+                    "Error executing action %s on group %s: %s",
+                    action,
+                    entity_id,
+                    e,
+                    exc_info=True,
+                )
+                return
 
         LOGGER.error("Group entity %s not found in any hub", entity_id)
 
@@ -260,39 +273,37 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             LOGGER.error("No Tydom hub found")
             return
 
-        # Find the entity in the hub
-        for _entry_id, tydom_hub in hass.data[DOMAIN].items():
-            if hasattr(tydom_hub, "ha_devices") and entity_id in tydom_hub.ha_devices:
-                ha_device = tydom_hub.ha_devices[entity_id]
-                if hasattr(ha_device, "_device") and hasattr(
-                    ha_device._device, "group_id"
-                ):
-                    # It's a HAGroup entity
-                    group_device = ha_device._device
-                    devices_info = []
-
-                    # Get device names from hub
-                    if hasattr(tydom_hub, "devices"):
-                        for device_id in group_device.device_ids:
-                            device = tydom_hub.devices.get(device_id)
-                            if device:
-                                device_name = (
-                                    getattr(device, "device_name", None)
-                                    or f"Device {device_id}"
-                                )
-                                device_type = getattr(device, "device_type", "unknown")
-                                devices_info.append(
-                                    {
-                                        "device_id": device_id,
-                                        "name": device_name,
-                                        "type": device_type,
-                                    }
-                                )
-
-                    LOGGER.info(
-                        "Group %s contains %d devices", entity_id, len(devices_info)
-                    )
-                    return {"devices": devices_info}
+        # Find the entity in the hub of its config entry
+        tydom_hub, ha_device = _get_hub_entity(hass, entity_entry)
+        if (
+            ha_device is not None
+            and hasattr(ha_device, "_device")
+            and hasattr(ha_device._device, "group_id")
+        ):
+            # It's a HAGroup entity
+            group_device = ha_device._device
+            devices_info = []
+
+            # Get device names from hub
+            if hasattr(tydom_hub, "devices"):
+                for device_id in group_device.device_ids:
+                    device = tydom_hub.devices.get(device_id)
+                    if device:
+                        device_name = (
+                            getattr(device, "device_name", None)
+                            or f"Device {device_id}"
+                        )
+                        device_type = getattr(device, "device_type", "unknown")
+                        devices_info.append(
+                            {
+                                "device_id": device_id,
+                                "name": device_name,
+                                "type": device_type,
+                            }
+                        )
+
+            LOGGER.info("Group %s contains %d devices", entity_id, len(devices_info))
+            return {"devices": devices_info}
 
         LOGGER.error("Group entity %s not found in any hub", entity_id)
         return {"devices": []}
@@ -344,17 +355,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         str(zone_away),
         str(zone_night),
         str(pin),
+        bool(entry.data.get(CONF_CLOUD_FAILOVER, False)),
     )
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = tydom_hub
 
     try:
-        connection = await tydom_hub.connect()
+        # Entities known by the previous run are created without waiting for
+        # the gateway handshake, which the hub then runs in the background.
+        if not await tydom_hub.restore_snapshot():
+            await tydom_hub.connect()
         entry.async_create_background_task(
-            target=tydom_hub.setup(connection), hass=hass, name="Tydom"
+            target=tydom_hub.setup(), hass=hass, name="Tydom"
         )
         entry.async_create_background_task(
             target=tydom_hub.ping(), hass=hass, name="Tydom ping"
         )
+        if tydom_hub.cloud_failover:
+            entry.async_create_background_task(
+                target=tydom_hub.probe_paths(), hass=hass, name="Tydom probe paths"
+            )
         entry.async_create_background_task(
             target=tydom_hub.refresh_all(),
             hass=hass,
@@ -430,6 +449,10 @@ async def async_remove_config_entry_device(
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener."""
     tydom_hub = hass.data[DOMAIN][entry.entry_id]
+    if bool(entry.data.get(CONF_CLOUD_FAILOVER, False)) != tydom_hub.cloud_failover:
+        # The standby path is chosen when the client is built.
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
     tydom_hub.update_config(
         entry.data[CONF_REFRESH_INTERVAL],
         entry.data[CONF_ZONES_HOME],
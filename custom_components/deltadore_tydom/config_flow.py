@@ -35,6 +35,7 @@ from .const import (
     CONF_CONFIG_MODE,
     CONF_CLOUD_MODE,
     CONF_MANUAL_MODE,
+    CONF_CLOUD_FAILOVER,
 )
 from . import hub
 from .tydom.tydom_client import (
@@ -1122,6 +1123,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         default_zone_night = ""
         default_refresh_interval = "30"
         default_pin = ""
+        default_cloud_failover = bool(
+            self.config_entry.data.get(CONF_CLOUD_FAILOVER, False)
+        )
         if CONF_ZONES_HOME in self.config_entry.data:
             default_zone_home = self.config_entry.data[CONF_ZONES_HOME]
 
@@ -1143,6 +1147,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             default_zone_night = user_input.get(CONF_ZONES_NIGHT, "")
             default_refresh_interval = user_input.get(CONF_REFRESH_INTERVAL, "30")
             default_pin = user_input.get(CONF_PIN, "")
+            default_cloud_failover = user_input.get(CONF_CLOUD_FAILOVER, False)
 
             try:
                 # Validate zones
@@ -1183,6 +1188,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 updated_data[CONF_ZONES_NIGHT] = default_zone_night
                 updated_data[CONF_REFRESH_INTERVAL] = default_refresh_interval
                 updated_data[CONF_PIN] = default_pin
+                updated_data[CONF_CLOUD_FAILOVER] = default_cloud_failover
 
                 # Update entry
                 self.hass.config_entries.async_update_entry(
@@ -1268,6 +1274,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             autocomplete="off",
                         )
                     ),
+                    vol.Optional(
+                        CONF_CLOUD_FAILOVER, default=default_cloud_failover
+                    ): selector.BooleanSelector(),
                 }
             ),
             errors=_errors,
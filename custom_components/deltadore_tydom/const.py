@@ -15,6 +15,7 @@ CONF_ZONES_HOME = "zones_home"
 CONF_ZONES_AWAY = "zones_away"
 CONF_ZONES_NIGHT = "zones_night"
 CONF_CONFIG_MODE = "config_mode"
+CONF_CLOUD_FAILOVER = "cloud_failover"
 
 CONF_CLOUD_MODE = "tydom_cloud_account"
 CONF_MANUAL_MODE = "tydom_credentials"
@@ -276,6 +277,7 @@ TIMEOUT_LONG_REQUEST = 60.0  # Cloud credential fetch, digest handshake, histori
 TIMEOUT_WEBSOCKET_CONNECT = 30.0  # WebSocket upgrade (after digest handshake)
 TIMEOUT_WEBSOCKET_RECEIVE = 20.0  # Per-message websocket receive timeout
 TIMEOUT_PING = 40.0  # Ping timeout for remote mode
+TIMEOUT_COMMAND_ACK = 5.0  # Gateway acknowledgement of a PUT command
 
 
 class StructuredLogger:
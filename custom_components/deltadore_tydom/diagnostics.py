@@ -0,0 +1,29 @@
+"""Diagnostics support for Delta Dore TYDOM."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_MAC, CONF_PASSWORD, CONF_PIN
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_TYDOM_PASSWORD, DOMAIN
+
+TO_REDACT = {CONF_EMAIL, CONF_MAC, CONF_PASSWORD, CONF_PIN, CONF_TYDOM_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    ``traces`` holds the last frames received, in the ``traces.txt`` format
+    replayed by the client's file mode.
+    """
+    tydom_hub = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        **tydom_hub.get_diagnostics(),
+    }
@@ -1,6 +1,7 @@
 """Home assistant entites."""
 
 from typing import Any
+from collections.abc import Iterable
 import asyncio
 from contextlib import suppress
 import inspect
@@ -119,7 +120,7 @@ from .const import (
     get_naviclim_fan_mode,
     get_naviclim_fan_modes,
 )
-from .tydom.MessageHandler import device_name, groups_data
+from .tydom.catalog import DeviceCatalog
 
 
 _BINARY_TRUE_VALUES = frozenset({"1", "on", "true", "yes"})
@@ -218,7 +219,29 @@ def is_binary_attribute(
     )
 
 
-class HAEntity:
+class HubBoundEntity:
+    """Entity bound to the hub of its config entry."""
+
+    _device: Any = None
+    _hub: Any = None
+    """Hub that created the entity, bound before it is added to Home Assistant."""
+
+    def _get_hub(self):
+        """Get the hub that created this entity."""
+        return self._hub
+
+    @property
+    def available(self) -> bool:
+        """Return True if device and hub are available."""
+        if self._device is None:
+            return False
+        # The hub follows the connection and asks every entity to render
+        # its availability again when it changes.
+        hub = self._get_hub()
+        return hub is not None and hub.online
+
+
+class HAEntity(HubBoundEntity):
     """Generic abstract HA entity."""
 
     sensor_classes: dict[str, Any] = {}
@@ -226,39 +249,24 @@ class HAEntity:
     units: dict[str, Any] = {}
     filtered_attrs: list[str] = []
     consumed_attrs: frozenset[str] = frozenset()
-    _device: Any = None
-    _registered_sensors: list[str]
+    _registered_sensors: set[str]
     hass: Any = None
+    _update_attributes: frozenset[str] | None = None
+    """Device attributes rendered by the entity, or None for all of them."""
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        # Get the first hub entry (assuming single hub per instance)
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        # Return the first hub (entry_id is the key)
-        return next(iter(hubs.values()))
+    def _get_catalog(self) -> DeviceCatalog:
+        """Get the device catalogue of the gateway of this entity."""
+        hub = self._get_hub()
+        if hub is None:
+            return DeviceCatalog()
+        return hub.catalog
 
     def _get_tydom_gateway_device_id(self) -> str | None:
         """Get the Tydom gateway device_id to use as via_device_id."""
         hub_instance = self._get_hub()
         if hub_instance is None:
             return None
-        # Look for the Tydom gateway device in hub devices
-        if hasattr(hub_instance, "devices"):
-            for _device_id, device in hub_instance.devices.items():
-                if isinstance(device, Tydom):
-                    return device.device_id
-        # Also check ha_devices
-        if hasattr(hub_instance, "ha_devices"):
-            for _device_id, ha_device in hub_instance.ha_devices.items():
-                if isinstance(ha_device, HATydom):
-                    return ha_device._device.device_id
-        return None
+        return hub_instance.gateway_device_id
 
     def _enrich_device_info(self, info: DeviceInfo) -> DeviceInfo:
         """Enrich device info with via_device link to gateway.
@@ -287,7 +295,10 @@ class HAEntity:
         """
         if self._device is not None:
             # Register callback for state updates
-            self._device.register_callback(self.async_write_ha_state)  # type: ignore[attr-defined]
+            self._device.register_callback(
+                self.async_write_ha_state,  # type: ignore[attr-defined]
+                self._update_attributes,
+            )
             # Register entity reference (only if entity is actually added)
             self._device._ha_device = self
 
@@ -304,32 +315,66 @@ class HAEntity:
             if hasattr(self._device, "_ha_device") and self._device._ha_device is self:
                 self._device._ha_device = None
 
-    @property
-    def available(self) -> bool:
-        """Return True if device and hub are available."""
-        if self._device is None:
-            return False
-        hub = self._get_hub()
-        if hub is None:
-            return False
-        # Check hub online status
-        if not getattr(hub, "online", False):
-            return False
-        # Check if tydom_client is available
-        if hasattr(hub, "_tydom_client"):
-            tydom_client = hub._tydom_client
-            # Check if client has a connection attribute
-            if hasattr(tydom_client, "_connection"):
-                connection = getattr(tydom_client, "_connection", None)
-                if connection is not None:
-                    # Check if websocket is closed
-                    if hasattr(connection, "closed"):
-                        if connection.closed:
-                            return False
-        return True
+    @classmethod
+    def _attribute_descriptors(cls) -> dict[str, dict[str, Any]]:
+        """Get the discovery settings of the entity class, by attribute.
 
-    def get_sensors(self):
-        """Get available sensors for this entity."""
+        ``filtered_attrs``, ``sensor_classes``, ``state_classes`` and
+        ``units`` are merged once per class, so discovering a sensor costs one
+        lookup for its attribute and one for its base name.
+        """
+        descriptors = cls.__dict__.get("_descriptors")
+        if descriptors is None:
+            descriptors = cls._merge_attribute_tables(
+                cls.filtered_attrs, cls.sensor_classes, cls.state_classes, cls.units
+            )
+            cls._descriptors = descriptors
+        return descriptors
+
+    @staticmethod
+    def _merge_attribute_tables(
+        filtered_attrs, sensor_classes, state_classes, units
+    ) -> dict[str, dict[str, Any]]:
+        """Merge the per-attribute lookup tables of an entity."""
+        descriptors: dict[str, dict[str, Any]] = {}
+        for attribute in filtered_attrs:
+            descriptors.setdefault(attribute, {})["filtered"] = True
+        for key, table in (
+            ("sensor_class", sensor_classes),
+            ("state_class", state_classes),
+            ("unit", units),
+        ):
+            for attribute, value in table.items():
+                descriptors.setdefault(attribute, {})[key] = value
+        return descriptors
+
+    def _get_attribute_descriptors(self) -> dict[str, dict[str, Any]]:
+        """Get the discovery settings of this entity, by attribute.
+
+        Entities setting their own lookup tables in ``__init__`` get their
+        own map, built on first use.
+        """
+        descriptors = self.__dict__.get("_descriptors")
+        if descriptors is not None:
+            return descriptors
+        if not any(
+            table in self.__dict__
+            for table in ("filtered_attrs", "sensor_classes", "state_classes", "units")
+        ):
+            return self._attribute_descriptors()
+        descriptors = self._merge_attribute_tables(
+            self.filtered_attrs, self.sensor_classes, self.state_classes, self.units
+        )
+        self._descriptors = descriptors
+        return descriptors
+
+    def get_sensors(self, attributes: Iterable[str] | None = None):
+        """Get available sensors for this entity.
+
+        Without ``attributes``, every attribute of the device is considered,
+        as when the entity is created. After an update, only the attributes
+        the update reported can hold a new sensor.
+        """
         sensors = []
         # Generic sensor discovery is opt-in. Entity wrappers such as scenes,
         # groups and events must not expose their internal data as sensors.
@@ -337,72 +382,71 @@ class HAEntity:
         if registered_sensors is None:
             return sensors
 
+        values = self._device.__dict__
+        if attributes is None:
+            attributes = values
+        candidates = [
+            attribute
+            for attribute in attributes
+            if attribute[:1] != "_"
+            and attribute not in registered_sensors
+            and values.get(attribute) is not None
+        ]
+        if not candidates:
+            return sensors
+
+        descriptors = self._get_attribute_descriptors()
         consumed_attrs = self._get_consumed_attrs()
-        for attribute, value in self._device.__dict__.items():
-            if (
-                attribute[:1] != "_"
-                and value is not None
-                and attribute not in registered_sensors
-            ):
-                alt_name = attribute.split("_")[0]
-                if attribute in self.filtered_attrs or alt_name in self.filtered_attrs:
-                    continue
-                if attribute in consumed_attrs or alt_name in consumed_attrs:
-                    continue
-                sensor_class = None
-                if attribute in self.sensor_classes:
-                    sensor_class = self.sensor_classes[attribute]
-                elif alt_name in self.sensor_classes:
-                    sensor_class = self.sensor_classes[alt_name]
-
-                state_class = None
-                if attribute in self.state_classes:
-                    state_class = self.state_classes[attribute]
-                elif alt_name in self.state_classes:
-                    state_class = self.state_classes[alt_name]
-
-                unit = None
-                if attribute in self.units:
-                    unit = self.units[attribute]
-                elif alt_name in self.units:
-                    unit = self.units[alt_name]
-
-                is_binary_sensor = is_binary_attribute(
-                    self._device, attribute, value, sensor_class
+        for attribute in candidates:
+            value = values[attribute]
+            alt_name = attribute.split("_")[0]
+            if alt_name in consumed_attrs or attribute in consumed_attrs:
+                continue
+            descriptor = descriptors.get(attribute, {})
+            if alt_name != attribute and alt_name in descriptors:
+                descriptor = {**descriptors[alt_name], **descriptor}
+            if descriptor.get("filtered"):
+                continue
+            sensor_class = descriptor.get("sensor_class")
+            state_class = descriptor.get("state_class")
+            unit = descriptor.get("unit")
+
+            is_binary_sensor = is_binary_attribute(
+                self._device, attribute, value, sensor_class
+            )
+            if is_binary_sensor:
+                binary_sensor_class = (
+                    BinarySensorDeviceClass.PROBLEM
+                    if is_problem_attribute(attribute)
+                    else sensor_class
                 )
-                if is_binary_sensor:
-                    binary_sensor_class = (
-                        BinarySensorDeviceClass.PROBLEM
-                        if is_problem_attribute(attribute)
-                        else sensor_class
-                    )
-                    sensors.append(
-                        GenericBinarySensor(
-                            self._device,
-                            binary_sensor_class,
-                            attribute,
-                            attribute,
-                        )
+                sensors.append(
+                    GenericBinarySensor(
+                        self._device,
+                        binary_sensor_class,
+                        attribute,
+                        attribute,
                     )
-                else:
-                    sensors.append(
-                        GenericSensor(
-                            self._device,
-                            sensor_class,
-                            state_class,
-                            attribute,
-                            attribute,
-                            unit,
-                        )
+                )
+            else:
+                sensors.append(
+                    GenericSensor(
+                        self._device,
+                        sensor_class,
+                        state_class,
+                        attribute,
+                        attribute,
+                        unit,
                     )
-                registered_sensors.append(attribute)
-                LOGGER.debug(
-                    "Nouveau capteur créé: %s.%s (type: %s, valeur: %s)",
-                    self._device.device_id,
-                    attribute,
-                    "binary" if is_binary_sensor else "sensor",
-                    value,
                 )
+            registered_sensors.add(attribute)
+            LOGGER.debug(
+                "Nouveau capteur créé: %s.%s (type: %s, valeur: %s)",
+                self._device.device_id,
+                attribute,
+                "binary" if is_binary_sensor else "sensor",
+                value,
+            )
 
         return sensors
 
@@ -463,11 +507,12 @@ class HAEntity:
         return info
 
 
-class GenericSensor(SensorEntity):
+class GenericSensor(HubBoundEntity, SensorEntity):
     """Representation of a generic sensor."""
 
     _attr_should_poll = False
     _attr_has_entity_name = True
+    _update_attributes: frozenset[str] | None = None
     diagnostic_attrs = [
         "config",
         "supervisionMode",
@@ -517,6 +562,7 @@ class GenericSensor(SensorEntity):
         self._attr_unique_id = f"{self._device.device_id}_{name}"
         self._attr_name = name
         self._attribute = attribute
+        self._update_attributes = frozenset({attribute})
         # Create entity description with translation key
         entity_description = SensorEntityDescription(
             key=attribute,
@@ -533,31 +579,12 @@ class GenericSensor(SensorEntity):
         if name in self.diagnostic_attrs:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if not hasattr(self, "hass") or self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        return next(iter(hubs.values()))
-
     def _get_tydom_gateway_device_id(self) -> str | None:
         """Get the Tydom gateway device_id to use as via_device_id."""
         hub_instance = self._get_hub()
         if hub_instance is None:
             return None
-        if hasattr(hub_instance, "devices"):
-            for _device_id, device in hub_instance.devices.items():
-                if isinstance(device, Tydom):
-                    return device.device_id
-        if hasattr(hub_instance, "ha_devices"):
-            for _device_id, ha_device in hub_instance.ha_devices.items():
-                if isinstance(ha_device, HATydom):
-                    return ha_device._device.device_id
-        return None
+        return hub_instance.gateway_device_id
 
     @property
     def native_value(self):
@@ -706,31 +733,6 @@ class GenericSensor(SensorEntity):
 
         return info
 
-    @property
-    def available(self) -> bool:
-        """Return True if hub is available."""
-        if self._device is None:
-            return False
-        # Use the same availability logic as HAEntity
-        if hasattr(self, "hass") and self.hass is not None:
-            from .const import DOMAIN
-
-            if DOMAIN in self.hass.data:
-                hubs = self.hass.data[DOMAIN]
-                if hubs:
-                    hub = next(iter(hubs.values()))
-                    if not getattr(hub, "online", False):
-                        return False
-                    # Check tydom_client connection
-                    if hasattr(hub, "_tydom_client"):
-                        tydom_client = hub._tydom_client
-                        if hasattr(tydom_client, "_connection"):
-                            connection = getattr(tydom_client, "_connection", None)
-                            if connection is not None and hasattr(connection, "closed"):
-                                if connection.closed:
-                                    return False
-        return True
-
     async def async_added_to_hass(self):
         """Run when this Entity has been added to HA.
 
@@ -739,7 +741,9 @@ class GenericSensor(SensorEntity):
         references here, not in __init__.
         """
         # Sensors should also register callbacks to HA when their state changes
-        self._device.register_callback(self.async_write_ha_state)
+        self._device.register_callback(
+            self.async_write_ha_state, self._update_attributes
+        )
         # Register entity reference (only if entity is actually added)
         if self._device is not None:
             self._device._ha_device = self
@@ -757,41 +761,23 @@ class GenericSensor(SensorEntity):
             self._device._ha_device = None
 
 
-class BinarySensorBase(BinarySensorEntity):
+class BinarySensorBase(HubBoundEntity, BinarySensorEntity):
     """Base representation of a Sensor."""
 
     _attr_should_poll = False
     hass: Any = None
+    _update_attributes: frozenset[str] | None = None
 
     def __init__(self, device: TydomDevice):
         """Initialize the sensor."""
         self._device = device
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if not hasattr(self, "hass") or self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        return next(iter(hubs.values()))
-
     def _get_tydom_gateway_device_id(self) -> str | None:
         """Get the Tydom gateway device_id to use as via_device_id."""
         hub_instance = self._get_hub()
         if hub_instance is None:
             return None
-        if hasattr(hub_instance, "devices"):
-            for _device_id, device in hub_instance.devices.items():
-                if isinstance(device, Tydom):
-                    return device.device_id
-        if hasattr(hub_instance, "ha_devices"):
-            for _device_id, ha_device in hub_instance.ha_devices.items():
-                if isinstance(ha_device, HATydom):
-                    return ha_device._device.device_id
-        return None
+        return hub_instance.gateway_device_id
 
     @property
     def device_info(self):
@@ -855,7 +841,9 @@ class BinarySensorBase(BinarySensorEntity):
         references here, not in __init__.
         """
         # Sensors should also register callbacks to HA when their state changes
-        self._device.register_callback(self.async_write_ha_state)
+        self._device.register_callback(
+            self.async_write_ha_state, self._update_attributes
+        )
         # Register entity reference (only if entity is actually added)
         if self._device is not None:
             self._device._ha_device = self
@@ -890,6 +878,7 @@ class GenericBinarySensor(BinarySensorBase):
         self._attr_unique_id = f"{self._device.device_id}_{name}"
         self._attr_name = name
         self._attribute = attribute
+        self._update_attributes = frozenset({attribute})
         # Create entity description with translation key
         entity_description = BinarySensorEntityDescription(
             key=attribute,
@@ -906,56 +895,12 @@ class GenericBinarySensor(BinarySensorBase):
         ):
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if not hasattr(self, "hass") or self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        return next(iter(hubs.values()))
-
     def _get_tydom_gateway_device_id(self) -> str | None:
         """Get the Tydom gateway device_id to use as via_device_id."""
         hub_instance = self._get_hub()
         if hub_instance is None:
             return None
-        if hasattr(hub_instance, "devices"):
-            for _device_id, device in hub_instance.devices.items():
-                if isinstance(device, Tydom):
-                    return device.device_id
-        if hasattr(hub_instance, "ha_devices"):
-            for _device_id, ha_device in hub_instance.ha_devices.items():
-                if isinstance(ha_device, HATydom):
-                    return ha_device._device.device_id
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return True if hub is available."""
-        if self._device is None:
-            return False
-        # Use the same availability logic as HAEntity
-        if hasattr(self, "hass") and self.hass is not None:
-            from .const import DOMAIN
-
-            if DOMAIN in self.hass.data:
-                hubs = self.hass.data[DOMAIN]
-                if hubs:
-                    hub = next(iter(hubs.values()))
-                    if not getattr(hub, "online", False):
-                        return False
-                    # Check tydom_client connection
-                    if hasattr(hub, "_tydom_client"):
-                        tydom_client = hub._tydom_client
-                        if hasattr(tydom_client, "_connection"):
-                            connection = getattr(tydom_client, "_connection", None)
-                            if connection is not None and hasattr(connection, "closed"):
-                                if connection.closed:
-                                    return False
-        return True
+        return hub_instance.gateway_device_id
 
     # The value of this sensor.
     @property
@@ -966,7 +911,7 @@ class GenericBinarySensor(BinarySensorBase):
         )
 
 
-class ClockSensor(SensorEntity):
+class ClockSensor(HubBoundEntity, SensorEntity):
     """Sensor for clock/timezone data from Tydom gateway."""
 
     _attr_should_poll = False
@@ -1090,17 +1035,6 @@ class ClockSensor(SensorEntity):
                 attrs["summer_offset"] = clock["summerOffset"]
         return attrs
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if not hasattr(self, "hass") or self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        return next(iter(hubs.values()))
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return information to link this entity with the gateway device."""
@@ -1111,20 +1045,6 @@ class ClockSensor(SensorEntity):
             "model": getattr(self._device, "productName", "Tydom Gateway"),
         }
 
-    @property
-    def available(self) -> bool:
-        """Return True if hub is available."""
-        if self._device is None:
-            return False
-        if hasattr(self, "hass") and self.hass is not None:
-            if DOMAIN in self.hass.data:
-                hubs = self.hass.data[DOMAIN]
-                if hubs:
-                    hub = next(iter(hubs.values()))
-                    if not getattr(hub, "online", False):
-                        return False
-        return True
-
     async def async_added_to_hass(self):
         """Run when this Entity has been added to HA.
 
@@ -1149,7 +1069,7 @@ class ClockSensor(SensorEntity):
             self._device._ha_device = None
 
 
-class GeolocationSensor(SensorEntity):
+class GeolocationSensor(HubBoundEntity, SensorEntity):
     """Sensor for geolocation data from Tydom gateway."""
 
     _attr_should_poll = False
@@ -1211,17 +1131,6 @@ class GeolocationSensor(SensorEntity):
                 attrs["raw_latitude"] = geoloc["latitude"]
         return attrs
 
-    def _get_hub(self):
-        """Get the hub instance from hass data."""
-        if not hasattr(self, "hass") or self.hass is None:
-            return None
-        if DOMAIN not in self.hass.data:
-            return None
-        hubs = self.hass.data[DOMAIN]
-        if not hubs:
-            return None
-        return next(iter(hubs.values()))
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return information to link this entity with the gateway device."""
@@ -1232,20 +1141,6 @@ class GeolocationSensor(SensorEntity):
             "model": getattr(self._device, "productName", "Tydom Gateway"),
         }
 
-    @property
-    def available(self) -> bool:
-        """Return True if hub is available."""
-        if self._device is None:
-            return False
-        if hasattr(self, "hass") and self.hass is not None:
-            if DOMAIN in self.hass.data:
-                hubs = self.hass.data[DOMAIN]
-                if hubs:
-                    hub = next(iter(hubs.values()))
-                    if not getattr(hub, "online", False):
-                        return False
-        return True
-
     async def async_added_to_hass(self):
         """Run when this Entity has been added to HA.
 
@@ -1412,7 +1307,7 @@ class HATydom(UpdateEntity, HAEntity):
         self._attr_device_class = UpdateDeviceClass.FIRMWARE
         self._attr_unique_id = f"{self._device.device_id}"
         self._attr_name = self._device.device_name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         # Track which protocol/geoloc/clock sensors have been created to avoid duplicates
         self._created_protocol_sensors: set[str] = set()
         self._created_geoloc_sensors: set[str] = set()
@@ -1548,7 +1443,7 @@ class HATydom(UpdateEntity, HAEntity):
         """Install an update."""
         await self._device.async_trigger_firmware_update()
 
-    def get_sensors(self):
+    def get_sensors(self, attributes: Iterable[str] | None = None):
         """Get available sensors for this entity, including protocol sensors.
 
         Returns only sensors that haven't been created yet to avoid duplicates.
@@ -1556,7 +1451,7 @@ class HATydom(UpdateEntity, HAEntity):
         sensors = []
 
         # Get standard sensors from parent class (only new ones)
-        new_standard_sensors = super().get_sensors()
+        new_standard_sensors = super().get_sensors(attributes)
         sensors.extend(new_standard_sensors)
 
         # Add protocol binary sensors if protocols data is available
@@ -1662,7 +1557,7 @@ class HATydom(UpdateEntity, HAEntity):
                     )
                     binary_sensor.hass = self.hass
                     sensors.append(binary_sensor)
-                    self._registered_sensors.append(attr)
+                    self._registered_sensors.add(attr)
                     LOGGER.debug("Created system status binary sensor: %s", attr)
 
         # Add bddStatus as a regular sensor (it's numeric)
@@ -1680,7 +1575,7 @@ class HATydom(UpdateEntity, HAEntity):
             )
             bdd_status_sensor.hass = self.hass
             sensors.append(bdd_status_sensor)
-            self._registered_sensors.append("bddStatus")
+            self._registered_sensors.add("bddStatus")
             LOGGER.debug("Created system status sensor: bddStatus")
 
         return sensors
@@ -1833,7 +1728,7 @@ class HAEnergy(SensorEntity, HAEntity):
         # to comply with Home Assistant best practices for disabled entities
         self._attr_unique_id = f"{self._device.device_id}_energy"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
     async def async_added_to_hass(self) -> None:
         """Refresh on every device push (see HACover for the MRO rationale)."""
@@ -1882,7 +1777,7 @@ class HACover(CoverEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         if self._device.device_type == "awning":
             self._attr_device_class = CoverDeviceClass.AWNING
             self._attr_icon = "mdi:awning-outline"
@@ -2098,70 +1993,30 @@ class HACover(CoverEntity, HAEntity):
             if not device_id:
                 return controlled_by
 
-            # Check all scenes to see if they control this device
-            for _id, device in hub_instance.devices.items():
-                if isinstance(device, TydomScene):
-                    affected_device_ids = self._get_scene_affected_device_ids(device)
-                    if device_id in affected_device_ids:
-                        scene_info = {
-                            "scene_id": getattr(device, "scene_id", None)
-                            or str(device.device_id),
-                            "scene_name": getattr(
-                                device, "device_name", "Unknown Scene"
-                            ),
-                        }
-
-                        # Try to get entity_id
-                        if (
-                            hasattr(hub_instance, "ha_devices")
-                            and device.device_id in hub_instance.ha_devices
-                        ):
-                            ha_scene = hub_instance.ha_devices[device.device_id]
-                            if hasattr(ha_scene, "entity_id"):
-                                scene_info["entity_id"] = ha_scene.entity_id
-
-                        controlled_by.append(scene_info)
+            # Scenes controlling this device, as related by the hub
+            for scene_device_id in hub_instance.scene_relations.scenes_of(device_id):
+                device = hub_instance.devices.get(scene_device_id)
+                if device is None:
+                    continue
+                scene_info = {
+                    "scene_id": getattr(device, "scene_id", None)
+                    or str(device.device_id),
+                    "scene_name": getattr(device, "device_name", "Unknown Scene"),
+                }
+
+                # Try to get entity_id
+                if (
+                    hasattr(hub_instance, "ha_devices")
+                    and device.device_id in hub_instance.ha_devices
+                ):
+                    ha_scene = hub_instance.ha_devices[device.device_id]
+                    if hasattr(ha_scene, "entity_id"):
+                        scene_info["entity_id"] = ha_scene.entity_id
+
+                controlled_by.append(scene_info)
 
         return controlled_by
 
-    def _get_scene_affected_device_ids(self, scene_device: TydomScene) -> set[str]:
-        """Get affected device IDs from a scene device.
-
-        Args:
-            scene_device: TydomScene device
-
-        Returns:
-            Set of device IDs affected by the scene
-
-        """
-        affected_ids = set()
-
-        # Get grpAct
-        grp_act = getattr(scene_device, "grpAct", None)
-        if grp_act and isinstance(grp_act, list):
-            from .tydom.MessageHandler import groups_data
-
-            for grp_action in grp_act:
-                if isinstance(grp_action, dict):
-                    grp_id = grp_action.get("id")
-                    if grp_id:
-                        grp_id_str = str(grp_id)
-                        if grp_id_str in groups_data:
-                            group_info = groups_data[grp_id_str]
-                            device_ids = group_info.get("devices", [])
-                            affected_ids.update(device_ids)
-
-        # Get epAct
-        ep_act = getattr(scene_device, "epAct", None)
-        if ep_act and isinstance(ep_act, list):
-            for ep_action in ep_act:
-                if isinstance(ep_action, dict):
-                    ep_id = ep_action.get("id")
-                    if ep_id:
-                        affected_ids.add(str(ep_id))
-
-        return affected_ids
-
     def _enrich_extra_state_attributes(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """Enrich extra_state_attributes with common attributes like controlled_by_scenes.
 
@@ -2232,7 +2087,7 @@ class HASmoke(BinarySensorEntity, HAEntity):
         self._attr_unique_id = f"{self._device.device_id}_smoke"
         self._attr_name = None  # primary entity inherits device name
         self._state = False
-        self._registered_sensors = []
+        self._registered_sensors = set()
         # This is the detector's primary entity. Keep it visible as a smoke
         # sensor; independent diagnostics such as battDefect remain available.
         self._attr_device_class = BinarySensorDeviceClass.SMOKE
@@ -2454,11 +2309,11 @@ class HaClimate(ClimateEntity, HAEntity):
         ):
             self._attr_hvac_modes.append(HVACMode.HEAT)
 
-        self._registered_sensors = []
+        self._registered_sensors = set()
         if self._device.device_id.endswith("_area_climate"):
             # The source passive controller already exposes these as sensors;
             # keep them only as the climate entity's current temperature.
-            self._registered_sensors.extend(["temperature", "ambientTemperature"])
+            self._registered_sensors.update(("temperature", "ambientTemperature"))
 
         if (
             self._device._metadata is not None
@@ -2544,11 +2399,11 @@ class HaClimate(ClimateEntity, HAEntity):
         if self._supports_fan:
             self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
 
-    def get_sensors(self):
+    def get_sensors(self, attributes: Iterable[str] | None = None):
         """Avoid duplicating the source controller's sensors on area proxies."""
         if self._device.is_derived_area_climate:
             return []
-        return super().get_sensors()
+        return super().get_sensors(attributes)
 
     async def async_added_to_hass(self) -> None:
         """Refresh on every device push (see HACover for the MRO rationale)."""
@@ -2570,7 +2425,9 @@ class HaClimate(ClimateEntity, HAEntity):
         registry_device_id = str(self._device.source_device_id)
         infos: DeviceInfo = {
             "identifiers": {(DOMAIN, registry_device_id)},
-            "name": str(device_name.get(registry_device_id, self._device.device_name)),
+            "name": str(
+                self._get_catalog().name(registry_device_id) or self._device.device_name
+            ),
             "manufacturer": device_info["manufacturer"],
         }
         if "model" in device_info:
@@ -2875,7 +2732,7 @@ class HaOpeningBinarySensor(BinarySensorEntity, HAEntity):
         # from open/closed to on/off.
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._attr_device_class = self._opening_device_class
 
     def _get_consumed_attrs(self) -> set[str]:
@@ -2964,7 +2821,7 @@ class HaWindow(CoverEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
     def _get_consumed_attrs(self) -> set[str]:
         """Hide only contact attributes which add no opening detail."""
@@ -3037,7 +2894,7 @@ class HaDoor(CoverEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
     def _get_consumed_attrs(self) -> set[str]:
         """Hide raw contact aliases when they back the door's primary state."""
@@ -3143,7 +3000,7 @@ class HaGate(CoverEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._attr_supported_features = _level_command_cover_features(device)
 
     async def async_added_to_hass(self) -> None:
@@ -3221,7 +3078,7 @@ class HaGarage(CoverEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_cover"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._attr_supported_features = _level_command_cover_features(
             device, allow_position=True
         )
@@ -3311,7 +3168,7 @@ class HaLight(LightEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_light"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
         if self._device.supports_brightness:
             self._attr_color_mode = ColorMode.BRIGHTNESS
             if self._attr_supported_color_modes is None:
@@ -3430,7 +3287,7 @@ class HaAlarm(AlarmControlPanelEntity, HAEntity):
         self._attr_name = None  # primary entity inherits device name
         self._attr_code_format = CodeFormat.NUMBER
         self._attr_code_arm_required = True
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
         self._attr_supported_features = (
             self._attr_supported_features
@@ -3651,7 +3508,9 @@ class HaWeather(WeatherEntity, HAEntity):
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_weather"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
+        # Units read from the metadata belong to this device only.
+        self.units = dict(self.units)
         if (
             self._device._metadata is not None
             and "dailyPower" in self._device._metadata
@@ -3729,7 +3588,7 @@ class HaMoisture(BinarySensorEntity, HAEntity):
         self._attr_unique_id = f"{self._device.device_id}_moisture"
         self._attr_name = None  # primary entity inherits device name
         self._state = False
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._attr_device_class = BinarySensorDeviceClass.MOISTURE
 
     async def async_added_to_hass(self) -> None:
@@ -3781,7 +3640,7 @@ class HaThermo(SensorEntity, HAEntity):
         self._attr_unique_id = f"{self._device.device_id}_thermos"
         self._attr_name = None  # primary entity inherits device name
         self._state = False
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -3841,7 +3700,7 @@ class HaSun(SensorEntity, HAEntity):
         # entry and recorder history can survive the dedicated implementation.
         self._attr_unique_id = f"{self._device.device_id}_lightPower"
         self._attr_name = None
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
     async def async_added_to_hass(self) -> None:
         """Refresh the entity on every device push."""
@@ -3887,7 +3746,7 @@ class HAGenericBinarySensor(BinarySensorEntity, HAEntity):
         self._attribute = attribute
         self._attr_unique_id = f"{self._device.device_id}_sensor"
         self._attr_name = None
-        self._registered_sensors = [attribute]
+        self._registered_sensors = {attribute}
 
     @property
     def is_on(self) -> bool | None:
@@ -3931,7 +3790,7 @@ class HASensor(SensorEntity, HAEntity):
         self.units = dict.fromkeys(battery_attributes, PERCENTAGE)
         self._attr_unique_id = f"{self._device.device_id}_sensor"
         self._attr_name = None  # primary entity inherits device name
-        self._registered_sensors = []
+        self._registered_sensors = set()
 
     async def async_added_to_hass(self) -> None:
         """Refresh on every device push (see HACover for the MRO rationale)."""
@@ -4020,7 +3879,6 @@ class HAScene(Scene, HAEntity):
         # Cache to avoid repeated searches
         self._cached_tywell_device_id: str | None = None
         self._cached_zone: str | None = None
-        self._cached_affected_device_ids: set[str] | None = None
         # Store related entity IDs for scene configuration
         self._related_entity_ids: list[str] = []
         # Store entity states for scene editor (dict of entity_id -> state dict)
@@ -4049,6 +3907,7 @@ class HAScene(Scene, HAEntity):
             return self._cached_zone
 
         zone = None
+        catalog = self._get_catalog()
         # Priority 1: Analyze scene name
         name = self._device.device_name.upper()
         # Detect French and English patterns
@@ -4072,14 +3931,14 @@ class HAScene(Scene, HAEntity):
                     if isinstance(group, dict):
                         group_id = group.get("id")
                         if group_id:
-                            # Try to get group name from groups_data first
+                            # Try to get group name from the groups first
                             group_id_str = str(group_id)
-                            group_info = groups_data.get(group_id_str, {})
+                            group_info = catalog.groups.get(group_id_str, {})
                             group_name = group_info.get("name", "").upper()
 
-                            # Fallback to device_name if not in groups_data
+                            # Fallback to the endpoint names
                             if not group_name:
-                                group_name = device_name.get(group_id_str, "").upper()
+                                group_name = catalog.name(group_id_str).upper()
 
                             if any(pattern in group_name for pattern in day_patterns):
                                 zone = "day"
@@ -4110,7 +3969,7 @@ class HAScene(Scene, HAEntity):
                             device_id_str = str(dev_id)
 
                         if device_id_str:
-                            endpoint_name = device_name.get(device_id_str, "").upper()
+                            endpoint_name = catalog.name(device_id_str).upper()
                             if any(
                                 pattern in endpoint_name for pattern in day_patterns
                             ):
@@ -4205,31 +4064,35 @@ class HAScene(Scene, HAEntity):
             )
         return device_key
 
-    def _get_affected_device_ids(self) -> set[str]:
-        """Extract device IDs affected by this scene from grpAct and epAct.
+    def _get_affected_device_ids(self) -> frozenset[str]:
+        """Get the IDs of the devices controlled by this scene.
 
-        Returns a set of device IDs that are controlled by this scene.
-        Uses groups_data to resolve group IDs to device IDs.
-        Improved with better edge case handling and consistency validation.
+        The hub relates each scene to its devices when its grpAct, its epAct
+        or the groups of the gateway change, see ``resolve_affected_devices``.
         """
-        # Use cache if available
-        if self._cached_affected_device_ids is not None:
-            return self._cached_affected_device_ids
+        hub_instance = self._get_hub()
+        if hub_instance is None:
+            return frozenset()
+        return hub_instance.scene_relations.devices_of(self._device.device_id)
+
+    def resolve_affected_devices(self, hub_instance) -> tuple[set[str], bool]:
+        """Extract device IDs affected by this scene from grpAct and epAct.
 
+        Returns the set of device IDs that are controlled by this scene, and
+        whether every group and endpoint of the scene matched a device.
+        Uses the groups of the gateway to resolve group IDs to device IDs.
+        """
         affected_device_ids: set[str] = set()
         unresolved_groups: list[str] = []
         unresolved_endpoints: list[dict] = []
+        missing_members = False
 
         try:
-            hub_instance = self._get_hub()
-            if not hub_instance or not hasattr(hub_instance, "devices"):
-                self._cached_affected_device_ids = affected_device_ids
-                return affected_device_ids
-
             grp_act = getattr(self._device, "grpAct", None)
             ep_act = getattr(self._device, "epAct", None)
 
-            # Extract IDs from grpAct using groups_data
+            # Extract IDs from grpAct using the groups of the gateway
+            groups_data = hub_instance.catalog.groups
             if grp_act and isinstance(grp_act, list):
                 for group in grp_act:
                     if isinstance(group, dict):
@@ -4237,7 +4100,7 @@ class HAScene(Scene, HAEntity):
                         if group_id:
                             group_id_str = str(group_id)
 
-                            # Resolve group ID to device IDs using groups_data
+                            # Resolve group ID to device IDs
                             if group_id_str in groups_data:
                                 group_info = groups_data[group_id_str]
                                 device_ids_from_group = group_info.get("devices", [])
@@ -4253,70 +4116,39 @@ class HAScene(Scene, HAEntity):
 
                                 resolved_count = 0
                                 for device_id in device_ids_from_group:
-                                    # Verify the device exists in hub
-                                    if device_id in hub_instance.devices:
-                                        affected_device_ids.add(device_id)
-                                        resolved_count += 1
-                                    else:
-                                        # Try to find the device with different formats
-                                        # Sometimes the device ID format might differ
-                                        found_match = False
-                                        for (
-                                            known_device_id,
-                                            known_device,
-                                        ) in hub_instance.devices.items():
-                                            # Try exact match first
-                                            if device_id == known_device_id:
-                                                affected_device_ids.add(known_device_id)
-                                                resolved_count += 1
-                                                found_match = True
-                                                break
-
-                                            # Try device_id attribute
-                                            if hasattr(known_device, "device_id"):
-                                                if (
-                                                    str(known_device.device_id)
-                                                    == device_id
-                                                ):
-                                                    affected_device_ids.add(
-                                                        known_device_id
-                                                    )
-                                                    resolved_count += 1
-                                                    found_match = True
-                                                    break
-
-                                            # Try _id attribute
-                                            if hasattr(known_device, "_id"):
-                                                if str(known_device._id) == device_id:
-                                                    affected_device_ids.add(
-                                                        known_device_id
-                                                    )
-                                                    resolved_count += 1
-                                                    found_match = True
-                                                    break
-
-                                            # Last resort: partial match
-                                            if (
-                                                device_id in known_device_id
-                                                or known_device_id in device_id
-                                            ):
-                                                affected_device_ids.add(known_device_id)
-                                                resolved_count += 1
-                                                found_match = True
-                                                LOGGER.debug(
-                                                    "Partial match: group device %s -> hub device %s",
-                                                    device_id,
-                                                    known_device_id,
-                                                )
-                                                break
-
-                                        if not found_match:
+                                    # Verify the device exists in hub, whatever
+                                    # the ID format used by the group
+                                    known_device_id = hub_instance.resolve_device_id(
+                                        device_id
+                                    )
+                                    if known_device_id is None:
+                                        # Last resort: partial match
+                                        known_device_id = next(
+                                            (
+                                                known_id
+                                                for known_id in hub_instance.devices
+                                                if device_id in known_id
+                                                or known_id in device_id
+                                            ),
+                                            None,
+                                        )
+                                        if known_device_id is not None:
                                             LOGGER.debug(
-                                                "Device %s from group %s not found in hub for scene %s",
+                                                "Partial match: group device %s -> hub device %s",
                                                 device_id,
-                                                group_id_str,
-                                                self._device.device_id,
+                                                known_device_id,
                                             )
+                                    if known_device_id is None:
+                                        missing_members = True
+                                        LOGGER.debug(
+                                            "Device %s from group %s not found in hub for scene %s",
+                                            device_id,
+                                            group_id_str,
+                                            self._device.device_id,
+                                        )
+                                        continue
+                                    affected_device_ids.add(known_device_id)
+                                    resolved_count += 1
 
                                 if resolved_count > 0:
                                     LOGGER.debug(
@@ -4340,7 +4172,7 @@ class HAScene(Scene, HAEntity):
                                 else:
                                     unresolved_groups.append(group_id_str)
                                     LOGGER.debug(
-                                        "Group %s not found in groups_data for scene %s",
+                                        "Group %s not found in groups for scene %s",
                                         group_id_str,
                                         self._device.device_id,
                                     )
@@ -4388,52 +4220,20 @@ class HAScene(Scene, HAEntity):
                         # Try each candidate ID
                         found = False
                         for candidate_id in candidate_ids:
-                            if candidate_id in hub_instance.devices:
-                                affected_device_ids.add(candidate_id)
+                            known_device_id = hub_instance.resolve_device_id(
+                                candidate_id
+                            )
+                            if known_device_id is not None:
+                                affected_device_ids.add(known_device_id)
                                 found = True
                                 LOGGER.debug(
                                     "Resolved epAct endpoint (devId=%s, epId=%s) to device %s",
                                     dev_id,
                                     ep_id,
-                                    candidate_id,
+                                    known_device_id,
                                 )
                                 break
 
-                            # Also check device_id and _id attributes
-                            for (
-                                known_device_id,
-                                known_device,
-                            ) in hub_instance.devices.items():
-                                if (
-                                    hasattr(known_device, "device_id")
-                                    and str(known_device.device_id) == candidate_id
-                                ):
-                                    affected_device_ids.add(known_device_id)
-                                    found = True
-                                    LOGGER.debug(
-                                        "Resolved epAct endpoint (devId=%s, epId=%s) to device %s via device_id",
-                                        dev_id,
-                                        ep_id,
-                                        known_device_id,
-                                    )
-                                    break
-                                if (
-                                    hasattr(known_device, "_id")
-                                    and str(known_device._id) == candidate_id
-                                ):
-                                    affected_device_ids.add(known_device_id)
-                                    found = True
-                                    LOGGER.debug(
-                                        "Resolved epAct endpoint (devId=%s, epId=%s) to device %s via _id",
-                                        dev_id,
-                                        ep_id,
-                                        known_device_id,
-                                    )
-                                    break
-
-                            if found:
-                                break
-
                         if not found:
                             # Last resort: try partial matches
                             for known_device_id in hub_instance.devices:
@@ -4479,15 +4279,16 @@ class HAScene(Scene, HAEntity):
                     len(unresolved_endpoints),
                 )
 
-            # Cache result
-            self._cached_affected_device_ids = affected_device_ids
             LOGGER.debug(
                 "Scene %s affects %d device(s): %s",
                 self._device.device_id,
                 len(affected_device_ids),
                 list(affected_device_ids),
             )
-            return affected_device_ids
+            complete = not (
+                unresolved_groups or unresolved_endpoints or missing_members
+            )
+            return affected_device_ids, complete
         except Exception as e:
             LOGGER.warning(
                 "Error while extracting affected device IDs for scene %s: %s",
@@ -4495,8 +4296,7 @@ class HAScene(Scene, HAEntity):
                 e,
                 exc_info=True,
             )
-            self._cached_affected_device_ids = set()
-            return set()
+            return set(), False
 
     def _find_tywell_device(self, zone: str | None = None) -> str | None:
         """Find the physical Tywell controller associated with a TWC scene.
@@ -4661,6 +4461,7 @@ class HAScene(Scene, HAEntity):
         if not items or not isinstance(items, list):
             return ""
 
+        catalog = self._get_catalog()
         formatted_items = []
         for item in items:
             if not isinstance(item, dict):
@@ -4674,23 +4475,15 @@ class HAScene(Scene, HAEntity):
                 item_id = item.get("epId") or item.get("devId")
 
             if item_id is not None:
-                # Essayer de résoudre le nom depuis device_name
-                # Pour les groupes, l'ID peut être directement dans device_name
+                # Essayer de résoudre le nom depuis le catalogue
+                # Pour les groupes, l'ID peut être directement dans le catalogue
                 # Pour les endpoints, c'est généralement "epId_deviceId"
-                name = None
-                if str(item_id) in device_name:
-                    name = device_name[str(item_id)]
-                else:
+                name = catalog.name(str(item_id)) or None
+                if name is None and item_type == "endpoint":
                     # Pour les endpoints, essayer avec le format "epId_deviceId"
-                    if item_type == "endpoint":
-                        dev_id = item.get("devId")
-                        if dev_id:
-                            unique_id = f"{item_id}_{dev_id}"
-                            if unique_id in device_name:
-                                name = device_name[unique_id]
-                            # Si pas trouvé, essayer juste avec epId
-                            elif str(item_id) in device_name:
-                                name = device_name[str(item_id)]
+                    dev_id = item.get("devId")
+                    if dev_id:
+                        name = catalog.name(f"{item_id}_{dev_id}") or None
 
                 if name:
                     # Ajouter les informations d'état si disponibles
@@ -4813,8 +4606,7 @@ class HAScene(Scene, HAEntity):
                     if grp_id:
                         grp_id_str = str(grp_id)
                         # Resolve group to devices
-                        from .tydom.MessageHandler import groups_data
-
+                        groups_data = self._get_catalog().groups
                         if grp_id_str in groups_data:
                             group_info = groups_data[grp_id_str]
                             group_name = group_info.get("name", f"Group {grp_id_str}")
@@ -4864,16 +4656,10 @@ class HAScene(Scene, HAEntity):
                         ep_id_str = str(ep_id)
                         device_name = None
                         if hub_instance and hasattr(hub_instance, "devices"):
-                            # Try to find device by various ID formats
-                            for _id, device in hub_instance.devices.items():
-                                if (
-                                    _id == ep_id_str
-                                    or str(getattr(device, "device_id", ""))
-                                    == ep_id_str
-                                    or str(getattr(device, "_id", "")) == ep_id_str
-                                ):
-                                    device_name = getattr(device, "device_name", None)
-                                    break
+                            # Find the device whatever the ID format
+                            device = hub_instance.resolve_device(ep_id_str)
+                            if device is not None:
+                                device_name = getattr(device, "device_name", None)
 
                         action_detail = {
                             "device_id": ep_id_str,
@@ -5051,8 +4837,7 @@ class HAScene(Scene, HAEntity):
         await self._create_scene_device_relations()
 
     def _invalidate_caches(self) -> None:
-        """Invalidate cached data when device is updated."""
-        self._cached_affected_device_ids = None
+        """Invalidate the zone and Tywell controller found for this scene."""
         self._cached_tywell_device_id = None
         self._cached_zone = None
         LOGGER.debug("Invalidated caches for scene %s", self._device.device_id)
@@ -5060,34 +4845,14 @@ class HAScene(Scene, HAEntity):
     async def async_device_update(self, device: TydomScene) -> None:
         """Handle device update for scene.
 
-        This method is called when the scene device is updated.
-        It invalidates caches and recreates relations if grpAct/epAct changed.
+        This method is called when the scene device is updated. The hub has
+        already related the scene to its devices again if grpAct/epAct
+        changed; only a new name is handled here.
         """
-        old_grp_act = getattr(self._device, "grpAct", None)
-        old_ep_act = getattr(self._device, "epAct", None)
-        old_name = getattr(self._device, "device_name", None)
-
-        # Invalidate caches
-        self._invalidate_caches()
-
-        # Check if grpAct or epAct changed
-        new_grp_act = getattr(device, "grpAct", None)
-        new_ep_act = getattr(device, "epAct", None)
+        old_name = self._base_name
         new_name = getattr(device, "device_name", None)
 
-        grp_act_changed = old_grp_act != new_grp_act
-        ep_act_changed = old_ep_act != new_ep_act
-        name_changed = old_name != new_name
-
-        if grp_act_changed or ep_act_changed:
-            LOGGER.debug(
-                "Scene %s grpAct/epAct changed, recreating relations",
-                self._device.device_id,
-            )
-            # Recreate relations with affected devices
-            await self._create_scene_device_relations()
-
-        if name_changed:
+        if old_name != new_name:
             LOGGER.debug(
                 "Scene %s name changed from '%s' to '%s'",
                 self._device.device_id,
@@ -5095,6 +4860,7 @@ class HAScene(Scene, HAEntity):
                 new_name,
             )
             # Update base name and recalculate zone
+            self._invalidate_caches()
             self._base_name = new_name
             if self._is_twc_scene():
                 zone_key = self._get_zone_from_scene()
@@ -5608,7 +5374,7 @@ class HASwitch(SwitchEntity, HAEntity):
         """Initialize HASwitch."""
         self.hass = hass
         self._device = device
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._device._ha_device = self
         self._attr_unique_id = f"{self._device.device_id}_switch"
         self._attr_name = None  # primary entity inherits device name
@@ -5743,7 +5509,7 @@ class HAGroupEntity(HAEntity):
         """Return whether Home Assistant has fully registered this entity."""
         return self.hass is not None and getattr(self, "entity_id", None) is not None
 
-    def get_sensors(self) -> list:
+    def get_sensors(self, attributes: Iterable[str] | None = None) -> list:
         """Do not expose internal group membership as sensors."""
         return []
 
@@ -5756,18 +5522,7 @@ class HAGroupEntity(HAEntity):
         members: list[TydomDevice] = []
         seen: set[int] = set()
         for member_id in self._device.device_ids:
-            member = hub.devices.get(member_id)
-            if member is None:
-                member = next(
-                    (
-                        candidate
-                        for stored_id, candidate in hub.devices.items()
-                        if stored_id == member_id
-                        or str(getattr(candidate, "device_id", "")) == member_id
-                        or str(getattr(candidate, "_id", "")) == member_id
-                    ),
-                    None,
-                )
+            member = hub.resolve_device(member_id)
             if member is None or isinstance(member, TydomGroup):
                 continue
             member_identity = id(member)
@@ -6342,7 +6097,7 @@ class HAButton(ButtonEntity, HAEntity):
         """Initialize HAButton."""
         self.hass = hass
         self._device = device
-        self._registered_sensors = []
+        self._registered_sensors = set()
         self._device._ha_device = self
         self._action_name = action_name
         self._action_method = action_method
@@ -6725,6 +6480,7 @@ class HARemoteEvent(EventEntity, HAEntity):
     _attr_has_entity_name = True
     _attr_device_class = EventDeviceClass.BUTTON
     _attr_event_types = ["press_end", "long_press_end"]
+    _update_attributes = frozenset({"event_sequence"})
     _attr_icon = "mdi:remote"
 
     def __init__(self, device: TydomRemoteControl, hass) -> None:
@@ -6744,7 +6500,9 @@ class HARemoteEvent(EventEntity, HAEntity):
     async def async_added_to_hass(self) -> None:
         """Listen for fresh actions from this physical button endpoint."""
         await super().async_added_to_hass()
-        self._device.register_callback(self._handle_device_update)
+        self._device.register_callback(
+            self._handle_device_update, self._update_attributes
+        )
         self._device._ha_device = self
 
     async def async_will_remove_from_hass(self) -> None:
@@ -6775,7 +6533,7 @@ class HARemoteEvent(EventEntity, HAEntity):
         )
         self.async_write_ha_state()
 
-    def get_sensors(self) -> list:
+    def get_sensors(self, attributes: Iterable[str] | None = None) -> list:
         """Do not expose transient actions as ordinary sensors."""
         return []
 
@@ -6802,6 +6560,7 @@ class HARemoteBattery(BinarySensorEntity, HAEntity):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Battery fault"
+    _update_attributes = frozenset({"battDefect"})
 
     def __init__(self, device: TydomRemoteControl, hass) -> None:
         """Initialise the physical remote battery diagnostic."""
@@ -6829,7 +6588,7 @@ class HARemoteBattery(BinarySensorEntity, HAEntity):
             self.async_write_ha_state()
 
         self._callbacks[device.device_id] = handle_update
-        device.register_callback(handle_update)
+        device.register_callback(handle_update, self._update_attributes)
         initial_value = getattr(device, "battDefect", None)
         if initial_value is not None:
             self._battery_defect = bool(initial_value)
@@ -6910,6 +6669,7 @@ class HAInterrupterEvent(EventEntity, HAEntity):
     _attr_has_entity_name = True
     _attr_device_class = EventDeviceClass.BUTTON
     _attr_event_types = ["press_end", "long_press_end"]
+    _update_attributes = frozenset({"event_sequence"})
     _attr_icon = "mdi:light-switch"
 
     def __init__(self, device: TydomInterrupter, hass) -> None:
@@ -6928,7 +6688,9 @@ class HAInterrupterEvent(EventEntity, HAEntity):
     async def async_added_to_hass(self) -> None:
         """Listen for fresh actions from this physical button endpoint."""
         await super().async_added_to_hass()
-        self._device.register_callback(self._handle_device_update)
+        self._device.register_callback(
+            self._handle_device_update, self._update_attributes
+        )
         self._device._ha_device = self
 
     async def async_will_remove_from_hass(self) -> None:
@@ -6959,7 +6721,7 @@ class HAInterrupterEvent(EventEntity, HAEntity):
         )
         self.async_write_ha_state()
 
-    def get_sensors(self) -> list:
+    def get_sensors(self, attributes: Iterable[str] | None = None) -> list:
         """Do not expose transient actions as ordinary sensors."""
         return []
 
@@ -6986,6 +6748,7 @@ class HAInterrupterBattery(BinarySensorEntity, HAEntity):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Battery fault"
+    _update_attributes = frozenset({"battDefect"})
 
     def __init__(self, device: TydomInterrupter, hass) -> None:
         """Initialise the physical wall-switch battery diagnostic."""
@@ -7011,7 +6774,7 @@ class HAInterrupterBattery(BinarySensorEntity, HAEntity):
             self.async_write_ha_state()
 
         self._callbacks[device.device_id] = handle_update
-        device.register_callback(handle_update)
+        device.register_callback(handle_update, self._update_attributes)
         initial_value = getattr(device, "battDefect", None)
         if initial_value is not None:
             self._battery_defect = bool(initial_value)
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
 from aiohttp import ClientWebSocketResponse, ClientSession
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from .tydom.tydom_client import TydomClient
+from homeassistant.helpers.storage import Store
+from .tydom.const import MEDIATION_URL
+from .tydom.catalog import DeviceCatalog, SceneRelations
+from .tydom.tydom_client import SendPriority, TydomClient
 from .tydom.tydom_devices import (
     Tydom,
     TydomShutter,
@@ -75,15 +80,84 @@ from .ha_entities import (
     is_binary_attribute,
 )
 
-from .const import LOGGER, get_polling_interval_for_validity, STRUCTURED_LOGGER
+from .const import (
+    DOMAIN,
+    LOGGER,
+    get_polling_interval_for_validity,
+    STRUCTURED_LOGGER,
+)
 from .remote_registry_migration import migrate_legacy_remote_endpoint
 
+_SNAPSHOT_VERSION = 1
+"""Version of the stored warm-start snapshot."""
+
+_SNAPSHOT_SAVE_DELAY = 60
+"""Seconds between a device update and the snapshot write that includes it."""
+
+_PATH_PROBE_INTERVAL = 300
+"""Seconds between two measurements of the standby connection path."""
+
+_PLATFORM_CALLBACKS = (
+    "add_cover_callback",
+    "add_sensor_callback",
+    "add_climate_callback",
+    "add_light_callback",
+    "add_lock_callback",
+    "add_alarm_callback",
+    "add_update_callback",
+    "add_weather_callback",
+    "add_binary_sensor_callback",
+    "add_scene_callback",
+    "add_switch_callback",
+    "add_button_callback",
+    "add_number_callback",
+    "add_select_callback",
+    "add_event_callback",
+)
+"""Hub attributes assigned by the entity platforms during their setup."""
+
+
+class _PlatformCallback:
+    """Hub attribute holding the ``async_add_entities`` of a platform.
+
+    Reading the attribute returns a function binding the entities to the hub
+    before handing them to the platform; until the platform assigns its
+    callback, the entities are queued and added as soon as it is set up.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, hub: Hub | None, owner: type | None = None):
+        if hub is None:
+            return self
+        return partial(hub._add_entities, self.name)
+
+    def __set__(self, hub: Hub, callback: Callable[[list], None]) -> None:
+        hub._register_platform(self.name, callback)
+
 
 class Hub:
     """Hub for Delta Dore Tydom."""
 
     manufacturer = "Delta Dore"
 
+    add_cover_callback = _PlatformCallback()
+    add_sensor_callback = _PlatformCallback()
+    add_climate_callback = _PlatformCallback()
+    add_light_callback = _PlatformCallback()
+    add_lock_callback = _PlatformCallback()
+    add_alarm_callback = _PlatformCallback()
+    add_update_callback = _PlatformCallback()
+    add_weather_callback = _PlatformCallback()
+    add_binary_sensor_callback = _PlatformCallback()
+    add_scene_callback = _PlatformCallback()
+    add_switch_callback = _PlatformCallback()
+    add_button_callback = _PlatformCallback()
+    add_number_callback = _PlatformCallback()
+    add_select_callback = _PlatformCallback()
+    add_event_callback = _PlatformCallback()
+
     def handle_event(self, event):
         """Event callback."""
         pass
@@ -100,6 +174,7 @@ class Hub:
         zone_away: str,
         zone_night: str,
         alarmpin: str,
+        cloud_failover: bool = False,
     ) -> None:
         """Init hub."""
         self._host = host
@@ -116,36 +191,42 @@ class Hub:
         self._id = "Tydom-" + mac[6:]
         self.devices = {}
         self.ha_devices = {}
-        self.add_cover_callback = None
-        self.add_sensor_callback = None
-        self.add_climate_callback = None
-        self.add_light_callback = None
-        self.add_lock_callback = None
-        self.add_alarm_callback = None
-        self.add_update_callback = None
-        self.add_weather_callback = None
-        self.add_binary_sensor_callback = None
-        self.add_scene_callback = None
-        self.add_switch_callback = None
-        self.add_button_callback = None
-        self.add_number_callback = None
-        self.add_select_callback = None
-        self.add_event_callback = None
+        self._device_aliases: dict[str, dict[str, None]] = {}
+        """Keys of ``devices`` by the other identifiers of each device."""
+        self._group_members: dict[str, tuple[str, ...]] = {}
+        """Member IDs of each known group, by group device ID."""
+        self._groups_by_member: dict[str, dict[str, None]] = {}
+        """Group device IDs by the member IDs the groups list."""
+        self.scene_relations = SceneRelations()
+        """Devices each scenario acts on, and scenarios acting on each device."""
+        self._related_groups: dict[str, dict[str, Any]] = {}
+        """Groups of the gateway when the scenarios were last related."""
+        self._platform_callbacks: dict[str, Callable[[list], None]] = {}
+        self._deferred_entities: dict[str, list] = {}
+        self._entities_by_unique_id: dict[str, Any] = {}
+        self._created_at = time.monotonic()
+        self.cloud_failover = cloud_failover
+        """Whether the cloud is kept as a standby path of a local connection."""
 
         self._tydom_client = TydomClient(
             hass=self._hass,
             id=self._id,
             mac=self._mac,
             host=self._host,
+            standby_host=MEDIATION_URL if cloud_failover else None,
             password=self._pass,
             zone_home=self._zone_home,
             zone_away=self._zone_away,
             zone_night=self._zone_night,
             alarm_pin=self._pin,
             event_callback=self.handle_event,
+            connection_callback=self._set_online,
         )
 
         self.online = True
+        """Whether the websocket to the gateway is usable."""
+        self.gateway_device_id: str | None = None
+        """Device ID of the gateway, once it has been created."""
         self._reload_button_created = False
         self._refresh_energy_buttons_created: set[str] = set()
         self._remote_battery_entities: dict[str, HARemoteBattery] = {}
@@ -153,6 +234,13 @@ class Hub:
         self._twc_scene_sets: dict[str, dict[str, HAScene]] = {}
         self._twc_cover_entities: dict[str, HATwcShutterCover] = {}
         self._shutting_down = False
+        # Hubs built by the config flow to test credentials have no entry.
+        self._snapshot_store: Store[dict] | None = None
+        if entry is not None:
+            self._snapshot_store = Store(
+                hass, _SNAPSHOT_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot"
+            )
+        self._snapshot_save_scheduled = False
 
         # Polling cache for optimization
         self._polling_cache: dict[
@@ -202,6 +290,39 @@ class Hub:
         """ID for dummy hub."""
         return self._id
 
+    @property
+    def catalog(self) -> DeviceCatalog:
+        """Devices, groups and scenarios configured on the gateway."""
+        return self._tydom_client.catalog
+
+    def get_diagnostics(self) -> dict:
+        """Return the hub state and the last frames exchanged with the gateway."""
+        return {
+            "hub_id": self._id,
+            "online": self.online,
+            "devices": len(self.devices),
+            "requests_deferred": self._tydom_client.requests_deferred,
+            "connect_timings": self._tydom_client.connect_timings,
+            "paths": self._tydom_client.paths,
+            "bootstrap_timings": self._tydom_client.bootstrap_timings,
+            "endpoint_data": self._tydom_client.endpoint_data_stats,
+            **self._tydom_client.export_flight_recorder(),
+        }
+
+    def _set_online(self, online: bool) -> None:
+        """Record a change of the gateway connection and publish it."""
+        if online == self.online:
+            return
+        self.online = online
+        LOGGER.debug("Tydom %s", "en ligne" if online else "hors ligne")
+        if not self._shutting_down:
+            self._hass.async_create_task(self._publish_availability())
+
+    async def _publish_availability(self) -> None:
+        """Have every entity render its availability again, in one pass."""
+        for device in list(self.devices.values()):
+            await device.publish_updates()
+
     async def connect(self) -> ClientWebSocketResponse:
         """Connect to Tydom."""
         if self._shutting_down:
@@ -246,37 +367,39 @@ class Hub:
                     "Timed out closing Tydom websocket after credential test"
                 )
 
-    def ready(self) -> bool:
-        """Check if we're ready to work."""
-        # and self.add_alarm_callback is not None
-        is_ready = (
-            self.add_cover_callback is not None
-            and self.add_sensor_callback is not None
-            and self.add_climate_callback is not None
-            and self.add_light_callback is not None
-            and self.add_lock_callback is not None
-            and self.add_update_callback is not None
-            and self.add_alarm_callback is not None
-            and self.add_weather_callback is not None
-            and self.add_scene_callback is not None
-            and self.add_switch_callback is not None
-            and self.add_button_callback is not None
-            and self.add_number_callback is not None
-            and self.add_select_callback is not None
-            and self.add_event_callback is not None
-            and self.add_binary_sensor_callback is not None
-        )
-        # Créer le bouton de rechargement une fois que les callbacks sont prêts
-        if (
-            is_ready
-            and not self._reload_button_created
-            and self.add_button_callback is not None
-        ):
-            reload_button = HAReloadButton(self, self._hass)
-            self.add_button_callback([reload_button])
-            self._reload_button_created = True
-            LOGGER.debug("Bouton de rechargement créé")
-        return is_ready
+    def _register_platform(self, name: str, callback: Callable[[list], None]) -> None:
+        """Keep a platform callback and add the entities queued for it."""
+        self._platform_callbacks[name] = callback
+        deferred = self._deferred_entities.pop(name, None)
+        if deferred:
+            callback(deferred)
+        if len(self._platform_callbacks) == len(_PLATFORM_CALLBACKS):
+            LOGGER.debug(
+                "All platforms ready after %.3f s", time.monotonic() - self._created_at
+            )
+
+    def _add_entities(self, name: str, entities: list) -> None:
+        """Bind entities to this hub, then add them or queue them."""
+        for entity in entities:
+            entity._hub = self
+            unique_id = getattr(entity, "unique_id", None)
+            if unique_id is not None:
+                self._entities_by_unique_id[unique_id] = entity
+                entity.async_on_remove(partial(self._forget_entity, unique_id, entity))
+        callback = self._platform_callbacks.get(name)
+        if callback is None:
+            self._deferred_entities.setdefault(name, []).extend(entities)
+        else:
+            callback(entities)
+
+    def get_entity(self, unique_id: str):
+        """Get an entity created by this hub from its unique id."""
+        return self._entities_by_unique_id.get(unique_id)
+
+    def _forget_entity(self, unique_id: str, entity) -> None:
+        """Drop an entity removed from Home Assistant from the index."""
+        if self._entities_by_unique_id.get(unique_id) is entity:
+            del self._entities_by_unique_id[unique_id]
 
     def _add_discovered_entities(self, entities: list) -> None:
         """Add discovered entities to the platform matching their entity type."""
@@ -287,19 +410,30 @@ class Hub:
             entity for entity in entities if not isinstance(entity, BinarySensorEntity)
         ]
 
-        if sensors and self.add_sensor_callback is not None:
+        if sensors:
             self.add_sensor_callback(sensors)
-        if binary_sensors and self.add_binary_sensor_callback is not None:
+        if binary_sensors:
             self.add_binary_sensor_callback(binary_sensors)
 
-    async def setup(self, connection: ClientWebSocketResponse) -> None:
+    async def setup(self) -> None:
         """Listen to tydom events."""
-        # wait for callbacks to become available
-        while not self.ready():
-            if self._shutting_down:
-                return
-            await asyncio.sleep(1)
+        # Entities of platforms still being set up are queued until their
+        # callback is registered, so messages are consumed right away.
         LOGGER.debug("Listen to tydom events")
+        if not self._reload_button_created:
+            self.add_button_callback([HAReloadButton(self, self._hass)])
+            self._reload_button_created = True
+
+        # Set up from a snapshot, the hub connects here; the connection made
+        # by the entry setup is reused otherwise.
+        try:
+            await self.connect()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            # Restored entities stay unavailable until a reconnection succeeds
+            LOGGER.warning("Tydom injoignable, nouvelle tentative : %s", err)
+            self._set_online(False)
 
         # Validate data consistency after initial setup
         await self._validate_data_consistency()
@@ -308,70 +442,260 @@ class Hub:
             if self._shutting_down:
                 return
             if devices is not None:
-                for device in devices:
-                    if device.device_id not in self.devices:
-                        self.devices[device.device_id] = device
-                        STRUCTURED_LOGGER.device_operation(
-                            "debug",
-                            "create",
-                            device.device_id,
-                            type=device.device_type,
-                            name=device.device_name,
-                        )
-                        await self.create_ha_device(device)
-                    else:
-                        # Check for collision: same device_id but different device
-                        stored_device = self.devices[device.device_id]
-                        if stored_device is not device and (
-                            stored_device.device_name != device.device_name
-                            or stored_device.device_type != device.device_type
-                        ):
-                            # Resolve collision: update stored device with new data
-                            STRUCTURED_LOGGER.device_operation(
-                                "warning",
-                                "collision_resolved",
-                                device.device_id,
-                                stored_name=stored_device.device_name,
-                                stored_type=stored_device.device_type,
-                                new_name=device.device_name,
-                                new_type=device.device_type,
-                                action="updating_existing",
-                            )
-
-                            # Update stored device attributes to match new device
-                            # This ensures consistency and prevents future collisions
-                            if hasattr(stored_device, "_name"):
-                                stored_device._name = device.device_name
-                            if hasattr(stored_device, "_type"):
-                                stored_device._type = device.device_type
-
-                            # Also update metadata if available
-                            if (
-                                hasattr(device, "_metadata")
-                                and device._metadata is not None
-                            ):
-                                if hasattr(stored_device, "_metadata"):
-                                    stored_device._metadata = device._metadata
-
-                        LOGGER.debug(
-                            "update device %s : %s",
-                            device.device_id,
-                            self.devices[device.device_id],
-                        )
-                        await self.update_ha_device(
-                            self.devices[device.device_id], device
-                        )
-                self._refresh_group_members()
+                await self._handle_devices(devices)
+                self._schedule_snapshot_save()
+
+    async def _handle_devices(self, devices: list[TydomDevice]) -> None:
+        """Create or update the Home Assistant devices of a message batch."""
+        for key in self._tydom_client.pop_removed_endpoints():
+            await self._remove_device(key)
+        changed_groups: dict[str, None] = {}
+        new_scenes: dict[str, None] = {}
+        added = False
+        for device in devices:
+            if device.device_id not in self.devices:
+                self._add_device(device)
+                added = True
+                STRUCTURED_LOGGER.device_operation(
+                    "debug",
+                    "create",
+                    device.device_id,
+                    type=device.device_type,
+                    name=device.device_name,
+                )
+                await self.create_ha_device(device)
+                changed_groups.update(self._groups_to_refresh(device))
+                if isinstance(device, TydomScene):
+                    new_scenes[device.device_id] = None
+            else:
+                # Check for collision: same device_id but different device
+                stored_device = self.devices[device.device_id]
+                if stored_device is not device and (
+                    stored_device.device_name != device.device_name
+                    or stored_device.device_type != device.device_type
+                ):
+                    # Resolve collision: update stored device with new data
+                    STRUCTURED_LOGGER.device_operation(
+                        "warning",
+                        "collision_resolved",
+                        device.device_id,
+                        stored_name=stored_device.device_name,
+                        stored_type=stored_device.device_type,
+                        new_name=device.device_name,
+                        new_type=device.device_type,
+                        action="updating_existing",
+                    )
+
+                    # Update stored device attributes to match new device
+                    # This ensures consistency and prevents future collisions
+                    if hasattr(stored_device, "_name"):
+                        stored_device._name = device.device_name
+                    if hasattr(stored_device, "_type"):
+                        stored_device._type = device.device_type
+
+                    # Also update metadata if available
+                    if hasattr(device, "_metadata") and device._metadata is not None:
+                        if hasattr(stored_device, "_metadata"):
+                            stored_device._metadata = device._metadata
+
+                LOGGER.debug(
+                    "update device %s : %s",
+                    device.device_id,
+                    self.devices[device.device_id],
+                )
+                await self.update_ha_device(self.devices[device.device_id], device)
+                if isinstance(device, TydomGroup):
+                    changed_groups.update(
+                        self._groups_to_refresh(self.devices[device.device_id])
+                    )
+        self._refresh_group_members(changed_groups)
+        scene_ids = self._scenes_to_relate(added)
+        scene_ids.update(new_scenes)
+        await self._relate_scenes(scene_ids)
+
+    async def restore_snapshot(self) -> bool:
+        """Create the entities known by the previous run before connecting.
+
+        Restored entities keep their last known state; live replies then update
+        them through ``_handle_devices`` like any other message.
+
+        Returns:
+            Whether devices were restored.
+
+        """
+        if self._snapshot_store is None:
+            return False
+        snapshot = await self._snapshot_store.async_load()
+        if not snapshot or self._shutting_down:
+            return False
+        started = time.monotonic()
+        devices = await self._tydom_client.restore_snapshot(snapshot)
+        await self._handle_devices(devices)
+        LOGGER.debug(
+            "%d devices restored from snapshot in %.3f s",
+            len(devices),
+            time.monotonic() - started,
+        )
+        return bool(devices)
+
+    def _schedule_snapshot_save(self) -> None:
+        """Save the snapshot at most once per _SNAPSHOT_SAVE_DELAY."""
+        if self._snapshot_store is None or self._snapshot_save_scheduled:
+            return
+        self._snapshot_save_scheduled = True
+        self._snapshot_store.async_delay_save(self._snapshot_data, _SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot_data(self) -> dict:
+        """Return the snapshot to write."""
+        self._snapshot_save_scheduled = False
+        return self._tydom_client.export_snapshot()
+
+    @staticmethod
+    def _aliases_of(device: TydomDevice, key: str) -> list[str]:
+        """Get the identifiers naming a device other than its key."""
+        aliases = []
+        for name in ("group_id", "_id", "_endpoint"):
+            value = getattr(device, name, None)
+            if value is None or value == "":
+                continue
+            alias = str(value)
+            if alias != key and alias not in aliases:
+                aliases.append(alias)
+        return aliases
+
+    def _add_device(self, device: TydomDevice) -> None:
+        """Store a new device and index the identifiers it is known by."""
+        key = device.device_id
+        self.devices[key] = device
+        for alias in self._aliases_of(device, key):
+            self._device_aliases.setdefault(alias, {})[key] = None
+
+    async def _remove_device(self, key: str) -> None:
+        """Forget a device the gateway no longer lists, with its entities."""
+        device = self.devices.pop(key, None)
+        if device is None:
+            return
+        self.ha_devices.pop(key, None)
+        for alias in self._aliases_of(device, key):
+            keys = self._device_aliases.get(alias)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._device_aliases[alias]
+        for entities in self._deferred_entities.values():
+            entities[:] = [
+                entity
+                for entity in entities
+                if getattr(entity, "_device", None) is not device
+            ]
+        for unique_id, entity in list(self._entities_by_unique_id.items()):
+            if getattr(entity, "_device", None) is not device:
+                continue
+            if entity.hass is None:
+                # Never added to Home Assistant: nothing to remove there
+                self._forget_entity(unique_id, entity)
+            else:
+                await entity.async_remove()
 
-    def _refresh_group_members(self) -> None:
-        """Resolve group members again after each protocol message batch."""
-        for device in self.devices.values():
-            if not isinstance(device, TydomGroup):
+    def resolve_device_id(self, identifier: Any) -> str | None:
+        """Get the key in ``devices`` of the device known by an identifier.
+
+        Groups, scenarios and endpoint actions name a device by its unique
+        ID (``epId_devId``), its device ID or its endpoint ID, and a group or
+        a derived area thermostat by its own ID. When several devices share
+        an identifier, the first one stored is returned, as the gateway
+        lists them.
+        """
+        identifier = str(identifier)
+        if identifier in self.devices:
+            return identifier
+        keys = self._device_aliases.get(identifier)
+        if keys:
+            return next(iter(keys))
+        return None
+
+    def resolve_device(self, identifier: Any) -> TydomDevice | None:
+        """Get the device known by an identifier, in any of its forms."""
+        key = self.resolve_device_id(identifier)
+        return self.devices[key] if key is not None else None
+
+    def _index_group_members(self, group: TydomGroup) -> bool:
+        """Index the members of a group, and tell if they changed."""
+        group_id = group.device_id
+        members = tuple(group.device_ids)
+        previous = self._group_members.get(group_id)
+        if previous == members:
+            return False
+        for member_id in previous or ():
+            groups = self._groups_by_member.get(member_id)
+            if groups is None:
                 continue
-            ha_device = getattr(device, "_ha_device", None)
+            groups.pop(group_id, None)
+            if not groups:
+                del self._groups_by_member[member_id]
+        for member_id in members:
+            self._groups_by_member.setdefault(member_id, {})[group_id] = None
+        self._group_members[group_id] = members
+        return True
+
+    def _groups_to_refresh(self, device: TydomDevice) -> tuple[str, ...]:
+        """Get the groups whose members a new or updated device may change.
+
+        A group is refreshed when its member list changes, and a new device
+        only for the groups listing its unique ID or its device ID.
+        """
+        if isinstance(device, TydomGroup):
+            return (device.device_id,) if self._index_group_members(device) else ()
+        groups: dict[str, None] = {}
+        for member_id in (device.device_id, str(getattr(device, "_id", ""))):
+            groups.update(self._groups_by_member.get(member_id, {}))
+        return tuple(groups)
+
+    def _refresh_group_members(self, group_ids: Iterable[str]) -> None:
+        """Resolve the members of groups again."""
+        for group_id in group_ids:
+            ha_device = getattr(self.devices.get(group_id), "_ha_device", None)
             if ha_device is not None and hasattr(ha_device, "refresh_members"):
                 ha_device.refresh_members()
 
+    def _scenes_to_relate(self, new_devices: bool) -> dict[str, None]:
+        """Get the scenarios whose devices a message batch may change.
+
+        Scenarios are related again when a group they act on changed in
+        ``/groups/file``, and, when devices were added, if some of their
+        groups or endpoints matched no device yet.
+        """
+        scene_ids: dict[str, None] = {}
+        groups = self.catalog.groups
+        if groups is not self._related_groups:
+            previous, self._related_groups = self._related_groups, groups
+            for group_id in previous.keys() | groups.keys():
+                if previous.get(group_id) != groups.get(group_id):
+                    scene_ids.update(
+                        dict.fromkeys(self.scene_relations.scenes_of_group(group_id))
+                    )
+        if new_devices:
+            scene_ids.update(self.scene_relations.incomplete)
+        return scene_ids
+
+    async def _relate_scenes(self, scene_ids: Iterable[str]) -> None:
+        """Resolve again the devices scenarios act on."""
+        for scene_id in scene_ids:
+            ha_scene = self.ha_devices.get(scene_id)
+            if ha_scene is None or not hasattr(ha_scene, "resolve_affected_devices"):
+                continue
+            device_ids, complete = ha_scene.resolve_affected_devices(self)
+            group_ids = (
+                str(action["id"])
+                for action in getattr(ha_scene._device, "grpAct", None) or ()
+                if isinstance(action, dict) and action.get("id")
+            )
+            ha_scene._invalidate_caches()
+            if self.scene_relations.set_scene(
+                scene_id, device_ids, group_ids, complete
+            ) and getattr(ha_scene, "entity_id", None):
+                await ha_scene._create_scene_device_relations()
+
     async def create_ha_device(self, device: TydomDevice) -> None:
         """Create a new HA device using factory pattern.
 
@@ -410,21 +734,19 @@ class Hub:
     async def _create_tydom_device(self, device: Tydom) -> None:
         """Create Tydom gateway device."""
         LOGGER.debug("Create Tydom gateway %s", device.device_id)
-        self.devices[device.device_id] = device
+        self.gateway_device_id = device.device_id
         ha_device = HATydom(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_update_callback is not None:
-            self.add_update_callback([ha_device])
+        self.add_update_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
-        # Le bouton de rechargement est créé dans ready() pour être toujours présent
+        # Le bouton de rechargement est créé dans setup() pour être toujours présent
 
     async def _create_shutter_device(self, device: TydomShutter) -> None:
         """Create shutter/cover device."""
         LOGGER.debug("Create cover %s", device.device_id)
         ha_device = HACover(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_cover_callback is not None:
-            self.add_cover_callback([ha_device])
+        self.add_cover_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
 
     async def _create_energy_device(self, device: TydomEnergy) -> None:
@@ -456,11 +778,7 @@ class Hub:
             key.startswith("energy") for key in vars(device) if not key.startswith("_")
         )
         device_key = device.device_id
-        if (
-            has_energy_attrs
-            and device_key not in self._refresh_energy_buttons_created
-            and self.add_button_callback is not None
-        ):
+        if has_energy_attrs and device_key not in self._refresh_energy_buttons_created:
             refresh_energy_button = HARefreshEnergyButton(self, self._hass, ha_device)
             self.add_button_callback([refresh_energy_button])
             self._refresh_energy_buttons_created.add(device_key)
@@ -478,8 +796,7 @@ class Hub:
         LOGGER.debug("Create boiler %s", device.device_id)
         ha_device = HaClimate(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_climate_callback is not None:
-            self.add_climate_callback([ha_device])
+        self.add_climate_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
 
     async def _create_window_device(self, device: TydomWindow) -> None:
@@ -495,16 +812,14 @@ class Hub:
                 device.device_id,
             )
             ha_device = HaWindow(device, self._hass)
-            if self.add_cover_callback:
-                self.add_cover_callback([ha_device])
+            self.add_cover_callback([ha_device])
         else:
             LOGGER.debug(
                 "Window %s is passive → adding as binary_sensor",
                 device.device_id,
             )
             ha_device = HaWindowOpening(device, self._hass)
-            if self.add_binary_sensor_callback:
-                self.add_binary_sensor_callback([ha_device])
+            self.add_binary_sensor_callback([ha_device])
 
         self.ha_devices[device.device_id] = ha_device
         self._add_discovered_entities(ha_device.get_sensors())
@@ -531,15 +846,13 @@ class Hub:
                 "Door %s has motor control → adding as cover", device.device_id
             )
             ha_device = HaDoor(device, self._hass)
-            if self.add_cover_callback:
-                self.add_cover_callback([ha_device])
+            self.add_cover_callback([ha_device])
         else:
             LOGGER.debug(
                 "Door %s is passive → adding as binary_sensor", device.device_id
             )
             ha_device = HaDoorOpening(device, self._hass)
-            if self.add_binary_sensor_callback:
-                self.add_binary_sensor_callback([ha_device])
+            self.add_binary_sensor_callback([ha_device])
 
         self.ha_devices[device.device_id] = ha_device
         self._add_discovered_entities(ha_device.get_sensors())
@@ -556,12 +869,10 @@ class Hub:
                 icon="mdi:gate",
                 primary=True,
             )
-            if self.add_button_callback is not None:
-                self.add_button_callback([ha_device])
+            self.add_button_callback([ha_device])
         else:
             ha_device = HaGate(device, self._hass)
-            if self.add_cover_callback is not None:
-                self.add_cover_callback([ha_device])
+            self.add_cover_callback([ha_device])
         self.ha_devices[device.device_id] = ha_device
         self._add_discovered_entities(ha_device.get_sensors())
 
@@ -577,12 +888,10 @@ class Hub:
                 icon="mdi:garage",
                 primary=True,
             )
-            if self.add_button_callback is not None:
-                self.add_button_callback([ha_device])
+            self.add_button_callback([ha_device])
         else:
             ha_device = HaGarage(device, self._hass)
-            if self.add_cover_callback is not None:
-                self.add_cover_callback([ha_device])
+            self.add_cover_callback([ha_device])
         self.ha_devices[device.device_id] = ha_device
         self._add_discovered_entities(ha_device.get_sensors())
 
@@ -591,8 +900,7 @@ class Hub:
         LOGGER.debug("Create light %s", device.device_id)
         ha_device = HaLight(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_light_callback is not None:
-            self.add_light_callback([ha_device])
+        self.add_light_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
 
     async def _create_interrupter_device(self, device: TydomInterrupter) -> None:
@@ -600,15 +908,13 @@ class Hub:
         LOGGER.debug("Create wall-switch button %s", device.device_id)
         ha_device = HAInterrupterEvent(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_event_callback is not None:
-            self.add_event_callback([ha_device])
+        self.add_event_callback([ha_device])
 
         battery = self._interrupter_battery_entities.get(device.physical_device_id)
         if battery is None:
             battery = HAInterrupterBattery(device, self._hass)
             self._interrupter_battery_entities[device.physical_device_id] = battery
-            if self.add_binary_sensor_callback is not None:
-                self.add_binary_sensor_callback([battery])
+            self.add_binary_sensor_callback([battery])
         else:
             battery.add_device(device)
 
@@ -617,8 +923,7 @@ class Hub:
         LOGGER.debug("Create switch %s", device.device_id)
         ha_device = HASwitch(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_switch_callback is not None:
-            self.add_switch_callback([ha_device])
+        self.add_switch_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
 
     async def _create_alarm_device(self, device: TydomAlarm) -> None:
@@ -626,10 +931,8 @@ class Hub:
         LOGGER.debug("Create alarm %s", device.device_id)
         ha_device = HaAlarm(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_alarm_callback is not None:
-            self.add_alarm_callback([ha_device])
-        if self.add_button_callback is not None:
-            self.add_button_callback([HAAlarmAcknowledgeButton(device, self._hass)])
+        self.add_alarm_callback([ha_device])
+        self.add_button_callback([HAAlarmAcknowledgeButton(device, self._hass)])
         self._add_discovered_entities(
             [HAAlarmPendingEventsSensor(device, self._hass), *ha_device.get_sensors()]
         )
@@ -639,8 +942,7 @@ class Hub:
         LOGGER.debug("Create weather %s", device.device_id)
         ha_device = HaWeather(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_weather_callback is not None:
-            self.add_weather_callback([ha_device])
+        self.add_weather_callback([ha_device])
         self._add_discovered_entities(ha_device.get_sensors())
 
     async def _create_water_device(self, device: TydomWater) -> None:
@@ -671,8 +973,7 @@ class Hub:
         self.ha_devices[device.device_id] = ha_device
         action = ha_device.twc_action
         if action is None:
-            if self.add_scene_callback is not None:
-                self.add_scene_callback([ha_device])
+            self.add_scene_callback([ha_device])
             return
 
         zone_key = ha_device._get_zone_from_scene()
@@ -693,8 +994,7 @@ class Hub:
             )
             self._twc_cover_entities[grouping_key] = cover
             self.ha_devices[f"twc_cover_{grouping_key}"] = cover
-            if self.add_cover_callback is not None:
-                self.add_cover_callback([cover])
+            self.add_cover_callback([cover])
             LOGGER.debug(
                 "Created Tywell shutter cover %s from scenario %s",
                 grouping_key,
@@ -732,8 +1032,7 @@ class Hub:
         LOGGER.debug("Create moment %s", device.device_id)
         ha_device = HAMoment(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_switch_callback is not None:
-            self.add_switch_callback([ha_device])
+        self.add_switch_callback([ha_device])
 
     async def _create_remote_control_device(self, device: TydomRemoteControl) -> None:
         """Create an event entity for a remote button and one battery diagnostic."""
@@ -745,15 +1044,13 @@ class Hub:
         )
         ha_device = HARemoteEvent(device, self._hass)
         self.ha_devices[device.device_id] = ha_device
-        if self.add_event_callback is not None:
-            self.add_event_callback([ha_device])
+        self.add_event_callback([ha_device])
 
         battery = self._remote_battery_entities.get(device.physical_device_id)
         if battery is None:
             battery = HARemoteBattery(device, self._hass)
             self._remote_battery_entities[device.physical_device_id] = battery
-            if self.add_binary_sensor_callback is not None:
-                self.add_binary_sensor_callback([battery])
+            self.add_binary_sensor_callback([battery])
         else:
             battery.add_device(device)
 
@@ -800,20 +1097,25 @@ class Hub:
                     device.device_id,
                 )
                 switch_device = HASwitch(device, self._hass)
-                if self.add_switch_callback is not None:
-                    self.add_switch_callback([switch_device])
+                self.add_switch_callback([switch_device])
 
     async def update_ha_device(self, stored_device, device):
         """Update HA device values."""
         try:
-            await stored_device.update_device(device)
+            changes = await stored_device.update_device(device)
+            if not changes:
+                # Nothing changed: no state to write, no new sensor to create.
+                return
             ha_device = self.ha_devices[device.device_id]
 
-            # Special handling for scenes: invalidate caches and recreate relations
+            # Scenarios: relate their devices again when their actions changed
             if isinstance(device, TydomScene) and isinstance(ha_device, HAScene):
+                if not changes.isdisjoint(("grpAct", "epAct")):
+                    await self._relate_scenes((device.device_id,))
                 await ha_device.async_device_update(device)
 
-            new_sensors = ha_device.get_sensors()
+            # A new sensor can only come from an attribute the update reported.
+            new_sensors = ha_device.get_sensors(changes)
             if new_sensors:
                 # add new sensors
                 LOGGER.debug(
@@ -840,15 +1142,24 @@ class Hub:
 
     async def ping(self) -> None:
         """Periodically send pings."""
+        self._tydom_client.set_send_priority(SendPriority.BOOTSTRAP)
         while not self._shutting_down:
             await self._tydom_client.ping()
             await self._interruptible_sleep(30)
 
+    async def probe_paths(self) -> None:
+        """Periodically measure the standby connection path (cloud failover)."""
+        self._tydom_client.set_send_priority(SendPriority.BACKGROUND)
+        while not self._shutting_down:
+            await self._interruptible_sleep(_PATH_PROBE_INTERVAL)
+            await self._tydom_client.probe_standby_paths()
+
     async def refresh_all(self) -> None:
         """Periodically refresh all metadata and data.
 
         It allows new devices to be discovered.
         """
+        self._tydom_client.set_send_priority(SendPriority.BACKGROUND)
         while not self._shutting_down:
             await self._tydom_client.get_info()
             await self._tydom_client.put_api_mode()
@@ -864,6 +1175,9 @@ class Hub:
 
     async def refresh_data_1s(self) -> None:
         """Refresh data for devices in list."""
+        # These polls follow user commands (moving covers), so they keep the
+        # command priority instead of queueing behind the periodic refreshes.
+        self._tydom_client.set_send_priority(SendPriority.INTERACTIVE)
         while not self._shutting_down:
             await self._tydom_client.poll_devices_data_1s()
             await self._interruptible_sleep(1)
@@ -909,6 +1223,7 @@ class Hub:
         The polling groups are rebuilt every 5 minutes to account for
         metadata changes.
         """
+        self._tydom_client.set_send_priority(SendPriority.BACKGROUND)
         while not self._shutting_down:
             current_time = time.monotonic()
 
@@ -986,6 +1301,7 @@ class Hub:
         integration options. The per-device Refresh button remains available
         for an immediate reading between scheduled polls.
         """
+        self._tydom_client.set_send_priority(SendPriority.BACKGROUND)
         while not self._shutting_down:
             try:
                 await self._tydom_client.poll_devices_data_5m()
@@ -1003,10 +1319,16 @@ class Hub:
         # Vider les dictionnaires d'appareils
         self.devices.clear()
         self.ha_devices.clear()
+        self._device_aliases.clear()
+        self._group_members.clear()
+        self._groups_by_member.clear()
+        self.scene_relations.clear()
+        self._related_groups = {}
         self._remote_battery_entities.clear()
         self._interrupter_battery_entities.clear()
         self._twc_scene_sets.clear()
         self._twc_cover_entities.clear()
+        self._entities_by_unique_id.clear()
         # Réinitialiser le flag pour recréer le bouton après le rechargement
         self._reload_button_created = False
         self._refresh_energy_buttons_created.clear()
@@ -1046,10 +1368,9 @@ class Hub:
         # Recréer le bouton de rechargement après le rechargement
         # (le bouton d'actualisation énergie est recréé par _create_energy_device
         # quand le device Tywatt est redécouvert)
-        if self.add_button_callback is not None:
-            reload_button = HAReloadButton(self, self._hass)
-            self.add_button_callback([reload_button])
-            LOGGER.debug("Bouton de rechargement recréé après le rechargement")
+        reload_button = HAReloadButton(self, self._hass)
+        self.add_button_callback([reload_button])
+        LOGGER.debug("Bouton de rechargement recréé après le rechargement")
 
         LOGGER.info(
             "Rechargement terminé, les nouveaux appareils seront découverts automatiquement"
@@ -1068,23 +1389,10 @@ class Hub:
         for device_id, device in self.devices.items():
             if isinstance(device, TydomGroup):
                 for group_device_id in device.device_ids:
-                    if group_device_id not in self.devices:
-                        # Try to find by various ID formats
-                        found = False
-                        for _id, _device in self.devices.items():
-                            if (
-                                _id == group_device_id
-                                or str(getattr(_device, "device_id", ""))
-                                == group_device_id
-                                or str(getattr(_device, "_id", "")) == group_device_id
-                            ):
-                                found = True
-                                break
-
-                        if not found:
-                            issues.append(
-                                f"Group {device.device_name} ({device_id}) references non-existent device: {group_device_id}"
-                            )
+                    if self.resolve_device_id(group_device_id) is None:
+                        issues.append(
+                            f"Group {device.device_name} ({device_id}) references non-existent device: {group_device_id}"
+                        )
 
         # Check scenarios: verify that grpAct and epAct reference valid devices/groups
         for device_id, device in self.devices.items():
@@ -1092,8 +1400,7 @@ class Hub:
                 # Check grpAct
                 grp_act = getattr(device, "grpAct", None)
                 if grp_act and isinstance(grp_act, list):
-                    from .tydom.MessageHandler import groups_data
-
+                    groups_data = self.catalog.groups
                     for grp_action in grp_act:
                         if isinstance(grp_action, dict):
                             grp_id = grp_action.get("id")
@@ -1115,18 +1422,7 @@ class Hub:
                             if ep_id:
                                 ep_id_str = str(ep_id)
                                 # Check if device/endpoint exists
-                                device_found = False
-                                for _id, _device in self.devices.items():
-                                    if (
-                                        _id == ep_id_str
-                                        or str(getattr(_device, "device_id", ""))
-                                        == ep_id_str
-                                        or str(getattr(_device, "_id", "")) == ep_id_str
-                                    ):
-                                        device_found = True
-                                        break
-
-                                if not device_found:
+                                if self.resolve_device_id(ep_id_str) is None:
                                     issues.append(
                                         f"Scene {device.device_name} ({device_id}) references non-existent device/endpoint: {ep_id_str}"
                                     )
@@ -7,12 +7,11 @@ import re
 import time
 from dataclasses import dataclass
 from functools import partial
-from http.client import HTTPMessage, LineTooLong
-from http.client import HTTPResponse as CoreHTTPResponse
-from io import BytesIO
-from typing import TYPE_CHECKING, Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from ..const import LOGGER
+from .catalog import DeviceCatalog, EndpointRecord
+from .codec import encode_request, parse_request, parse_response
 from .tydom_devices import (
     Tydom,
     TydomAlarm,
@@ -57,8 +56,30 @@ if TYPE_CHECKING:
 
     from .tydom_client import TydomClient
 
-_MAX_REPLIES_SIZE = 5
-"""Maximal number of replies to keep track of."""
+_DEFAULT_MAX_IN_FLIGHT = 16
+"""Default number of request/reply transactions sharing the websocket."""
+
+_UPDATE_SUMMARY_INTERVAL = 300.0
+"""Minimal number of seconds between two INFO summaries of device updates."""
+
+_SNAPSHOT_URIS = (
+    "/configs/file",
+    "/devices/meta",
+    "/info",
+    "/groups/file",
+    "/scenarios/file",
+    "/moments/file",
+)
+"""Catalogue replies kept in warm-start snapshots, in replay order."""
+
+_BOOTSTRAP_URIS = (*_SNAPSHOT_URIS, "/devices/cmeta", "/devices/data")
+"""Replies whose arrival time is recorded in ``bootstrap_timings``."""
+
+_CONFIGS_FILE_TIMEOUT = 30.0
+"""Seconds data of unknown endpoints is held while /configs/file is awaited."""
+
+_SNAPSHOT_TRANSACTION_ID = "snapshot"
+"""Transaction ID given to replayed snapshot data (never marked as pushed)."""
 
 _HISTO_END_INDEX = 255
 """Index value (0xFF) of the sentinel element closing an histo reply stream.
@@ -122,30 +143,41 @@ def _parse_energy_cdata_element(element: Any) -> dict[str, int | float]:
     return {}
 
 
+def _endpoint_fingerprint(endpoint: dict) -> str | None:
+    """Describe the error, area link and data elements of a /devices/data endpoint.
+
+    The description is a repr rather than a hash: values sharing a hash, such
+    as -1 and -2 or 1 and True, must not be taken for one another. Return None
+    when a data element has no name.
+    """
+    try:
+        return repr(
+            (
+                endpoint.get("error", 0),
+                endpoint.get("link"),
+                [
+                    (element["name"], element.get("value"), element.get("validity"))
+                    for element in endpoint.get("data", ())
+                ],
+            )
+        )
+    except (KeyError, TypeError):
+        return None
+
+
 _EMPTY_CDATA_EOR_GRACE = 0.1
 """Seconds to wait for TYXAL data sent just after an early empty EOR."""
 
 
-def _is_tyxia_4910_other(uid: str) -> bool:
+def _is_tyxia_4910_other(catalog: DeviceCatalog, uid: str) -> bool:
     """Identify a binary TYXIA 4910 configured under the TYDOM 'others' usage."""
-    if str(device_tutorial_id.get(uid, "")).lower() != "9_tyxia_modulaire_serie4900":
+    if str(catalog.tutorial_id(uid) or "").lower() != "9_tyxia_modulaire_serie4900":
         return False
-    return is_binary_tyxia_receiver_profile(device_metadata.get(uid))
-
-
-# Device dict for parsing
-device_name = {}
-device_endpoint = {}
-device_type = {}
-device_metadata = {}
-device_tutorial_id = {}
-interrupter_endpoint_config = {}
-interrupter_info = {}
-scenario_metadata = {}  # Store scenario metadata from /configs/file
-groups_metadata = {}  # Store group metadata from /configs/file: {group_id: {"usage": "light", "name": "TOTAL"}}
-groups_data = {}  # Store groups data: {group_id: {"devices": [device_ids], "name": group_name}}
-endpoint_config = {}  # Store endpoint-specific configuration from /configs/file
-remote_control_info = {}  # Store physical remote and button details by endpoint UID
+    return is_binary_tyxia_receiver_profile(catalog.metadata(uid))
+
+
+_TYWELL_CONTROL_USAGES = ("re2020ControlBoiler", "re2020ControlPassive")
+"""Usages of the endpoints a Tywell wall controller may be advertised with."""
 
 SUPPORTED_CONTROL_GROUP_USAGES = {"awning", "light", "plug", "shutter"}
 TOTAL_GROUP_NAMES = {
@@ -164,23 +196,30 @@ def _remote_control_model(tutorial_id: str) -> str:
     )
 
 
-def _infer_separately_paired_tyxia_2600() -> None:
-    """Identify the two endpoint records of a separately paired TYXIA 2600."""
-    configs_by_device: dict[str, list[tuple[str, dict]]] = {}
-    for unique_id, config in endpoint_config.items():
-        if config.get("usage") == "interrupter":
-            configs_by_device.setdefault(str(config["device_id"]), []).append(
-                (unique_id, config)
+def _endpoints_by_device(
+    catalog: DeviceCatalog, usage: str
+) -> dict[str, list[tuple[str, EndpointRecord]]]:
+    """Group the endpoints with a usage by physical device."""
+    records_by_device: dict[str, list[tuple[str, EndpointRecord]]] = {}
+    for unique_id in catalog.by_usage(usage):
+        record = catalog.get(unique_id)
+        if record is not None and record.parent is None:
+            records_by_device.setdefault(record.device_id, []).append(
+                (unique_id, record)
             )
+    return records_by_device
 
-    for endpoint_items in configs_by_device.values():
+
+def _infer_separately_paired_tyxia_2600(catalog: DeviceCatalog) -> None:
+    """Identify the two endpoint records of a separately paired TYXIA 2600."""
+    for endpoint_items in _endpoints_by_device(catalog, "interrupter").values():
         if len(endpoint_items) != 2:
             continue
-        configs = [config for _, config in endpoint_items]
-        if any(config.get("tutorial_id") for config in configs):
+        records = [record for _, record in endpoint_items]
+        if any(record.tutorial_id for record in records):
             continue
 
-        names = [str(config.get("name", "")) for config in configs]
+        names = [record.config_name for record in records]
         has_numbered_switch = any(
             re.fullmatch(r"Interrupteur\s+\d+", name, flags=re.IGNORECASE)
             for name in names
@@ -192,46 +231,50 @@ def _infer_separately_paired_tyxia_2600() -> None:
         if not (has_numbered_switch and has_common_button):
             continue
 
-        for unique_id, config in endpoint_items:
-            config["tutorial_id"] = "switch_tyxia2600"
-            device_tutorial_id[unique_id] = "switch_tyxia2600"
+        for unique_id, _record in endpoint_items:
+            catalog.set_tutorial_id(unique_id, "switch_tyxia2600")
 
 
-def _refresh_remote_control_info() -> None:
-    """Combine endpoint configuration with related-endpoint group metadata."""
-    remote_control_info.clear()
+def _physical_device_group(
+    catalog: DeviceCatalog, physical_device_id: str, usage: str
+) -> tuple[str, dict, dict] | None:
+    """Find the group of a physical device: ID, group and its metadata."""
+    for candidate_id in catalog.groups_of(physical_device_id):
+        if catalog.group_usage(candidate_id) == usage:
+            return (
+                candidate_id,
+                catalog.groups[candidate_id],
+                catalog.group_metadata.get(candidate_id, {}),
+            )
+    return None
+
 
-    for unique_id, config in endpoint_config.items():
-        if config.get("usage") != "remoteControl":
+def _refresh_remote_control_info(catalog: DeviceCatalog) -> None:
+    """Combine endpoint configuration with related-endpoint group metadata."""
+    for unique_id in catalog.by_usage("remoteControl"):
+        record = catalog.get(unique_id)
+        if record is None or record.parent is not None:
             continue
 
-        physical_device_id = str(config["device_id"])
+        physical_device_id = record.device_id
         group_id = None
         group_name = f"Remote control {physical_device_id}"
         group_tutorial_id = ""
 
-        for candidate_id, group in groups_data.items():
-            group_metadata = groups_metadata.get(candidate_id, {})
-            group_usage = group.get("usage") or group_metadata.get("usage")
-            if group_usage != "remoteControl":
-                continue
-            if physical_device_id in group.get("devices", []):
-                group_id = candidate_id
-                group_name = (
-                    group_metadata.get("name") or group.get("name") or group_name
-                )
-                group_tutorial_id = str(group_metadata.get("tutorial_id", ""))
-                break
+        found = _physical_device_group(catalog, physical_device_id, "remoteControl")
+        if found is not None:
+            group_id, group, group_metadata = found
+            group_name = group_metadata.get("name") or group.get("name") or group_name
+            group_tutorial_id = str(group_metadata.get("tutorial_id", ""))
 
-        endpoint_tutorial_id = str(config.get("tutorial_id", ""))
-        tutorial_id = group_tutorial_id or endpoint_tutorial_id
-        remote_control_info[unique_id] = {
+        tutorial_id = group_tutorial_id or record.tutorial_id
+        record.remote_control = {
             "physical_device_id": physical_device_id,
             "group_id": group_id,
             "name": group_name,
             "model": _remote_control_model(tutorial_id),
-            "button_number": config.get("button_number"),
-            "configured_action": config.get("configured_action", "TOGGLE"),
+            "button_number": record.button_number,
+            "configured_action": record.configured_action,
         }
 
 
@@ -253,7 +296,7 @@ _AREA_CONTROL_ATTRIBUTES = {
 
 
 def _is_physical_tywell_control_endpoint(
-    uid: str, metadata: dict | None, data: dict | None
+    catalog: DeviceCatalog, uid: str, metadata: dict | None, data: dict | None
 ) -> bool:
     """Return whether an unlinked endpoint exposes physical Tywell controls.
 
@@ -264,8 +307,8 @@ def _is_physical_tywell_control_endpoint(
     proxies must not create misleading climate entities.
     """
     return is_physical_tywell_control_profile(
-        device_tutorial_id.get(uid),
-        device_type.get(uid),
+        catalog.tutorial_id(uid),
+        catalog.usage(uid),
         metadata,
         data,
     )
@@ -276,7 +319,9 @@ def _area_metadata_score(metadata: dict) -> int:
     return sum(attribute in metadata for attribute in _AREA_CONTROL_ATTRIBUTES)
 
 
-def _area_control_metadata(parsed: list[dict]) -> dict[str, dict]:
+def _area_control_metadata(
+    catalog: DeviceCatalog, parsed: list[dict]
+) -> dict[str, dict]:
     """Return the strongest writable HVAC metadata found for each area."""
     controls: dict[str, tuple[int, dict]] = {}
     for raw_device in parsed:
@@ -294,7 +339,7 @@ def _area_control_metadata(parsed: list[dict]) -> dict[str, dict]:
                 continue
 
             uid = f"{endpoint_id}_{device_id}"
-            metadata = device_metadata.get(uid, {})
+            metadata = catalog.metadata(uid) or {}
             score = _area_metadata_score(metadata)
             area_id = str(link["id"])
             if score > controls.get(area_id, (-1, {}))[0]:
@@ -314,6 +359,22 @@ class Reply(TypedDict):
     """Whether all reply events have been received or not."""
 
 
+class ReplyError(Exception):
+    """The gateway rejected a tracked request."""
+
+
+@dataclass
+class PendingReply:
+    """In-flight request waiting for its reply."""
+
+    reply: Reply
+    """Reply events collected so far."""
+    future: asyncio.Future
+    """Future resolved with the complete reply."""
+    deadline: float
+    """Event loop time after which the request is abandoned."""
+
+
 def _interrupter_model(tutorial_id: str) -> str:
     """Return a friendly wall-switch model from its tutorial identifier."""
     if tutorial_id.startswith("switch_tyxia2600"):
@@ -321,12 +382,11 @@ def _interrupter_model(tutorial_id: str) -> str:
     return "Delta Dore wall switch"
 
 
-def _is_ungrouped_tyxia_2600(endpoint_configs: list[dict]) -> bool:
+def _is_ungrouped_tyxia_2600(names: list[str]) -> bool:
     """Recognise a TYXIA 2600 whose two outputs were paired separately."""
-    if len(endpoint_configs) != 2:
+    if len(names) != 2:
         return False
 
-    names = [str(config.get("name", "")) for config in endpoint_configs]
     return any(
         re.fullmatch(r"Interrupteur\s+\d+", name, flags=re.IGNORECASE) for name in names
     ) and any(
@@ -335,154 +395,214 @@ def _is_ungrouped_tyxia_2600(endpoint_configs: list[dict]) -> bool:
     )
 
 
-def _refresh_interrupter_info() -> None:
+def _refresh_interrupter_info(catalog: DeviceCatalog) -> None:
     """Combine button endpoint configuration with its physical device group."""
-    interrupter_info.clear()
-
-    configs_by_device: dict[str, list[tuple[str, dict]]] = {}
-    for unique_id, config in interrupter_endpoint_config.items():
-        configs_by_device.setdefault(str(config["device_id"]), []).append(
-            (unique_id, config)
-        )
-
-    for physical_device_id, endpoint_items in configs_by_device.items():
-        endpoint_configs = [config for _, config in endpoint_items]
+    for physical_device_id, endpoint_items in _endpoints_by_device(
+        catalog, "interrupter"
+    ).items():
+        records = [record for _, record in endpoint_items]
         group_id = None
         friendly_names = [
-            str(config.get("name", ""))
-            for config in endpoint_configs
-            if config.get("name")
+            record.config_name
+            for record in records
+            if record.config_name
             and not re.fullmatch(
                 r"CG_DD_COMMON_BUTTON[A-Z0-9]+",
-                str(config["name"]),
+                record.config_name,
                 flags=re.IGNORECASE,
             )
         ]
         group_name = friendly_names[0] if friendly_names else "Wall switch"
         group_tutorial_id = ""
 
-        for candidate_id, group in groups_data.items():
-            group_metadata = groups_metadata.get(candidate_id, {})
-            group_usage = group.get("usage") or group_metadata.get("usage")
-            if group_usage != "interrupter":
-                continue
-            if physical_device_id in group.get("devices", []):
-                group_id = candidate_id
-                group_name = (
-                    group_metadata.get("name") or group.get("name") or group_name
-                )
-                group_tutorial_id = str(group_metadata.get("tutorial_id", ""))
-                break
+        found = _physical_device_group(catalog, physical_device_id, "interrupter")
+        if found is not None:
+            group_id, group, group_metadata = found
+            group_name = group_metadata.get("name") or group.get("name") or group_name
+            group_tutorial_id = str(group_metadata.get("tutorial_id", ""))
 
-        if not group_tutorial_id and _is_ungrouped_tyxia_2600(endpoint_configs):
+        if not group_tutorial_id and _is_ungrouped_tyxia_2600(
+            [record.config_name for record in records]
+        ):
             group_tutorial_id = "switch_tyxia2600"
 
         assigned_buttons = {
-            str(config["button"])
-            for config in endpoint_configs
-            if config.get("button") in {"A", "B"}
+            str(record.button) for record in records if record.button in {"A", "B"}
         }
         missing_buttons = {"A", "B"} - assigned_buttons
-        missing_configs = [
-            config for config in endpoint_configs if config.get("button") is None
-        ]
+        missing_records = [record for record in records if record.button is None]
         if (
-            len(endpoint_configs) == 2
-            and len(missing_configs) == 1
+            len(records) == 2
+            and len(missing_records) == 1
             and len(missing_buttons) == 1
         ):
-            missing_configs[0]["button"] = missing_buttons.pop()
+            missing_records[0].button = missing_buttons.pop()
 
-        for unique_id, config in endpoint_items:
-            endpoint_tutorial_id = str(config.get("tutorial_id", ""))
-            button = config.get("button")
+        for _unique_id, record in endpoint_items:
+            button = record.button
             if button is not None:
-                device_name[unique_id] = f"Button {button}"
-            interrupter_info[unique_id] = {
+                record.name = f"Button {button}"
+            record.interrupter = {
                 "physical_device_id": physical_device_id,
                 "group_id": group_id,
                 "name": group_name,
-                "model": _interrupter_model(group_tutorial_id or endpoint_tutorial_id),
+                "model": _interrupter_model(group_tutorial_id or record.tutorial_id),
                 "button": button,
-                "configured_action": config.get("configured_action", "TOGGLE"),
+                "configured_action": record.configured_action,
             }
 
 
 class MessageHandler:
     """Handle incoming Tydom messages."""
 
-    def __init__(self, tydom_client: "TydomClient", cmd_prefix: bytes) -> None:
-        """Initialize MessageHandler."""
+    def __init__(
+        self,
+        tydom_client: "TydomClient",
+        cmd_prefix: bytes,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Initialize MessageHandler.
+
+        Args:
+            tydom_client: Owning client
+            cmd_prefix: Prefix of websocket frames (remote mode)
+            max_in_flight: Maximal number of concurrent request/reply
+                transactions (default: 16)
+
+        """
         self.tydom_client = tydom_client
         self.cmd_prefix = cmd_prefix
-        self._cdata_replies: list[Reply] = []
-        self._end_reply_events: dict[str, asyncio.Event] = {}
-        self._reply_errors: dict[str, str] = {}
+        self.catalog = DeviceCatalog()
+        # unique_id -> (device, metadata it was built with)
+        self._endpoint_devices: dict[str, tuple[TydomDevice, dict | None]] = {}
+        # unique_id -> fingerprint of the last /devices/data endpoint applied
+        self._endpoint_fingerprints: dict[str, str] = {}
+        # /devices/data endpoints skipped as unchanged, and endpoints parsed
+        self.endpoint_data_stats = {"unchanged": 0, "changed": 0}
+        self._pending_replies: dict[str, PendingReply] = {}
+        self._deadline_timer: asyncio.TimerHandle | None = None
+        self._last_transaction_id = 0
+        self.in_flight_window = asyncio.Semaphore(
+            max_in_flight or _DEFAULT_MAX_IN_FLIGHT
+        )
+        self.pushed_endpoints: set[str] = set()
+        # Unique IDs of the endpoints the configuration no longer lists
+        self.removed_endpoints: list[str] = []
+        self._events_refresh_task: asyncio.Task | None = None
+        self._summary_updates = 0
+        self._summary_started = time.monotonic()
         self._area_devices: dict[str, dict[str, AreaDeviceReference]] = {}
         self._area_data: dict[str, dict[str, Any]] = {}
         self._area_metadata: dict[str, dict] = {}
+        self._snapshot_replies: dict[str, Any] = {}
+        self._bootstrap_started: float | None = None
+        self.bootstrap_timings: dict[str, float] = {}
+        self._configs_file_requested: float | None = None
+        # (transaction ID, device entry) of endpoints waiting for /configs/file
+        self._held_endpoints: list[tuple[str | None, dict]] = []
+        # unique_id -> (device_id, endpoint_id, {data name: data element},
+        # {"error": ..., "link": ...} of the last reply)
+        self._snapshot_endpoints: dict[
+            str, tuple[Any, Any, dict[str, dict], dict[str, Any]]
+        ] = {}
+
+    def next_transaction_id(self) -> str:
+        """
+        Allocate a unique transaction ID.
+
+        IDs keep the gateway's millisecond timestamp format but never repeat,
+        even when several requests are built within the same millisecond.
 
-    def get_reply(self, transaction_id: str) -> Reply | None:
         """
-        Get the reply to a request.
+        transaction_id = max(time.time_ns() // 1_000_000, self._last_transaction_id + 1)
+        self._last_transaction_id = transaction_id
+        return str(transaction_id)
 
-        If the reply is incomplete, this will return None.
+    def register_reply(self, transaction_id: str, timeout: float) -> asyncio.Future:
+        """
+        Track a request and return the future resolved by its reply.
 
         Args:
             transaction_id: The transaction ID of the request.
+            timeout: Seconds before the request is abandoned with TimeoutError.
 
         Returns:
-            The reply or None if no reply found.
+            Future resolved with the complete Reply.
 
         """
-        reply = None
-
-        for r in self._cdata_replies:
-            if r["transaction_id"] == transaction_id:
-                reply = r
-                break
+        loop = asyncio.get_running_loop()
+        pending = PendingReply(
+            reply=Reply(transaction_id=transaction_id, events=[], done=False),
+            future=loop.create_future(),
+            deadline=loop.time() + timeout,
+        )
+        self._pending_replies[transaction_id] = pending
+        self._schedule_deadline_sweep()
+        return pending.future
+
+    def _schedule_deadline_sweep(self) -> None:
+        """Arm the single timer on the earliest pending deadline."""
+        if not self._pending_replies:
+            if self._deadline_timer is not None:
+                self._deadline_timer.cancel()
+                self._deadline_timer = None
+            return
+        deadline = min(p.deadline for p in self._pending_replies.values())
+        if self._deadline_timer is not None:
+            if self._deadline_timer.when() <= deadline:
+                return
+            self._deadline_timer.cancel()
+        self._deadline_timer = asyncio.get_running_loop().call_at(
+            deadline, self._sweep_deadlines
+        )
 
-        if reply is not None:
-            if reply["done"]:
-                self._cdata_replies.remove(reply)
-            else:
+    def _sweep_deadlines(self) -> None:
+        """Abandon every request whose deadline has passed."""
+        self._deadline_timer = None
+        now = asyncio.get_running_loop().time()
+        for transaction_id, pending in list(self._pending_replies.items()):
+            if pending.deadline <= now:
+                del self._pending_replies[transaction_id]
                 LOGGER.debug(
-                    "Try to get partial reply to request %s: %s",
+                    "Forget uncomplete request with transaction ID '%s'.",
                     transaction_id,
-                    reply["events"],
                 )
-                reply = None
-
-        return reply
+                if not pending.future.done():
+                    pending.future.set_exception(TimeoutError())
+        self._schedule_deadline_sweep()
+
+    def _resolve_reply(self, transaction_id: str) -> None:
+        """Complete a pending request with the events collected so far."""
+        if (pending := self._pending_replies.pop(transaction_id, None)) is None:
+            return
+        pending.reply["done"] = True
+        if not pending.future.done():
+            pending.future.set_result(pending.reply)
+
+    def _fail_reply(self, transaction_id: str, error: str) -> None:
+        """Complete a pending request with a protocol error."""
+        if (pending := self._pending_replies.pop(transaction_id, None)) is None:
+            return
+        if not pending.future.done():
+            pending.future.set_exception(ReplyError(error))
 
     def remove_reply(self, transaction_id: str) -> None:
         """
         Remove a pending reply to prevent memory leaks.
 
-        This should be called when a request times out or fails.
+        This should be called when a request fails or is cancelled.
 
         Args:
             transaction_id: The transaction ID of the request to remove.
 
         """
-        # Remove from cdata_replies
-        for reply in self._cdata_replies[:]:
-            if reply["transaction_id"] == transaction_id:
-                self._cdata_replies.remove(reply)
-                break
-
-        # Remove from end_reply_events
-        self._end_reply_events.pop(transaction_id, None)
+        if (pending := self._pending_replies.pop(transaction_id, None)) is not None:
+            pending.future.cancel()
         LOGGER.debug("Removed pending reply for transaction_id: %s", transaction_id)
 
-    def get_reply_error(self, transaction_id: str) -> str | None:
-        """Return and forget a protocol error for one pending request."""
-        return self._reply_errors.pop(transaction_id, None)
-
     def _complete_empty_cdata_reply(self, transaction_id: str) -> None:
         """Complete an EOR-only reply unless late TYXAL data completed it first."""
-        if event := self._end_reply_events.pop(transaction_id, None):
-            event.set()
+        self._resolve_reply(transaction_id)
 
     async def route_response(self, bytes_str: bytes) -> list["TydomDevice"] | None:
         """
@@ -501,7 +621,7 @@ class MessageHandler:
         try:
             status = None
             if stripped_msg.startswith(b"HTTP/"):
-                parsed_message = _parse_response(stripped_msg)
+                parsed_message = parse_response(stripped_msg)
                 # Find Uri-Origin in header if available
                 uri_origin = parsed_message.headers.get("Uri-Origin", "")
                 status = parsed_message.status
@@ -523,17 +643,14 @@ class MessageHandler:
                     status,
                     (parsed_message.body or b"")[:500],
                 )
-                if transaction_id and transaction_id in self._end_reply_events:
+                if transaction_id and transaction_id in self._pending_replies:
                     detail = (parsed_message.body or b"").decode(
                         "utf-8", errors="replace"
                     )
-                    self._reply_errors[transaction_id] = (
-                        f"HTTP {status}: {re.sub(r'<[^>]+>', ' ', detail).strip()}"
+                    self._fail_reply(
+                        transaction_id,
+                        f"HTTP {status}: {re.sub(r'<[^>]+>', ' ', detail).strip()}",
                     )
-                    event = self._end_reply_events.get(transaction_id)
-                    self.remove_reply(transaction_id)
-                    if event is not None:
-                        event.set()
                 return None
 
             if status is not None and not parsed_message.body:
@@ -551,15 +668,22 @@ class MessageHandler:
                     transaction_id,
                     uri_origin,
                 )
+                if transaction_id:
+                    self._resolve_reply(transaction_id)
                 return None
 
             try:
-                return await self.parse_response(
+                devices = await self.parse_response(
                     parsed_message.body,
                     uri_origin,
                     parsed_message.headers.get("content-type"),
                     transaction_id=transaction_id if transaction_id else None,
                 )
+                # cdata replies may be streamed and complete themselves on
+                # EOR; any other successful response acknowledges its request.
+                if status is not None and transaction_id and "/cdata" not in uri_origin:
+                    self._resolve_reply(transaction_id)
+                return devices
             except BaseException as e:
                 LOGGER.error(
                     "Error when parsing tydom message (%s)", bytes_str, exc_info=e
@@ -582,7 +706,6 @@ class MessageHandler:
         url: str,
         body: dict | bytes | None = None,
         headers: dict | None = None,
-        reply_event: asyncio.Event | None = None,
     ) -> tuple[str, bytes]:
         """
         Create request bytes message.
@@ -594,39 +717,26 @@ class MessageHandler:
             url: HTTP target URL
             body: [optional] Request body
             headers: [optional] Request headers
-            reply_event: [optional] Event to wait for the reply completion
 
         Returns:
             Tuple (request transaction ID, request bytes message)
 
         """
         headers = headers or {}
-        # Transaction ID is the current time in ms
-        transaction_id = headers.get("Transac-Id", str(time.time_ns())[:13])
-        headers["Transac-Id"] = transaction_id
-        if body:
-            if isinstance(body, dict):
-                body = json.dumps(body).encode("ascii")
-                headers["Content-Type"] = "application/json; charset=UTF-8"
-            content_length = headers.get("Content-Length", str(len(body)))
-            headers["Content-Length"] = content_length
-
-        request = bytes(f"{method} {url} HTTP/1.1\r\n", "ascii")
-        if len(headers):
-            for k, v in headers.items():
-                request += bytes(f"{k}: {v}\r\n", "ascii")
-
-        if body:
-            request += b"\r\n"
-            request += cast(bytes, body) + b"\r\n"
-
-        request += b"\r\n"
-
-        if reply_event:
-            self._end_reply_events[transaction_id] = reply_event
+        transaction_id = headers.get("Transac-Id") or self.next_transaction_id()
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("ascii")
+        request = encode_request(method, url, transaction_id, body, headers)
 
         return (transaction_id, request)
 
+    async def _refresh_after_event(self) -> None:
+        """Request all devices data after a gateway event."""
+        try:
+            await self.tydom_client.get_devices_data()
+        except Exception:
+            LOGGER.exception("Unable to refresh devices data after an event")
+
     async def parse_response(
         self,
         data: bytes | None,
@@ -653,14 +763,19 @@ class MessageHandler:
 
         async def event_message(*args):
             LOGGER.debug("Event message, refreshing...")
-            await self.tydom_client.get_devices_data()
+            # Sending may wait for the request budget: never hold up the
+            # reader, and merge events arriving before the refresh is sent.
+            if self._events_refresh_task is None or self._events_refresh_task.done():
+                self._events_refresh_task = asyncio.create_task(
+                    self._refresh_after_event()
+                )
 
         async def ping_message(*args):
             self.tydom_client.receive_pong()
 
         MSG_MAPPING = {
             "/areas/data": self.parse_areas_data,
-            "/configs/file": MessageHandler.parse_config_data,
+            "/configs/file": self.parse_config_data,
             "/configs/gateway/api_mode": partial(no_op, "msg_api_mode"),
             "/devices/cdata": self.parse_devices_cdata,
             "/devices/cmeta": self.parse_cmeta_data,
@@ -691,6 +806,18 @@ class MessageHandler:
             elif content_type == "text/html":
                 msg_type = partial(no_op, "msg_html")
 
+        if transaction_id is not None:
+            if uri_origin in _SNAPSHOT_URIS and not isinstance(parsed, bytes):
+                self._snapshot_replies[uri_origin] = parsed
+            if (
+                self._bootstrap_started is not None
+                and uri_origin in _BOOTSTRAP_URIS
+                and uri_origin not in self.bootstrap_timings
+            ):
+                self.bootstrap_timings[uri_origin] = round(
+                    time.monotonic() - self._bootstrap_started, 3
+                )
+
         if msg_type is None:
             mapping_key = "/events" if uri_origin.startswith("/events/") else uri_origin
             msg_type = MSG_MAPPING.get(mapping_key)
@@ -737,30 +864,40 @@ class MessageHandler:
             LOGGER.warning("Unknown message type received %s: %s", uri_origin, data)
         else:
             LOGGER.debug("Message received from %s", uri_origin)
+            devices = None
             try:
-                return await msg_type(parsed, transaction_id)
+                devices = await msg_type(parsed, transaction_id)
             except Exception as e:
                 LOGGER.error("Error on parsing tydom response (%s)", data, exc_info=e)
+            finally:
+                # Held data is replayed even if the catalogue could not be read
+                if uri_origin == "/configs/file" and transaction_id is not None:
+                    devices = (devices or []) + await self._release_held_endpoints()
+            return devices
         LOGGER.debug("Incoming data parsed with success")
 
     async def parse_devices_metadata(self, parsed, transaction_id):
         """Parse metadata."""
         LOGGER.debug("metadata : %s", parsed)
+        self._endpoint_fingerprints.clear()
         for device in parsed:
             id = device["id"]
             for endpoint in device["endpoints"]:
                 id_endpoint = endpoint["id"]
                 device_unique_id = str(id_endpoint) + "_" + str(id)
-                device_metadata[device_unique_id] = {}
-                for metadata in endpoint["metadata"]:
-                    metadata_name = metadata["name"]
-                    device_metadata[device_unique_id][metadata_name] = {}
-                    for meta in metadata:
-                        if meta == "name":
-                            continue
-                        device_metadata[device_unique_id][metadata_name][meta] = (
-                            metadata[meta]
-                        )
+                self.catalog.set_endpoint(
+                    device_unique_id,
+                    id,
+                    id_endpoint,
+                    metadata={
+                        metadata["name"]: {
+                            meta: value
+                            for meta, value in metadata.items()
+                            if meta != "name"
+                        }
+                        for metadata in endpoint["metadata"]
+                    },
+                )
         return []
 
     async def parse_msg_info(self, parsed, transaction_id):
@@ -780,15 +917,18 @@ class MessageHandler:
             )
         ]
 
-    @staticmethod
     async def get_device(
-        tydom_client, last_usage, uid, device_id, name, endpoint=None, data=None
+        self, last_usage, uid, device_id, name, endpoint=None, data=None
     ) -> TydomDevice | None:
         """Get device class from its last usage."""
+        tydom_client = self.tydom_client
+        catalog = self.catalog
+        record = catalog.get(uid)
+        metadata = record.metadata if record is not None else None
         model = resolve_device_model(
-            device_tutorial_id.get(uid),
+            catalog.tutorial_id(uid),
             last_usage,
-            device_metadata.get(uid),
+            metadata,
             data,
         )
         if model is not None:
@@ -814,7 +954,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "belmDoor" | "klineDoor":
@@ -825,7 +965,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "garage_door":
@@ -836,7 +976,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "gate":
@@ -847,7 +987,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "light":
@@ -858,7 +998,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "conso":
@@ -869,7 +1009,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "sensorDFR":
@@ -880,13 +1020,14 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "re2020ControlBoiler":
                 if data is None or data.get("area_id") is None:
-                    metadata = device_metadata.get(uid)
-                    if not _is_physical_tywell_control_endpoint(uid, metadata, data):
+                    if not _is_physical_tywell_control_endpoint(
+                        catalog, uid, metadata, data
+                    ):
                         LOGGER.debug(
                             "Ignoring unlinked Tywell thermal endpoint %s (%s)",
                             uid,
@@ -915,7 +1056,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "re2020ControlPassive":
@@ -926,7 +1067,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "interrupter":
@@ -937,9 +1078,9 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
-                    interrupter_info.get(uid),
+                    record.interrupter if record is not None else None,
                 )
             case "boiler" | "sh_hvac" | "electric" | "aeraulic":
                 return TydomBoiler(
@@ -949,7 +1090,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "alarm":
@@ -960,7 +1101,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "weather":
@@ -971,23 +1112,24 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
                 physical_controllers = [
                     controller_uid
-                    for controller_uid, controller_type in device_type.items()
+                    for controller_type in _TYWELL_CONTROL_USAGES
+                    for controller_uid in catalog.by_usage(controller_type)
                     if is_physical_tywell_control_profile(
-                        device_tutorial_id.get(controller_uid),
+                        catalog.tutorial_id(controller_uid),
                         controller_type,
-                        device_metadata.get(controller_uid),
+                        catalog.metadata(controller_uid),
                     )
                 ]
                 if len(physical_controllers) == 1:
                     controller_uid = physical_controllers[0]
                     weather_device.group_with_registry_device(
                         controller_uid,
-                        device_name.get(controller_uid, "Tywell Control"),
+                        catalog.name(controller_uid) or "Tywell Control",
                     )
                 return weather_device
             case "sensorDF":
@@ -998,7 +1140,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "sensorThermo":
@@ -1009,10 +1151,10 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
-            case "others" if _is_tyxia_4910_other(uid):
+            case "others" if _is_tyxia_4910_other(catalog, uid):
                 return TydomSwitch(
                     tydom_client,
                     uid,
@@ -1020,7 +1162,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "sensorSun":
@@ -1031,7 +1173,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "plug":
@@ -1042,7 +1184,7 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
             case "remoteControl":
@@ -1053,9 +1195,9 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
-                    remote_control_info.get(uid),
+                    record.remote_control if record is not None else None,
                 )
             case _:
                 LOGGER.info(
@@ -1071,76 +1213,120 @@ class MessageHandler:
                     name,
                     last_usage,
                     endpoint,
-                    device_metadata.get(uid),
+                    metadata,
                     data,
                 )
 
-    @staticmethod
-    async def parse_config_data(parsed, transaction_id):
+    async def _endpoint_device(
+        self, last_usage, uid, device_id, name, endpoint=None, data=None
+    ) -> TydomDevice | None:
+        """Get the device of an endpoint, with the values of a message applied.
+
+        The device is built, and its model resolved, on the first message of
+        the endpoint and when its usage, name or metadata change. Otherwise
+        the values are set in place, and published when the hub passes the
+        device to its own ``update_device``.
+        """
+        metadata = self.catalog.metadata(uid)
+        known = self._endpoint_devices.get(uid)
+        if known is not None:
+            device, built_with = known
+            if (
+                (built_with is metadata or built_with == metadata)
+                and device.device_type == last_usage
+                and device.device_name == name
+            ):
+                if data:
+                    if "productName" not in data and "productName" not in vars(device):
+                        # The model of some devices is only known from their data.
+                        model = resolve_device_model(
+                            self.catalog.tutorial_id(uid), last_usage, metadata, data
+                        )
+                        if model is not None:
+                            data = {**data, "productName": model}
+                    device.apply_data(data)
+                return device
+
+        device = await self.get_device(last_usage, uid, device_id, name, endpoint, data)
+        if device is not None:
+            # The hub keeps the first device of an endpoint and merges the
+            # rebuilt ones into it: keep applying the values to that one.
+            self._endpoint_devices[uid] = (
+                device if known is None else known[0],
+                metadata,
+            )
+        return device
+
+    async def parse_config_data(self, parsed, transaction_id):
         """Parse config data."""
         LOGGER.debug("parse_config_data : %s", parsed)
+        catalog = self.catalog
+        self._endpoint_fingerprints.clear()
+        listed_unique_ids = []
         for i in parsed["endpoints"]:
             device_unique_id = str(i["id_endpoint"]) + "_" + str(i["id_device"])
+            listed_unique_ids.append(device_unique_id)
 
             LOGGER.debug(
                 "config_data device parsed : %s - %s", device_unique_id, i["name"]
             )
-            device_tutorial_id[device_unique_id] = (i.get("widget_behavior") or {}).get(
-                "tutorial_id", ""
-            )
-
-            device_name[device_unique_id] = i["name"]
-            device_type[device_unique_id] = i["last_usage"] or "unknown"
-            device_endpoint[device_unique_id] = i["id_endpoint"]
+            name = i["name"]
             widget_behavior = i.get("widget_behavior") or {}
             tutorial_id = str(widget_behavior.get("tutorial_id", ""))
             button_match = re.search(
                 r"BUTTON(\d+)", str(i.get("name", ""))
             ) or re.search(r"_btn_(\d+)$", tutorial_id)
-            endpoint_config[device_unique_id] = {
-                "device_id": i["id_device"],
-                "endpoint_id": i["id_endpoint"],
-                "name": i.get("name", ""),
-                "usage": i.get("last_usage") or "unknown",
-                "tutorial_id": tutorial_id,
-                "configured_action": widget_behavior.get("action", "TOGGLE"),
-                "button_number": (
-                    int(button_match.group(1)) if button_match is not None else None
-                ),
-            }
 
             if i.get("last_usage") == "remoteControl" and button_match is not None:
-                device_name[device_unique_id] = f"Button {button_match.group(1)}"
+                name = f"Button {button_match.group(1)}"
 
+            button = None
             if i.get("last_usage") == "interrupter":
-                widget_behavior = i.get("widget_behavior") or {}
-                tutorial_id = str(widget_behavior.get("tutorial_id", ""))
-                button_match = re.search(
+                interrupter_match = re.search(
                     r"BUTTON([A-Z0-9]+)", str(i.get("name", ""))
                 ) or re.search(r"_btn_([a-z0-9]+)$", tutorial_id)
-                button = button_match.group(1).upper() if button_match else None
-                interrupter_endpoint_config[device_unique_id] = {
-                    "device_id": i["id_device"],
-                    "endpoint_id": i["id_endpoint"],
-                    "name": i.get("name", ""),
-                    "tutorial_id": tutorial_id,
-                    "configured_action": widget_behavior.get("action", "TOGGLE"),
-                    "button": button,
-                }
+                button = (
+                    interrupter_match.group(1).upper() if interrupter_match else None
+                )
                 if button is not None:
-                    device_name[device_unique_id] = f"Button {button}"
+                    name = f"Button {button}"
 
             if i["last_usage"] == "alarm":
-                device_name[device_unique_id] = "Tyxal Alarm"
+                name = "Tyxal Alarm"
+
+            catalog.set_endpoint(
+                device_unique_id,
+                i["id_device"],
+                i["id_endpoint"],
+                name=name,
+                config_name=str(i.get("name", "")),
+                usage=i["last_usage"] or "unknown",
+                tutorial_id=tutorial_id,
+                configured_action=widget_behavior.get("action", "TOGGLE"),
+                button_number=(
+                    int(button_match.group(1)) if button_match is not None else None
+                ),
+                button=button,
+                interrupter=None,
+                remote_control=None,
+            )
+
+        for unique_id in catalog.retain(listed_unique_ids):
+            LOGGER.debug("Endpoint removed from the configuration: %s", unique_id)
+            self.removed_endpoints.append(unique_id)
+        removed = [uid for uid in self._endpoint_devices if uid not in catalog]
+        for unique_id in removed:
+            del self._endpoint_devices[unique_id]
 
-        _infer_separately_paired_tyxia_2600()
+        _infer_separately_paired_tyxia_2600(catalog)
 
         # Parse scenarios metadata from /configs/file
         if "scenarios" in parsed and isinstance(parsed["scenarios"], list):
+            catalog.scenarios = {}
             for scenario in parsed["scenarios"]:
                 if isinstance(scenario, dict) and "id" in scenario:
                     scenario_id = scenario["id"]
-                    scenario_metadata[scenario_id] = {
+                    catalog.scenarios[scenario_id] = {
                         "name": scenario.get("name", f"Scenario {scenario_id}"),
                         "type": scenario.get("type", "NORMAL"),
                         "picto": scenario.get("picto", ""),
@@ -1149,16 +1335,17 @@ class MessageHandler:
                     LOGGER.debug(
                         "Stored scenario metadata: id=%s, name=%s",
                         scenario_id,
-                        scenario_metadata[scenario_id]["name"],
+                        catalog.scenarios[scenario_id]["name"],
                     )
 
         # Parse groups metadata from /configs/file
         if "groups" in parsed and isinstance(parsed["groups"], list):
+            catalog.group_metadata = {}
             for group in parsed["groups"]:
                 if isinstance(group, dict) and "id" in group:
                     group_id = group.get("id")
                     group_id_str = str(group_id)
-                    groups_metadata[group_id_str] = {
+                    catalog.group_metadata[group_id_str] = {
                         "usage": group.get("usage", ""),
                         "name": group.get("name", f"Group {group_id}"),
                         "group_all": bool(group.get("group_all", False)),
@@ -1170,12 +1357,12 @@ class MessageHandler:
                     LOGGER.debug(
                         "Stored group metadata: id=%s, usage=%s, name=%s",
                         group_id_str,
-                        groups_metadata[group_id_str]["usage"],
-                        groups_metadata[group_id_str]["name"],
+                        catalog.group_metadata[group_id_str]["usage"],
+                        catalog.group_metadata[group_id_str]["name"],
                     )
 
-        _refresh_remote_control_info()
-        _refresh_interrupter_info()
+        _refresh_remote_control_info(catalog)
+        _refresh_interrupter_info(catalog)
         LOGGER.debug("Configuration updated")
         return []
 
@@ -1263,13 +1450,14 @@ class MessageHandler:
         LOGGER.debug("parse_devices_data : %s", parsed)
         devices = []
         seen_unique_ids = {}  # Track unique_ids to detect collisions
+        unchanged = changed = 0
 
         if isinstance(parsed, dict):
             # A bare device object would otherwise be iterated key by key,
             # logging one "Unsupported message" warning per key.
             parsed = [parsed]
 
-        for area_id, metadata in _area_control_metadata(parsed).items():
+        for area_id, metadata in _area_control_metadata(self.catalog, parsed).items():
             if _area_metadata_score(metadata) >= _area_metadata_score(
                 self._area_metadata.get(area_id, {})
             ):
@@ -1282,6 +1470,21 @@ class MessageHandler:
                 for endpoint in i["endpoints"]:
                     endpoint_id = endpoint["id"]
                     unique_id = str(endpoint_id) + "_" + str(device_id)
+                    if transaction_id is None:
+                        # Unsolicited PUT /devices/data: this endpoint reports
+                        # its own state changes.
+                        self.pushed_endpoints.add(unique_id)
+
+                    # Full replies repeat every endpoint: skip those whose
+                    # data did not change since they were last applied.
+                    fingerprint = _endpoint_fingerprint(endpoint)
+                    if (
+                        fingerprint is not None
+                        and self._endpoint_fingerprints.get(unique_id) == fingerprint
+                    ):
+                        unchanged += 1
+                        continue
+                    changed += 1
 
                     # Check for collisions
                     if unique_id in seen_unique_ids:
@@ -1296,6 +1499,17 @@ class MessageHandler:
                             seen_unique_ids[unique_id]["endpoint_id"],
                         )
 
+                    if (
+                        not self.catalog.name(unique_id)
+                        and self._configs_file_pending()
+                    ):
+                        # Data overtook the catalogue: replay it with
+                        # the /configs/file reply.
+                        self._held_endpoints.append(
+                            (transaction_id, {"id": device_id, "endpoints": [endpoint]})
+                        )
+                        continue
+
                     # Get device name and type first to check if device is registered
                     name_of_id = self.get_name_from_id(unique_id)
                     type_of_id = self.get_type_from_id(unique_id)
@@ -1325,7 +1539,6 @@ class MessageHandler:
                     # Check for errors or missing data, but still try to create device
                     has_error = endpoint.get("error", 0) != 0
                     has_data = "data" in endpoint and len(endpoint.get("data", [])) > 0
-
                     # Some Zigbee gateways advertise a second, non-functional
                     # endpoint for each physical cover.  A successful endpoint
                     # with neither state nor capabilities cannot create a useful
@@ -1334,7 +1547,7 @@ class MessageHandler:
                     if (
                         not has_error
                         and not has_data
-                        and not device_metadata.get(unique_id)
+                        and not self.catalog.metadata(unique_id)
                         and not endpoint.get("link")
                     ):
                         LOGGER.debug(
@@ -1346,6 +1559,10 @@ class MessageHandler:
                         )
                         continue
 
+                    self._remember_endpoint(
+                        unique_id, device_id, endpoint_id, endpoint, has_error
+                    )
+
                     if has_error:
                         LOGGER.warning(
                             "Endpoint avec erreur (création quand même) : "
@@ -1380,15 +1597,16 @@ class MessageHandler:
                             if type_of_id == "re2020ControlPassive":
                                 passive_climate_uid = f"{unique_id}_area_climate"
                                 reference_uid = passive_climate_uid
-                                device_name[passive_climate_uid] = (
-                                    f"{name_of_id} Thermostat"
-                                )
-                                device_type[passive_climate_uid] = "re2020ControlBoiler"
-                                device_endpoint[passive_climate_uid] = endpoint_id
-                                device_metadata[passive_climate_uid] = (
-                                    area_metadata.get(
-                                        area_id, device_metadata.get(unique_id, {})
-                                    ).copy()
+                                self.catalog.set_endpoint(
+                                    passive_climate_uid,
+                                    device_id,
+                                    endpoint_id,
+                                    name=f"{name_of_id} Thermostat",
+                                    usage="re2020ControlBoiler",
+                                    metadata=area_metadata.get(
+                                        area_id, self.catalog.metadata(unique_id) or {}
+                                    ).copy(),
+                                    parent=unique_id,
                                 )
                             else:
                                 data["area_id"] = area_id
@@ -1420,8 +1638,7 @@ class MessageHandler:
                             data.update(self._area_data[area_id])
 
                         # Create the device (even without data)
-                        device = await MessageHandler.get_device(
-                            self.tydom_client,
+                        device = await self._endpoint_device(
                             type_of_id,
                             unique_id,
                             device_id,
@@ -1435,8 +1652,10 @@ class MessageHandler:
                                 "device_id": device_id,
                                 "endpoint_id": endpoint_id,
                             }
+                            if fingerprint is not None:
+                                self._endpoint_fingerprints[unique_id] = fingerprint
                             if has_data and not has_error:
-                                LOGGER.info(
+                                LOGGER.debug(
                                     "Device update (id=%s, endpoint=%s, name=%s, type=%s)",
                                     device_id,
                                     endpoint_id,
@@ -1444,7 +1663,7 @@ class MessageHandler:
                                     type_of_id,
                                 )
                             else:
-                                LOGGER.info(
+                                LOGGER.debug(
                                     "Device créé sans données (id=%s, endpoint=%s, name=%s, type=%s)",
                                     device_id,
                                     endpoint_id,
@@ -1464,12 +1683,11 @@ class MessageHandler:
                                         climate_data[temperature_attribute] = data[
                                             temperature_attribute
                                         ]
-                                climate_device = await MessageHandler.get_device(
-                                    self.tydom_client,
+                                climate_device = await self._endpoint_device(
                                     "re2020ControlBoiler",
                                     passive_climate_uid,
                                     device_id,
-                                    device_name[passive_climate_uid],
+                                    self.catalog.name(passive_climate_uid),
                                     endpoint_id,
                                     climate_data,
                                 )
@@ -1504,8 +1722,153 @@ class MessageHandler:
                         )
             else:
                 LOGGER.warning("Unsupported message received: %s", parsed)
+        if unchanged:
+            LOGGER.debug("%d endpoints with unchanged data skipped", unchanged)
+        self.endpoint_data_stats["unchanged"] += unchanged
+        self.endpoint_data_stats["changed"] += changed
+        self._summarize_updates(len(devices))
+        return devices
+
+    def start_bootstrap(self) -> None:
+        """Start timing the replies to the requests sent on a new connection."""
+        self._bootstrap_started = time.monotonic()
+        self.bootstrap_timings = {}
+
+    def expect_configs_file(self) -> None:
+        """Hold data of unknown endpoints until the /configs/file reply."""
+        self._configs_file_requested = time.monotonic()
+
+    def _configs_file_pending(self) -> bool:
+        """Check whether a /configs/file reply is still awaited."""
+        if self._configs_file_requested is None:
+            return False
+        if time.monotonic() - self._configs_file_requested < _CONFIGS_FILE_TIMEOUT:
+            return True
+        LOGGER.warning(
+            "No /configs/file reply after %d s, %d held endpoints dropped",
+            _CONFIGS_FILE_TIMEOUT,
+            len(self._held_endpoints),
+        )
+        self._configs_file_requested = None
+        self._held_endpoints.clear()
+        return False
+
+    async def _release_held_endpoints(self) -> list[TydomDevice]:
+        """Parse the endpoint data received before the /configs/file reply."""
+        self._configs_file_requested = None
+        held, self._held_endpoints = self._held_endpoints, []
+        if held:
+            LOGGER.debug("Replaying %d endpoints held for /configs/file", len(held))
+        devices: list[TydomDevice] = []
+        for transaction_id, entry in held:
+            devices += await self.parse_devices_data([entry], transaction_id)
+        return devices
+
+    def _remember_endpoint(
+        self, unique_id: str, device_id, endpoint_id, endpoint: dict, has_error: bool
+    ) -> None:
+        """Keep the link, error and last value of each data element of an endpoint."""
+        known = self._snapshot_endpoints.get(unique_id)
+        if known is None:
+            known = self._snapshot_endpoints[unique_id] = (
+                device_id,
+                endpoint_id,
+                {},
+                {},
+            )
+        values, state = known[2], known[3]
+        state["error"] = endpoint.get("error", 0)
+        if "link" in endpoint:
+            state["link"] = endpoint["link"]
+        if has_error:
+            return
+        for element in endpoint.get("data") or []:
+            if isinstance(element, dict) and "name" in element:
+                values[element["name"]] = element
+
+    def export_snapshot(self) -> dict[str, Any]:
+        """
+        Return the catalogue and the last endpoint states for a warm start.
+
+        The catalogue is made of the last replies to the ``_SNAPSHOT_URIS``
+        requests; endpoint states use the ``/devices/data`` reply format. The
+        result is JSON serializable and does not share mutable containers with
+        the handler, so it can be written from another thread.
+
+        """
+        return {
+            "replies": dict(self._snapshot_replies),
+            "devices": [
+                {
+                    "id": device_id,
+                    "endpoints": [
+                        {"id": endpoint_id, **state, "data": list(values.values())}
+                    ],
+                }
+                for device_id, endpoint_id, values, state in (
+                    self._snapshot_endpoints.values()
+                )
+            ],
+        }
+
+    async def restore_snapshot(self, snapshot: dict[str, Any]) -> list[TydomDevice]:
+        """
+        Replay a snapshot built by ``export_snapshot``.
+
+        The catalogue replies go through their usual parsers, in the order the
+        client requests them at startup, then the endpoint states go through
+        ``parse_devices_data``. Live replies later update the same devices.
+
+        Args:
+            snapshot: Snapshot restored from storage
+
+        Returns:
+            The devices described by the snapshot.
+
+        """
+        parsers = {
+            "/configs/file": self.parse_config_data,
+            "/devices/meta": self.parse_devices_metadata,
+            "/info": self.parse_msg_info,
+            "/groups/file": self.parse_groups_file,
+            "/scenarios/file": self.parse_scenarios_file,
+            "/moments/file": self.parse_moments_file,
+        }
+        replies = snapshot.get("replies") or {}
+        devices: list[TydomDevice] = []
+        for uri in _SNAPSHOT_URIS:
+            if uri not in replies:
+                continue
+            self._snapshot_replies.setdefault(uri, replies[uri])
+            try:
+                devices += (
+                    await parsers[uri](replies[uri], _SNAPSHOT_TRANSACTION_ID) or []
+                )
+            except Exception as e:
+                LOGGER.warning("Snapshot entry %s ignored", uri, exc_info=e)
+
+        try:
+            devices += await self.parse_devices_data(
+                snapshot.get("devices") or [], _SNAPSHOT_TRANSACTION_ID
+            )
+        except Exception as e:
+            LOGGER.warning("Snapshot device states ignored", exc_info=e)
         return devices
 
+    def _summarize_updates(self, count: int) -> None:
+        """Count parsed device updates and log them at most every 5 minutes."""
+        self._summary_updates += count
+        elapsed = time.monotonic() - self._summary_started
+        if elapsed < _UPDATE_SUMMARY_INTERVAL:
+            return
+        LOGGER.info(
+            "%d device updates received in the last %d s",
+            self._summary_updates,
+            elapsed,
+        )
+        self._summary_updates = 0
+        self._summary_started = time.monotonic()
+
     async def parse_areas_data(
         self, parsed, transaction_id, area_id: str | None = None
     ):
@@ -1555,8 +1918,7 @@ class MessageHandler:
             data = cached_data.copy()
 
             for reference in references.values():
-                device = await MessageHandler.get_device(
-                    self.tydom_client,
+                device = await self._endpoint_device(
                     self.get_type_from_id(reference.uid),
                     reference.uid,
                     reference.device_id,
@@ -1580,6 +1942,13 @@ class MessageHandler:
         """Parse devices cdata."""
         LOGGER.debug("parse_devices_cdata : %s", parsed)
         devices = []
+        # Keep the pending entry for the whole message: a reply completed by
+        # its first element still collects the following ones.
+        pending = (
+            self._pending_replies.get(transaction_id)
+            if transaction_id is not None
+            else None
+        )
 
         for i in parsed:
             for endpoint in i["endpoints"]:
@@ -1598,29 +1967,13 @@ class MessageHandler:
                                 data.update(_parse_energy_cdata_element(elem))
 
                             elif type_of_id == "alarm" and transaction_id is not None:
-                                reply = None
-                                for r in self._cdata_replies:
-                                    if r["transaction_id"] == transaction_id:
-                                        reply = r
-                                        break
-                                if reply is None:
-                                    reply = Reply(
-                                        transaction_id=transaction_id,
-                                        events=[],
-                                        done=False,
+                                if pending is None:
+                                    LOGGER.debug(
+                                        "Ignore cdata reply to unknown request '%s'.",
+                                        transaction_id,
                                     )
-                                    self._cdata_replies.insert(0, reply)
-                                    # Limit the number of tracked replies
-                                    if len(self._cdata_replies) > _MAX_REPLIES_SIZE:
-                                        forgotten_reply = self._cdata_replies.pop()
-                                        LOGGER.warning(
-                                            "Forget uncomplete request with transaction ID '%s'.",
-                                            forgotten_reply["transaction_id"],
-                                        )
-                                        self._end_reply_events.pop(
-                                            forgotten_reply["transaction_id"], None
-                                        )
-
+                                    continue
+                                reply = pending.reply
                                 values = elem.get("values") or {}
                                 if (
                                     elem.get("EOR", False)
@@ -1629,18 +1982,12 @@ class MessageHandler:
                                     LOGGER.debug(
                                         "End of reply for request '%s'.", transaction_id
                                     )
-                                    reply["done"] = True
                                     if reply["events"]:
                                         # A streamed response has already
                                         # supplied its data, so EOR completes
                                         # it immediately.
-                                        if (
-                                            event := self._end_reply_events.pop(
-                                                transaction_id, None
-                                            )
-                                        ) is not None:
-                                            event.set()
-                                    elif transaction_id in self._end_reply_events:
+                                        self._resolve_reply(transaction_id)
+                                    elif transaction_id in self._pending_replies:
                                         # Some CS8000 firmware emits EOR a few
                                         # milliseconds before its single cdata
                                         # object. Give that object a brief
@@ -1661,13 +2008,7 @@ class MessageHandler:
                                     # cdata object. Unlike streamed history,
                                     # they do not require an EOR sentinel.
                                     if elem.get("name") != "histo":
-                                        reply["done"] = True
-                                        if (
-                                            event := self._end_reply_events.pop(
-                                                transaction_id, None
-                                            )
-                                        ) is not None:
-                                            event.set()
+                                        self._resolve_reply(transaction_id)
                             else:
                                 LOGGER.debug(
                                     "Ignore cdata message targetting '%s' (%s).",
@@ -1676,8 +2017,7 @@ class MessageHandler:
                                 )
 
                         if type_of_id == "conso" and data:
-                            device = await MessageHandler.get_device(
-                                self.tydom_client,
+                            device = await self._endpoint_device(
                                 type_of_id,
                                 unique_id,
                                 device_id,
@@ -1720,8 +2060,8 @@ class MessageHandler:
             if scenario_id is None:
                 continue
 
-            # Get scenario metadata from configs/file (stored in scenario_metadata dict)
-            scenario_meta = scenario_metadata.get(scenario_id, {})
+            # Get scenario metadata from configs/file
+            scenario_meta = self.catalog.scenarios.get(scenario_id, {})
             scenario_name = scenario_meta.get("name", f"Scenario {scenario_id}")
             scenario_type = scenario_meta.get("type", "NORMAL")
             scenario_picto = scenario_meta.get("picto", "")
@@ -1730,10 +2070,6 @@ class MessageHandler:
             # Create unique ID for scene
             unique_id = f"scene_{scenario_id}"
 
-            # Store scene info in device_name and device_type for consistency
-            device_name[unique_id] = scenario_name
-            device_type[unique_id] = "scene"
-
             # Merge scenario data with metadata
             scenario_data = {
                 "scene_id": scenario_id,
@@ -1774,6 +2110,7 @@ class MessageHandler:
         if parsed and isinstance(parsed, dict):
             groups = parsed.get("groups", [])
             if isinstance(groups, list):
+                groups_data: dict[str, dict] = {}
                 for group in groups:
                     if isinstance(group, dict) and "id" in group:
                         group_id = group.get("id")
@@ -1810,7 +2147,7 @@ class MessageHandler:
                                                         device_ids.append(ep_id_str)
 
                         # Get group metadata from /configs/file if available
-                        group_meta = groups_metadata.get(group_id_str, {})
+                        group_meta = self.catalog.group_metadata.get(group_id_str, {})
                         group_usage = group_meta.get("usage", "")
                         config_name = group_meta.get("name", "")
 
@@ -1874,8 +2211,9 @@ class MessageHandler:
                     "Found and created %d groups",
                     len(groups) if isinstance(groups, list) else 0,
                 )
-                _refresh_remote_control_info()
-                _refresh_interrupter_info()
+                self.catalog.set_groups(groups_data)
+                _refresh_remote_control_info(self.catalog)
+                _refresh_interrupter_info(self.catalog)
         return devices
 
     async def parse_moments_file(self, parsed, transaction_id):
@@ -1918,120 +2256,17 @@ class MessageHandler:
 
     def get_type_from_id(self, id):
         """Get device type from id."""
-        device_type_detected = ""
-        if id in device_type:
-            device_type_detected = device_type[id]
-        else:
+        device_type_detected = self.catalog.usage(id)
+        if not device_type_detected:
             LOGGER.warning("Unknown device type (%s)", id)
         return device_type_detected
 
     # Get pretty name for a device id
     def get_name_from_id(self, id):
         """Get device name from id."""
-        name = ""
-        if id in device_name:
-            name = device_name[id]
-        else:
-            for deviceid in device_name:
-                LOGGER.error("- device %s -> %s", deviceid, device_name[deviceid])
-            LOGGER.warning("Unknown device name (%s)", id)
+        name = self.catalog.name(id)
+        if not name:
+            LOGGER.warning(
+                "Unknown device name (%s) among %d endpoints", id, len(self.catalog)
+            )
         return name
-
-
-class BytesIOSocket:
-    """BytesIOSocket."""
-
-    def __init__(self, content):
-        """Initialize a BytesIOSocket."""
-        self.handle = BytesIO(content)
-
-    def makefile(self, mode):
-        """Get handle."""
-        return self.handle
-
-
-@dataclass(frozen=True)
-class HTTPResponse:
-    """HTTPResponse."""
-
-    status: int
-    headers: HTTPMessage
-    body: bytes | None
-
-
-def _parse_response(raw_message: bytes) -> HTTPResponse:
-    sock = BytesIOSocket(raw_message)
-    # CoreHTTPResponse expects a socket, but BytesIOSocket implements the interface
-    response = CoreHTTPResponse(cast(Any, sock))
-    response.begin()
-
-    return HTTPResponse(
-        status=response.status, headers=response.headers, body=response.read()
-    )
-
-
-_MAXLINE = 65536
-
-
-class _FakeHTTPRequest(CoreHTTPResponse):
-    def _read_status(self):
-        # This is the only line that is different for a request vs a response
-        # so we fake it.
-        line = str(self.fp.readline(_MAXLINE + 1), "iso-8859-1")
-        if len(line) > _MAXLINE:
-            raise LineTooLong("status line")
-        if self.debuglevel > 0:
-            print("reply:", repr(line))  # noqa: T201
-        if not line:
-            raise ValueError("No request line")
-
-        words = line.rstrip("\r\n").split()
-
-        version = words[-1]
-
-        if not version.startswith("HTTP/"):
-            if hasattr(self, "_close_conn"):
-                # _close_conn is a dynamic attribute added by http.client
-                getattr(self, "_close_conn")()
-            raise ValueError(line)
-
-        command, path = words[:2]
-        self.method = command
-        self.path = path
-
-        # Return fake status and reason to keep parsing the message
-        return version, 200, ""
-
-
-@dataclass(frozen=True)
-class HTTPRequest:
-    """HTTPRequest."""
-
-    method: str
-    path: str
-    headers: HTTPMessage
-    body: bytes | None
-
-
-def parse_request(raw_request: bytes) -> HTTPRequest:
-    """
-    Parse a HTTP request sent through the websocket.
-
-    Args:
-        raw_request: Websocket message
-
-    Returns:
-        The parsed request.
-
-    """
-    sock = BytesIOSocket(raw_request)
-    # _FakeHTTPRequest inherits from CoreHTTPResponse which expects a socket
-    request = _FakeHTTPRequest(cast(Any, sock))
-    request.begin()
-
-    return HTTPRequest(
-        method=request.method,
-        path=request.path,
-        headers=request.headers,
-        body=request.read(),
-    )
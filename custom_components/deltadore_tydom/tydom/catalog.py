@@ -0,0 +1,303 @@
+"""Catalogue of the devices, groups and scenarios configured on a gateway.
+
+The catalogue is built from ``/configs/file``, ``/devices/meta`` and
+``/groups/file``. Each message handler owns one, so several gateways never
+see each other's devices, and endpoints the configuration no longer lists are
+dropped instead of piling up across reloads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, fields
+from typing import Any
+
+_Index = dict[str, dict[str, None]]
+"""Unique IDs by key, in the order of the configuration."""
+
+
+@dataclass(slots=True)
+class EndpointRecord:
+    """What the gateway configuration says about one endpoint."""
+
+    device_id: str
+    endpoint_id: str
+    name: str = ""
+    """Name given to the device in Home Assistant."""
+    config_name: str = ""
+    """Name of the endpoint in ``/configs/file``."""
+    usage: str = ""
+    tutorial_id: str = ""
+    configured_action: str = "TOGGLE"
+    button_number: int | None = None
+    """Number of a remote control button."""
+    button: str | None = None
+    """Letter or number of a wall switch button."""
+    metadata: dict[str, dict] | None = None
+    interrupter: dict[str, Any] | None = None
+    """Physical wall switch of an interrupter endpoint."""
+    remote_control: dict[str, Any] | None = None
+    """Physical remote control of a remote control button."""
+    parent: str | None = None
+    """Endpoint a derived record, such as an area thermostat, belongs to."""
+
+
+_RECORD_FIELDS = frozenset(field.name for field in fields(EndpointRecord))
+
+
+class DeviceCatalog:
+    """Endpoint records of one gateway, indexed for constant time lookups.
+
+    Index lookups return unique IDs in the order of the configuration, which
+    decides, for instance, the name of a wall switch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty catalogue."""
+        self._endpoints: dict[str, EndpointRecord] = {}
+        self._by_device: _Index = {}
+        self._by_usage: _Index = {}
+        self._by_tutorial_id: _Index = {}
+        self._derived: _Index = {}
+        self.scenarios: dict[Any, dict[str, Any]] = {}
+        """Scenario metadata from ``/configs/file``, by scenario ID."""
+        self.group_metadata: dict[str, dict[str, Any]] = {}
+        """Group metadata from ``/configs/file``, by group ID."""
+        self.groups: dict[str, dict[str, Any]] = {}
+        """Groups from ``/groups/file``: devices, name and usage by group ID."""
+        self._groups_by_member: _Index = {}
+
+    def __contains__(self, uid: object) -> bool:
+        """Check if an endpoint is known."""
+        return uid in self._endpoints
+
+    def __len__(self) -> int:
+        """Count the known endpoints."""
+        return len(self._endpoints)
+
+    def get(self, uid: str) -> EndpointRecord | None:
+        """Get the record of an endpoint."""
+        return self._endpoints.get(uid)
+
+    def name(self, uid: str) -> str:
+        """Get the name of an endpoint, or an empty string."""
+        record = self._endpoints.get(uid)
+        return record.name if record is not None else ""
+
+    def usage(self, uid: str) -> str:
+        """Get the usage of an endpoint, or an empty string."""
+        record = self._endpoints.get(uid)
+        return record.usage if record is not None else ""
+
+    def tutorial_id(self, uid: str) -> str | None:
+        """Get the tutorial identifier of an endpoint."""
+        record = self._endpoints.get(uid)
+        return record.tutorial_id if record is not None else None
+
+    def metadata(self, uid: str) -> dict[str, dict] | None:
+        """Get the metadata of an endpoint."""
+        record = self._endpoints.get(uid)
+        return record.metadata if record is not None else None
+
+    def set_endpoint(
+        self, uid: str, device_id: Any, endpoint_id: Any, **values: Any
+    ) -> EndpointRecord:
+        """Create or update the record of an endpoint."""
+        unknown = values.keys() - _RECORD_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown endpoint record fields: {sorted(unknown)}")
+        record = self._endpoints.get(uid)
+        if record is None:
+            record = EndpointRecord(str(device_id), str(endpoint_id))
+            self._endpoints[uid] = record
+        else:
+            self._unindex(uid, record)
+            record.device_id = str(device_id)
+            record.endpoint_id = str(endpoint_id)
+        for name, value in values.items():
+            setattr(record, name, value)
+        self._index(uid, record)
+        return record
+
+    def set_tutorial_id(self, uid: str, tutorial_id: str) -> None:
+        """Change the tutorial identifier of a known endpoint."""
+        record = self._endpoints[uid]
+        self._unindex(uid, record)
+        record.tutorial_id = tutorial_id
+        self._index(uid, record)
+
+    def remove(self, uid: str) -> list[str]:
+        """Forget an endpoint and the records derived from it.
+
+        Return the unique IDs of the records removed.
+        """
+        record = self._endpoints.pop(uid, None)
+        if record is None:
+            return []
+        self._unindex(uid, record)
+        removed = [uid]
+        for derived_uid in self._derived.pop(uid, {}).copy():
+            removed += self.remove(derived_uid)
+        return removed
+
+    def retain(self, uids: Iterable[str]) -> list[str]:
+        """Forget the endpoints missing from a new configuration.
+
+        Derived records follow the endpoint they belong to. Return the
+        unique IDs of the endpoints and derived records removed.
+        """
+        keep = set(uids)
+        missing = [
+            uid
+            for uid, record in self._endpoints.items()
+            if record.parent is None and uid not in keep
+        ]
+        removed: list[str] = []
+        for uid in missing:
+            removed += self.remove(uid)
+        return removed
+
+    def by_device(self, device_id: Any) -> tuple[str, ...]:
+        """Get the unique IDs of the endpoints of a device."""
+        return tuple(self._by_device.get(str(device_id), ()))
+
+    def by_usage(self, usage: str) -> tuple[str, ...]:
+        """Get the unique IDs of the endpoints with a usage."""
+        return tuple(self._by_usage.get(usage, ()))
+
+    def by_tutorial_id(self, tutorial_id: str) -> tuple[str, ...]:
+        """Get the unique IDs of the endpoints with a tutorial identifier."""
+        return tuple(self._by_tutorial_id.get(tutorial_id, ()))
+
+    def set_groups(self, groups: dict[str, dict[str, Any]]) -> None:
+        """Replace the groups parsed from ``/groups/file``."""
+        self.groups = groups
+        self._groups_by_member = {}
+        for group_id, group in groups.items():
+            for member in group.get("devices", []):
+                self._groups_by_member.setdefault(member, {})[group_id] = None
+
+    def groups_of(self, member: Any) -> tuple[str, ...]:
+        """Get the IDs of the groups listing a device, endpoint or unique ID."""
+        return tuple(self._groups_by_member.get(str(member), ()))
+
+    def by_group(self, group_id: Any) -> tuple[str, ...]:
+        """Get the unique IDs of the known endpoints of a group."""
+        group = self.groups.get(str(group_id))
+        if group is None:
+            return ()
+        uids: dict[str, None] = {}
+        for member in group.get("devices", []):
+            if member in self._endpoints:
+                uids[member] = None
+            else:
+                uids.update(self._by_device.get(member, {}))
+        return tuple(uids)
+
+    def group_usage(self, group_id: str) -> str:
+        """Get the usage of a group from ``/groups/file`` or ``/configs/file``."""
+        group = self.groups.get(group_id, {})
+        return group.get("usage") or self.group_metadata.get(group_id, {}).get(
+            "usage", ""
+        )
+
+    def _index(self, uid: str, record: EndpointRecord) -> None:
+        self._by_device.setdefault(record.device_id, {})[uid] = None
+        if record.usage:
+            self._by_usage.setdefault(record.usage, {})[uid] = None
+        if record.tutorial_id:
+            self._by_tutorial_id.setdefault(record.tutorial_id, {})[uid] = None
+        if record.parent is not None:
+            self._derived.setdefault(record.parent, {})[uid] = None
+
+    def _unindex(self, uid: str, record: EndpointRecord) -> None:
+        for index, key in (
+            (self._by_device, record.device_id),
+            (self._by_usage, record.usage),
+            (self._by_tutorial_id, record.tutorial_id),
+            (self._derived, record.parent),
+        ):
+            uids = index.get(key)
+            if uids is None:
+                continue
+            uids.pop(uid, None)
+            if not uids:
+                del index[key]
+
+
+class SceneRelations:
+    """Devices each scenario acts on, and scenarios acting on each device.
+
+    Scenarios act on the members of the groups of their ``grpAct`` and on the
+    endpoints of their ``epAct``. The hub resolves them when a scenario, a
+    group or a missing device changes, so both directions are then answered
+    without searching the devices or the groups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty relations."""
+        self._devices: dict[str, frozenset[str]] = {}
+        self._scenes_by_device: _Index = {}
+        self._groups: dict[str, tuple[str, ...]] = {}
+        self._scenes_by_group: _Index = {}
+        self.incomplete: dict[str, None] = {}
+        """Scenarios naming a group or an endpoint no device matched yet."""
+
+    def set_scene(
+        self,
+        scene_id: str,
+        devices: Iterable[str],
+        groups: Iterable[str],
+        complete: bool,
+    ) -> bool:
+        """Record what a scenario acts on, and tell if its devices changed."""
+        devices = frozenset(devices)
+        groups = tuple(dict.fromkeys(groups))
+        previous = self._devices.get(scene_id)
+        self._relink(
+            self._scenes_by_group, scene_id, self._groups.get(scene_id, ()), groups
+        )
+        self._relink(self._scenes_by_device, scene_id, previous or (), devices)
+        self._devices[scene_id] = devices
+        self._groups[scene_id] = groups
+        if complete:
+            self.incomplete.pop(scene_id, None)
+        else:
+            self.incomplete[scene_id] = None
+        return devices != previous
+
+    def devices_of(self, scene_id: str) -> frozenset[str]:
+        """Get the keys of the devices a scenario acts on."""
+        return self._devices.get(scene_id, frozenset())
+
+    def scenes_of(self, device_id: str) -> tuple[str, ...]:
+        """Get the IDs of the scenarios acting on a device."""
+        return tuple(self._scenes_by_device.get(device_id, ()))
+
+    def scenes_of_group(self, group_id: str) -> tuple[str, ...]:
+        """Get the IDs of the scenarios acting on a group."""
+        return tuple(self._scenes_by_group.get(group_id, ()))
+
+    def clear(self) -> None:
+        """Forget every scenario."""
+        self._devices.clear()
+        self._scenes_by_device.clear()
+        self._groups.clear()
+        self._scenes_by_group.clear()
+        self.incomplete.clear()
+
+    @staticmethod
+    def _relink(
+        index: _Index, scene_id: str, old: Iterable[str], new: Collection[str]
+    ) -> None:
+        for key in old:
+            if key in new:
+                continue
+            scenes = index.get(key)
+            if scenes is None:
+                continue
+            scenes.pop(scene_id, None)
+            if not scenes:
+                del index[key]
+        for key in new:
+            index.setdefault(key, {})[scene_id] = None
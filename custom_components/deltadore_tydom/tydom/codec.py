@@ -0,0 +1,255 @@
+"""HTTP-over-websocket frame codec for the Tydom protocol.
+
+Every websocket message exchanged with the gateway is a complete HTTP/1.1
+request or response. Frames are small and always complete, so they are parsed
+straight from the received buffer with ``bytes.find`` instead of going through
+``http.client`` and the email header parser.
+"""
+
+from dataclasses import dataclass
+
+_CRLF = b"\r\n"
+_HEADER_END = b"\r\n\r\n"
+# Responses that never carry a body, whatever their headers announce.
+_NO_BODY_STATUSES = frozenset({204, 304})
+
+_HTTP_VERSION = b" HTTP/1.1\r\n"
+_EMPTY_BODY_HEADERS = (
+    b"Content-Length: 0\r\nContent-Type: application/json; charset=UTF-8\r\n"
+    b"Transac-Id: "
+)
+_JSON_BODY_HEADERS = (
+    b"Content-Type: application/json; charset=UTF-8\r\nContent-Length: "
+)
+_TRANSAC_ID_HEADER = b"\r\nTransac-Id: "
+# Headers written from the templates above; callers may not override them.
+_TEMPLATE_HEADERS = frozenset({"content-length", "content-type", "transac-id"})
+
+
+class FrameHeaders(dict[str, str]):
+    """Frame headers with case-insensitive lookups.
+
+    Names are stored lower-cased; the first occurrence of a repeated header
+    wins, like ``http.client.HTTPMessage.get``.
+    """
+
+    def __getitem__(self, name: str) -> str:
+        """Get a header value."""
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a header is present."""
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default=None):
+        """Get a header value or a default."""
+        return super().get(name.lower(), default)
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    """HTTPResponse."""
+
+    status: int
+    headers: FrameHeaders
+    body: bytes
+
+
+@dataclass(frozen=True)
+class HTTPRequest:
+    """HTTPRequest."""
+
+    method: str
+    path: str
+    headers: FrameHeaders
+    body: bytes
+
+
+def decode_chunked_body(frame: bytes, start: int = 0) -> bytes:
+    """Decode an HTTP chunked body starting at ``start`` in ``frame``.
+
+    Raises:
+        ValueError: If the chunked encoding is truncated or malformed.
+
+    """
+    view = memoryview(frame)
+    find = frame.find
+    chunks: list[memoryview] = []
+    cursor = start
+
+    while True:
+        line_end = find(_CRLF, cursor)
+        if line_end == -1:
+            raise ValueError("Incomplete chunk-size line")
+
+        try:
+            size = int(frame[cursor:line_end], 16)
+        except ValueError:
+            # Chunk extensions (";name=value") are rare; ignore them.
+            size_text = frame[cursor:line_end].split(b";", 1)[0].strip()
+            try:
+                size = int(size_text, 16)
+            except ValueError as exception:
+                raise ValueError(f"Invalid chunk size: {size_text!r}") from exception
+
+        cursor = line_end + 2
+        if size == 0:
+            return b"".join(chunks)
+
+        chunk_end = cursor + size
+        if chunk_end > len(frame):
+            raise ValueError("Incomplete chunk body")
+        chunks.append(view[cursor:chunk_end])
+        cursor = chunk_end
+
+        if not frame.startswith(_CRLF, cursor):
+            raise ValueError("Chunk is not terminated by CRLF")
+        cursor += 2
+
+
+def _split_frame(frame: bytes) -> tuple[bytes, FrameHeaders, int]:
+    """Return the start line, the headers and the body offset of a frame."""
+    header_end = frame.find(_HEADER_END)
+    if header_end == -1:
+        # A frame without headers ends right after its start line.
+        header_end = frame.find(_CRLF)
+        if header_end == -1:
+            header_end = len(frame)
+        return frame[:header_end], FrameHeaders(), len(frame)
+
+    line_end = frame.find(_CRLF, 0, header_end)
+    if line_end == -1:
+        return frame[:header_end], FrameHeaders(), header_end + 4
+
+    fields: dict[str, str] = {}
+    cursor = line_end + 2
+    while cursor < header_end:
+        end = frame.find(_CRLF, cursor, header_end)
+        if end == -1:
+            end = header_end
+        colon = frame.find(b":", cursor, end)
+        if colon != -1:
+            fields.setdefault(
+                frame[cursor:colon].strip().decode("latin-1").lower(),
+                frame[colon + 1 : end].strip().decode("latin-1"),
+            )
+        cursor = end + 2
+
+    return frame[:line_end], FrameHeaders(fields), header_end + 4
+
+
+def _read_body(frame: bytes, headers: FrameHeaders, start: int) -> bytes:
+    """Return the decoded body of a frame."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        return decode_chunked_body(frame, start)
+    length = headers.get("content-length")
+    if length is not None:
+        try:
+            return frame[start : start + int(length)]
+        except ValueError:
+            pass
+    return frame[start:]
+
+
+def parse_response(frame: bytes) -> HTTPResponse:
+    """
+    Parse a HTTP response received through the websocket.
+
+    Args:
+        frame: Websocket message, without the command prefix
+
+    Returns:
+        The parsed response.
+
+    Raises:
+        ValueError: If the frame is not a valid HTTP response.
+
+    """
+    status_line, headers, body_start = _split_frame(frame)
+    parts = status_line.split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+        raise ValueError(f"Invalid status line: {status_line[:80]!r}")
+    try:
+        status = int(parts[1])
+    except ValueError as exception:
+        raise ValueError(f"Invalid status line: {status_line[:80]!r}") from exception
+
+    if status in _NO_BODY_STATUSES or 100 <= status < 200:
+        body = b""
+    else:
+        body = _read_body(frame, headers, body_start)
+    return HTTPResponse(status=status, headers=headers, body=body)
+
+
+def parse_request(frame: bytes) -> HTTPRequest:
+    """
+    Parse a HTTP request sent through the websocket.
+
+    Args:
+        frame: Websocket message, without the command prefix
+
+    Returns:
+        The parsed request.
+
+    Raises:
+        ValueError: If the frame is not a valid HTTP request.
+
+    """
+    request_line, headers, body_start = _split_frame(frame)
+    parts = request_line.split()
+    if len(parts) < 3 or not parts[-1].startswith(b"HTTP/"):
+        raise ValueError(f"Invalid request line: {request_line[:80]!r}")
+
+    return HTTPRequest(
+        method=parts[0].decode("latin-1"),
+        path=parts[1].decode("latin-1"),
+        headers=headers,
+        body=_read_body(frame, headers, body_start),
+    )
+
+
+def encode_request(
+    method: str,
+    url: str,
+    transaction_id: str,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    """
+    Encode a HTTP request to send through the websocket.
+
+    Bodies are always JSON; the framing headers come from pre-encoded
+    templates so only the request line, the length and the transaction id are
+    encoded per call.
+
+    Args:
+        method: HTTP method
+        url: HTTP target URL (already quoted)
+        transaction_id: Transac-Id header value
+        body: [optional] JSON request body
+        headers: [optional] Additional request headers
+
+    Returns:
+        The request frame, without the command prefix.
+
+    """
+    parts = [method.encode("ascii"), b" ", url.encode("ascii"), _HTTP_VERSION]
+    if headers:
+        parts.extend(
+            f"{name}: {value}\r\n".encode("ascii")
+            for name, value in headers.items()
+            if name.lower() not in _TEMPLATE_HEADERS
+        )
+    if body:
+        parts += (
+            _JSON_BODY_HEADERS,
+            str(len(body)).encode("ascii"),
+            _TRANSAC_ID_HEADER,
+            transaction_id.encode("ascii"),
+            _HEADER_END,
+            body,
+            _HEADER_END,
+        )
+    else:
+        parts += (_EMPTY_BODY_HEADERS, transaction_id.encode("ascii"), _HEADER_END)
+    return b"".join(parts)
@@ -2,13 +2,21 @@
 
 import asyncio
 import base64
+import contextlib
+import hashlib
 import json
+import logging
 import os
 import re
 import socket
 import ssl
 import time
 import traceback
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import partial
 from typing import TYPE_CHECKING, cast
 from urllib.parse import quote
 
@@ -16,12 +24,12 @@ import aiohttp
 import async_timeout
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from requests.auth import HTTPDigestAuth
 from urllib3 import encode_multipart_formdata
 
 from ..const import (
     LOGGER,
     validate_value_with_metadata,
+    TIMEOUT_COMMAND_ACK,
     TIMEOUT_NORMAL_REQUEST,
     TIMEOUT_LONG_REQUEST,
     TIMEOUT_WEBSOCKET_CONNECT,
@@ -37,55 +45,120 @@ from .const import (
     DELTADORE_AUTH_URL,
     MEDIATION_URL,
 )
-from .MessageHandler import MessageHandler
+from .codec import encode_request, parse_request, parse_response
+from .MessageHandler import MessageHandler, ReplyError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .catalog import DeviceCatalog
     from .tydom_devices import TydomDevice
 
+_COMMAND_COALESCE_WINDOW = 0.25
+"""Default seconds during which successive writes of one attribute are merged."""
+
+_SEND_QUEUE_SIZE = 64
+"""Maximal number of frames waiting in each send priority class."""
+
+_REQUEST_RATE = 5.0
+"""Default sustained number of requests per second sent to the gateway."""
+
+_REQUEST_BURST = 20
+"""Default number of requests that can be sent back to back."""
+
+_SLOW_REPLY_LATENCY = 2.0
+"""Smoothed reply latency (seconds) above which the gateway is considered busy."""
+
+_FLIGHT_RECORDER_SIZE = 200
+"""Default number of websocket frames kept by the flight recorder."""
+
+_PATH_SWITCH_RATIO = 0.7
+"""A standby path must answer this much faster than the active one to take over."""
+
+
+class SendPriority(IntEnum):
+    """Outbound traffic classes, most urgent first."""
+
+    INTERACTIVE = 0
+    """User commands and requests (default)."""
+    BOOTSTRAP = 1
+    """Connection upkeep and (re)discovery: ping, metadata, reload."""
+    BACKGROUND = 2
+    """Periodic polling loops."""
+
+
+_send_priority: ContextVar[SendPriority] = ContextVar(
+    "tydom_send_priority", default=SendPriority.INTERACTIVE
+)
+
+
+_SECRET_PATTERNS = (
+    (re.compile(r'"password"\s*:\s*"[^"]*"', re.IGNORECASE), '"password":"***"'),
+    (re.compile(r'"pwd"\s*:\s*"[^"]*"', re.IGNORECASE), '"pwd":"***"'),
+    (
+        re.compile(r'"access_token"\s*:\s*"[^"]*"', re.IGNORECASE),
+        '"access_token":"***"',
+    ),
+    (re.compile(r'"token"\s*:\s*"[^"]*"', re.IGNORECASE), '"token":"***"'),
+    # Masquer les patterns dans les URLs ou headers
+    (
+        re.compile(
+            r'(password|pwd|passwd|token|access_token)\s*[=:]\s*[^\s"\'<>]+',
+            re.IGNORECASE,
+        ),
+        r"\1=***",
+    ),
+    (re.compile(r"Bearer\s+[A-Za-z0-9\-._~+/]+", re.IGNORECASE), "Bearer ***"),
+)
+
+_LOG_FRAME_LIMIT = 1024
+"""Maximal number of bytes of a websocket frame written to the log."""
+
 
 def sanitize_log_message(message: str, password: str | None = None) -> str:
     """Masquer les informations sensibles dans les messages de log."""
-    import re
-
     sanitized = str(message)
 
     # Masquer le mot de passe s'il est présent
     if password:
         sanitized = sanitized.replace(password, "***")
-        sanitized = sanitized.replace(f'"{password}"', '"***"')
-        sanitized = sanitized.replace(f"'{password}'", "'***'")
 
     # Masquer les patterns de mots de passe dans les JSON/strings
-    sanitized = re.sub(
-        r'"password"\s*:\s*"[^"]*"', '"password":"***"', sanitized, flags=re.IGNORECASE
-    )
-    sanitized = re.sub(
-        r'"pwd"\s*:\s*"[^"]*"', '"pwd":"***"', sanitized, flags=re.IGNORECASE
-    )
-    sanitized = re.sub(
-        r'"access_token"\s*:\s*"[^"]*"',
-        '"access_token":"***"',
-        sanitized,
-        flags=re.IGNORECASE,
-    )
-    sanitized = re.sub(
-        r'"token"\s*:\s*"[^"]*"', '"token":"***"', sanitized, flags=re.IGNORECASE
-    )
-
-    # Masquer les patterns dans les URLs ou headers
-    sanitized = re.sub(
-        r'(password|pwd|passwd|token|access_token)\s*[=:]\s*[^\s"\'<>]+',
-        r"\1=***",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
-    sanitized = re.sub(
-        r"Bearer\s+[A-Za-z0-9\-._~+/]+", "Bearer ***", sanitized, flags=re.IGNORECASE
-    )
+    for pattern, replacement in _SECRET_PATTERNS:
+        sanitized = pattern.sub(replacement, sanitized)
 
     return sanitized
 
 
+class LogFrame:
+    """Websocket frame rendered for the log only when the record is emitted.
+
+    Decoding and redaction are deferred to ``__str__``; long frames are
+    truncated to ``_LOG_FRAME_LIMIT`` bytes.
+    """
+
+    __slots__ = ("_data", "_password")
+
+    def __init__(self, data: bytes | str, password: str | None = None) -> None:
+        """Initialize the view."""
+        self._data = data
+        self._password = password
+
+    def __str__(self) -> str:
+        """Return the truncated and redacted frame."""
+        data = self._data
+        size = len(data)
+        # Redact a little past the limit so that a secret straddling the cut
+        # is still recognised before the text is truncated.
+        window = data[: _LOG_FRAME_LIMIT + 256]
+        if isinstance(window, bytes):
+            window = window.decode("utf-8", errors="replace")
+        text = sanitize_log_message(window, self._password)
+        if size <= _LOG_FRAME_LIMIT:
+            return text
+        return f"{text[:_LOG_FRAME_LIMIT]}... ({size} bytes)"
+
+
 class TydomClientApiClientError(Exception):
     """Exception to indicate a general API error."""
 
@@ -98,6 +171,279 @@ class TydomClientApiClientAuthenticationError(TydomClientApiClientError):
     """Exception to indicate an authentication error."""
 
 
+@dataclass
+class CommandResult:
+    """Outcome of a write command acknowledged by the gateway."""
+
+    transaction_id: str
+    """Transaction ID of the command."""
+    latency: float
+    """Seconds between sending the command and its acknowledgement."""
+    error: str | None = None
+    """Rejection reason, or "timeout" when no acknowledgement was received."""
+    pending: bool = False
+    """Whether the acknowledgement is still awaited in the background."""
+    settled: asyncio.Future | None = field(default=None, repr=False, compare=False)
+    """Resolved once a pending acknowledgement has set the latency and error."""
+
+    @property
+    def acknowledged(self) -> bool:
+        """Return whether the gateway accepted the command."""
+        return self.error is None and not self.pending
+
+    async def wait_acknowledgement(self) -> "CommandResult":
+        """Return this result once its acknowledgement has been handled."""
+        if self.settled is not None:
+            await asyncio.shield(self.settled)
+        return self
+
+
+class RequestBudget:
+    """Token bucket limiting the request rate sent to the gateway.
+
+    The rate adapts to the gateway: it is halved while replies are slow and
+    recovers step by step towards the configured rate once they speed up.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialise a full bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Requests that can be sent back to back
+
+        """
+        self.rate = rate
+        self.current_rate = rate
+        self.burst = burst
+        self.deferred = 0
+        self.latency: float | None = None
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """Spend one token and return how long to wait before sending."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.current_rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        self.deferred += 1
+        return -self._tokens / self.current_rate
+
+    def record_latency(self, latency: float) -> None:
+        """Adapt the rate to the latest reply latency."""
+        self.latency = (
+            latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        )
+        if self.latency > _SLOW_REPLY_LATENCY:
+            self.current_rate = max(self.rate / 8, self.current_rate / 2)
+        else:
+            self.current_rate = min(self.rate, self.current_rate + self.rate / 10)
+
+
+@dataclass(slots=True)
+class FrameRecord:
+    """One websocket frame kept by the flight recorder."""
+
+    outgoing: bool
+    """Whether the frame was sent to the gateway."""
+    timestamp: float
+    """Wall-clock time at which the frame was sent or received."""
+    frame: bytes
+    """Raw frame, command prefix included; never redacted in memory."""
+    parse_duration: float | None = None
+    """Seconds spent routing an incoming frame."""
+    cmd_prefix: bytes = b""
+    """Prefix of the connection path the frame went through (remote mode)."""
+
+
+class FlightRecorder:
+    """Ring buffer of the last websocket frames exchanged with the gateway.
+
+    Recording only keeps a reference to the frame. Transaction ids and URIs
+    are extracted, and secrets redacted, when the buffer is exported.
+    """
+
+    def __init__(self, size: int = _FLIGHT_RECORDER_SIZE) -> None:
+        """Initialise an empty recorder keeping ``size`` frames."""
+        self._records: deque[FrameRecord] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of recorded frames."""
+        return len(self._records)
+
+    def record(
+        self,
+        frame: bytes,
+        outgoing: bool,
+        parse_duration: float | None = None,
+        cmd_prefix: bytes = b"",
+    ) -> None:
+        """Record a frame and the prefix of the path it went through."""
+        self._records.append(
+            FrameRecord(outgoing, time.time(), frame, parse_duration, cmd_prefix)
+        )
+
+    def export(self, secrets: tuple[str, ...] = ()) -> list[dict]:
+        """Return the recorded frames, redacted, oldest first.
+
+        Args:
+            secrets: Literal values masked in addition to the usual patterns
+
+        """
+        exported = []
+        for record in self._records:
+            frame = record.frame.removeprefix(record.cmd_prefix)
+            transaction_id = uri = None
+            with contextlib.suppress(ValueError):
+                if frame.startswith(b"HTTP/"):
+                    response = parse_response(frame)
+                    uri = response.headers.get("Uri-Origin")
+                    transaction_id = response.headers.get("Transac-Id")
+                else:
+                    request = parse_request(frame)
+                    uri = request.path
+                    transaction_id = request.headers.get("Transac-Id")
+            exported.append(
+                {
+                    "direction": "out" if record.outgoing else "in",
+                    "timestamp": record.timestamp,
+                    "transaction_id": transaction_id,
+                    "uri": _redact(uri, secrets) if uri else uri,
+                    "parse_duration": record.parse_duration,
+                    "size": len(record.frame),
+                    "frame": _redact(frame.decode("utf-8", errors="replace"), secrets),
+                }
+            )
+        return exported
+
+    def export_traces(self, secrets: tuple[str, ...] = ()) -> str:
+        """Return the incoming frames in the ``traces.txt`` format of file mode."""
+        lines = []
+        for record in self._records:
+            if record.outgoing:
+                continue
+            text = _redact(record.frame.decode("utf-8", errors="replace"), secrets)
+            lines.append(text.replace("\r", "\\r").replace("\n", "\\n") + "\n")
+        return "".join(lines)
+
+
+def _redact(text: str, secrets: tuple[str, ...]) -> str:
+    """Mask secret patterns and the given literal values."""
+    text = sanitize_log_message(text)
+    for secret in secrets:
+        if secret:
+            text = text.replace(secret, "***")
+    return text
+
+
+@dataclass
+class CoalescedCommand:
+    """Latest write waiting to be sent for one attribute."""
+
+    send: "Callable[[], Awaitable[CommandResult]] | None" = None
+    """Sends the most recent value."""
+    waiters: list[asyncio.Future] = field(default_factory=list)
+    """Callers resolved by the next send, superseded ones included."""
+    task: asyncio.Task | None = None
+    """Task draining the queued writes."""
+
+
+@dataclass(slots=True)
+class ConnectionPath:
+    """One way to reach the gateway: directly on the LAN or through mediation."""
+
+    host: str
+    rtt: float | None = None
+    """Smoothed duration (seconds) of the digest challenge request."""
+    failures: int = 0
+    """Consecutive failed connections or probes."""
+
+    @property
+    def remote(self) -> bool:
+        """Whether frames go through the Delta Dore mediation server."""
+        return self.host == MEDIATION_URL
+
+    def record_rtt(self, rtt: float) -> None:
+        """Record a successful round trip."""
+        self.failures = 0
+        self.rtt = rtt if self.rtt is None else 0.7 * self.rtt + 0.3 * rtt
+
+    def sort_key(self) -> tuple[int, bool, float]:
+        """Order paths: working first, then fastest; unmeasured ones keep their rank."""
+        return (self.failures, self.rtt is None, self.rtt or 0.0)
+
+
+_SSL_CONTEXTS: dict[bool, ssl.SSLContext] = {}
+"""TLS contexts shared by every client, keyed by cloud mode."""
+
+
+async def _get_ssl_context(cloud_mode: bool) -> ssl.SSLContext:
+    """Return the TLS context of a connection mode, created once per process."""
+    context = _SSL_CONTEXTS.get(cloud_mode)
+    if context is not None:
+        return context
+    # - Wrap slow blocking call flagged by HA
+    context = await asyncio.to_thread(ssl.create_default_context)
+    context.options |= 0x4  # OP_LEGACY_SERVER_CONNECT
+    if cloud_mode:
+        # Cloud mode: enforce TLS verification against the public CA chain
+        context.check_hostname = True
+        context.verify_mode = ssl.CERT_REQUIRED
+    else:
+        # Local mode: Tydom gateway uses a self-signed certificate
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return _SSL_CONTEXTS.setdefault(cloud_mode, context)
+
+
+def build_digest_authorization(
+    username: str,
+    password: str,
+    realm: str,
+    method: str,
+    uri: str,
+    nonce: str,
+    cnonce: str | None = None,
+    nonce_count: int = 1,
+) -> str:
+    """Build a Digest ``Authorization`` header (RFC 2617, MD5, qop=auth).
+
+    Args:
+        username: Digest user name (the gateway MAC)
+        password: Gateway password
+        realm: Challenge realm
+        method: HTTP method of the authenticated request
+        uri: Path and query of the authenticated request
+        nonce: Challenge nonce
+        cnonce: Client nonce (random when omitted)
+        nonce_count: Number of requests sent with this nonce
+
+    Returns:
+        The header value.
+
+    """
+
+    def md5(value: str) -> str:
+        return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+
+    if cnonce is None:
+        cnonce = os.urandom(8).hex()
+    nc = f"{nonce_count:08x}"
+    ha1 = md5(f"{username}:{realm}:{password}")
+    ha2 = md5(f"{method}:{uri}")
+    response = md5(f"{ha1}:{nonce}:{nc}:{cnonce}:auth:{ha2}")
+    return (
+        f'Digest username="{username}", realm="{realm}", nonce="{nonce}", '
+        f'uri="{uri}", response="{response}", qop="auth", nc={nc}, '
+        f'cnonce="{cnonce}"'
+    )
+
+
 proxy = None
 
 # DEBUG ONLY — replaces websocket with a local trace file
@@ -121,7 +467,14 @@ class TydomClient:
         zone_home: str | None = None,
         zone_night: str | None = None,
         host: str = MEDIATION_URL,
+        standby_host: str | None = None,
         event_callback=None,
+        connection_callback: "Callable[[bool], None] | None" = None,
+        max_in_flight: int | None = None,
+        command_coalesce_window: float = _COMMAND_COALESCE_WINDOW,
+        request_rate: float = _REQUEST_RATE,
+        request_burst: int = _REQUEST_BURST,
+        flight_recorder_size: int = _FLIGHT_RECORDER_SIZE,
     ) -> None:
         """Initialise client."""
         LOGGER.debug("Initialising TydomClient Class")
@@ -135,31 +488,57 @@ class TydomClient:
         self._zone_away = zone_away
         self._zone_night = zone_night
         self._alarm_pin = alarm_pin
-        self._remote_mode = self._host == MEDIATION_URL
+        # The configured host comes first; the standby host (usually the
+        # mediation server) is used when it is down or much slower.
+        self._paths = [ConnectionPath(host)]
+        if standby_host and standby_host != host:
+            self._paths.append(ConnectionPath(standby_host))
+        self._path = self._paths[0]
         self._connection: ClientWebSocketResponse | None = None
-        self._connection_ready = False
+        self._websocket_ready = False
+        # Set while moving to a faster path: listeners keep the gateway online.
+        self._switching_path = False
         self._connection_lock = asyncio.Lock()
         self._initialising_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
         self.event_callback = event_callback
+        self.connection_callback = connection_callback
+        """Called with the new state when the websocket becomes usable or not."""
         # Some devices (like Tywatt) need polling
         self.poll_device_urls_1s = []
         self.poll_device_urls_5m = []
         self.current_poll_index = 0
         self.pending_pings = 0
-
-        if self._remote_mode:
-            LOGGER.info("Configure remote mode (%s)", self._host)
-            self._cmd_prefix = b"\x02"
-            self._ping_timeout = TIMEOUT_PING
-        else:
-            LOGGER.info("Configure local mode (%s)", self._host)
-            self._cmd_prefix = b""
-            self._ping_timeout = None
+        # Slider drags send bursts of writes: keep only the latest value per
+        # attribute while the previous one is on the wire.
+        self._command_coalesce_window = command_coalesce_window
+        self._coalesced_commands: dict[tuple, CoalescedCommand] = {}
+        # Writes only wait for their acknowledgement once the gateway has
+        # shown it sends them; older firmwares only confirm by push.
+        self._command_acks_seen = False
+        # A single writer task owns the websocket and always sends the most
+        # urgent queued frame next.
+        self._send_queues: dict[SendPriority, asyncio.Queue] = {
+            priority: asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+            for priority in SendPriority
+        }
+        self._send_ready = asyncio.Event()
+        self._writer_task: asyncio.Task | None = None
+        # Busy gateways answer slowly and end up dropping the connection:
+        # keep the overall request rate within a budget.
+        self._request_budget = RequestBudget(request_rate, request_burst)
+        self.flight_recorder = FlightRecorder(flight_recorder_size)
+        # One HTTP session per client: reconnects reuse its connection pool.
+        self._session: ClientSession | None = None
+        self.connect_timings: dict[str, float] = {}
+        """Durations (seconds) of the phases of the last websocket connection."""
 
         self._message_handler = MessageHandler(
-            tydom_client=self, cmd_prefix=self._cmd_prefix
+            tydom_client=self,
+            cmd_prefix=b"\x02" if self._path.remote else b"",
+            max_in_flight=max_in_flight,
         )
+        self._use_path(self._path)
 
         # Reconnection parameters with exponential backoff
         self._reconnect_attempts = 0
@@ -176,6 +555,50 @@ class TydomClient:
         ] = {}  # endpoint -> (timestamp, is_valid)
         self._metadata_cache_ttl = 3600.0  # 1 hour in seconds
 
+    @property
+    def _connection_ready(self) -> bool:
+        """Whether the active websocket is initialised and usable."""
+        return self._websocket_ready
+
+    @_connection_ready.setter
+    def _connection_ready(self, ready: bool) -> None:
+        if ready == self._websocket_ready:
+            return
+        self._websocket_ready = ready
+        if self._switching_path:
+            self._switching_path = not ready
+            return
+        if self.connection_callback is not None:
+            self.connection_callback(ready)
+
+    def _use_path(self, path: ConnectionPath) -> None:
+        """Frame the next connection and its messages for a path."""
+        self._path = path
+        self._host = path.host
+        self._remote_mode = path.remote
+        if self._remote_mode:
+            LOGGER.info("Configure remote mode (%s)", self._host)
+            self._cmd_prefix = b"\x02"
+            self._ping_timeout = TIMEOUT_PING
+        else:
+            LOGGER.info("Configure local mode (%s)", self._host)
+            self._cmd_prefix = b""
+            self._ping_timeout = None
+        self._message_handler.cmd_prefix = self._cmd_prefix
+
+    @property
+    def paths(self) -> list[dict]:
+        """State of the connection paths, active one first."""
+        return [
+            {
+                "host": path.host,
+                "active": path is self._path,
+                "rtt": path.rtt,
+                "failures": path.failures,
+            }
+            for path in sorted(self._paths, key=lambda path: path is not self._path)
+        ]
+
     def update_config(self, zone_home: str, zone_away: str, zone_night: str):
         """Update zones configuration."""
         self._zone_home = zone_home
@@ -281,6 +704,56 @@ class TydomClient:
                 "Something really wrong happened!"
             ) from exception
 
+    def _get_session(self) -> ClientSession:
+        """Return the HTTP session of the client, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = async_create_clientsession(self._hass, False)
+        return self._session
+
+    async def _request_nonce(
+        self, session: ClientSession, host: str, sslcontext: ssl.SSLContext
+    ) -> str:
+        """Request the digest challenge of a host and return its nonce."""
+        http_headers = {
+            "Connection": "Upgrade",
+            "Upgrade": "websocket",
+            "Host": host + ":443",
+            "Accept": "*/*",
+            "Sec-WebSocket-Key": self.generate_random_key(),
+            "Sec-WebSocket-Version": "13",
+        }
+        # Leaving the context releases the connection to the session pool, so
+        # the websocket can reuse it when the gateway keeps it alive.
+        async with session.request(
+            method="GET",
+            url=f"https://{host}:443/mediation/client?mac={self._mac}&appli=1",
+            headers=http_headers,
+            json=None,
+            proxy=proxy,
+            ssl=sslcontext,
+        ) as response:
+            LOGGER.debug(
+                "response status : %s\nheaders : %s\ncontent : %s",
+                response.status,
+                response.headers,
+                await response.text(),
+            )
+            www_authenticate = response.headers.get("WWW-Authenticate")
+
+        if www_authenticate is None:
+            raise TydomClientApiClientError("Could't find WWW-Authenticate header")
+
+        re_matcher = re.match(
+            '.*nonce="([a-zA-Z0-9+=]+)".*',
+            www_authenticate,
+        )
+
+        if re_matcher:
+            pass
+        else:
+            raise TydomClientApiClientError("Could't find auth nonce")
+        return re_matcher.group(1)
+
     async def async_connect(self) -> ClientWebSocketResponse:
         """Connect to the Tydom API."""
         global file_lines, file_mode, file_name
@@ -295,70 +768,18 @@ class TydomClient:
             # This should not happen in production, but we need to satisfy the type checker
             raise RuntimeError("File mode not supported for async_connect")
 
-        http_headers = {
-            "Connection": "Upgrade",
-            "Upgrade": "websocket",
-            "Host": self._host + ":443",
-            "Accept": "*/*",
-            "Sec-WebSocket-Key": self.generate_random_key(),
-            "Sec-WebSocket-Version": "13",
-        }
-
-        # - Wrap slow blocking call flagged by HA
-        sslcontext = await asyncio.to_thread(ssl.create_default_context)
-        sslcontext.options |= 0x4  # OP_LEGACY_SERVER_CONNECT
-        if self._host == MEDIATION_URL:
-            # Cloud mode: enforce TLS verification against the public CA chain
-            sslcontext.check_hostname = True
-            sslcontext.verify_mode = ssl.CERT_REQUIRED
-        else:
-            # Local mode: Tydom gateway uses a self-signed certificate
-            sslcontext.check_hostname = False
-            sslcontext.verify_mode = ssl.CERT_NONE
-
-        session = async_create_clientsession(self._hass, False)
+        started = time.monotonic()
+        sslcontext = await _get_ssl_context(self._host == MEDIATION_URL)
+        session = self._get_session()
 
         try:
             # Digest handshake can be very slow on busy local gateways (tydom2mqtt
             # applies no timeout to the equivalent HTTP step).
             async with async_timeout.timeout(TIMEOUT_LONG_REQUEST):
-                response = await session.request(
-                    method="GET",
-                    url=f"https://{self._host}:443/mediation/client?mac={self._mac}&appli=1",
-                    headers=http_headers,
-                    json=None,
-                    proxy=proxy,
-                    ssl=sslcontext,
-                )
-                LOGGER.debug(
-                    "response status : %s\nheaders : %s\ncontent : %s",
-                    response.status,
-                    response.headers,
-                    await response.text(),
-                )
-
-                www_authenticate = response.headers.get("WWW-Authenticate")
-                if www_authenticate is None:
-                    response.close()
-                    raise TydomClientApiClientError(
-                        "Could't find WWW-Authenticate header"
-                    )
-
-                re_matcher = re.match(
-                    '.*nonce="([a-zA-Z0-9+=]+)".*',
-                    www_authenticate,
-                )
-                response.close()
-
-                if re_matcher:
-                    pass
-                else:
-                    raise TydomClientApiClientError("Could't find auth nonce")
-
-                ws_headers = {
-                    "Authorization": self.build_digest_headers(re_matcher.group(1))
-                }
+                nonce = await self._request_nonce(session, self._host, sslcontext)
+                ws_headers = {"Authorization": self.build_digest_headers(nonce)}
 
+            handshake = time.monotonic()
             connection = await session.ws_connect(
                 method="GET",
                 url=f"wss://{self._host}:443/mediation/client?mac={self._mac}&appli=1",
@@ -371,6 +792,17 @@ class TydomClient:
                 proxy=proxy,
                 ssl=sslcontext,
             )
+            connected = time.monotonic()
+            self.connect_timings = {
+                "handshake": handshake - started,
+                "websocket": connected - handshake,
+                "total": connected - started,
+            }
+            LOGGER.debug(
+                "Websocket connected in %.3f s (digest handshake %.3f s)",
+                connected - started,
+                handshake - started,
+            )
 
             return connection
 
@@ -392,6 +824,7 @@ class TydomClient:
         """Signal that the client must stop reconnecting and using the socket."""
         self._shutting_down = True
         self._shutdown_event.set()
+        self._send_ready.set()
 
     async def _wait_or_shutdown(self, delay: float) -> bool:
         """Wait for a delay and return whether shutdown interrupted the wait."""
@@ -425,6 +858,84 @@ class TydomClient:
             and self._connection_ready
         )
 
+    async def _connect_fastest_path(self) -> ClientWebSocketResponse:
+        """Connect through the fastest working path, failing over to the others."""
+        paths = sorted(self._paths, key=ConnectionPath.sort_key)
+        for index, path in enumerate(paths):
+            if path is not self._path:
+                self._use_path(path)
+            try:
+                connection = await self.async_connect()
+            except TydomClientApiClientError as exception:
+                path.failures += 1
+                if index == len(paths) - 1:
+                    raise
+                LOGGER.warning(
+                    "Tydom unreachable through %s (%s), trying %s",
+                    path.host,
+                    exception,
+                    paths[index + 1].host,
+                )
+                continue
+            handshake = self.connect_timings.get("handshake")
+            if handshake is not None:
+                path.record_rtt(handshake)
+            else:
+                path.failures = 0
+            return connection
+        raise TydomClientApiClientCommunicationError("No connection path configured")
+
+    async def probe_standby_paths(self) -> None:
+        """Measure the standby paths and move to a much faster one.
+
+        Probing only requests the digest challenge, which also keeps the TLS
+        connection of the standby path warm in the session pool. Messages are
+        routed through one path at a time: moving to another one reconnects,
+        and devices and entities are kept.
+        """
+        if len(self._paths) < 2 or file_mode or self._shutting_down:
+            return
+        session = self._get_session()
+        for path in self._paths:
+            if path is self._path:
+                continue
+            sslcontext = await _get_ssl_context(path.remote)
+            started = time.monotonic()
+            try:
+                async with async_timeout.timeout(TIMEOUT_NORMAL_REQUEST):
+                    await self._request_nonce(session, path.host, sslcontext)
+            except (
+                TimeoutError,
+                aiohttp.ClientError,
+                socket.gaierror,
+                TydomClientApiClientError,
+            ) as exception:
+                path.failures += 1
+                LOGGER.debug("Standby path %s unavailable: %s", path.host, exception)
+                continue
+            path.record_rtt(time.monotonic() - started)
+
+        active = self._path
+        best = min(self._paths, key=ConnectionPath.sort_key)
+        if best is active or best.rtt is None:
+            return
+        if (
+            active.failures == 0
+            and active.rtt is not None
+            and best.rtt > active.rtt * _PATH_SWITCH_RATIO
+        ):
+            return
+        LOGGER.info(
+            "Switching Tydom connection from %s to %s (%.3f s < %s s)",
+            active.host,
+            best.host,
+            best.rtt,
+            "?" if active.rtt is None else f"{active.rtt:.3f}",
+        )
+        # The reader reconnects through the fastest path.
+        self._switching_path = True
+        self._connection_ready = False
+
     async def _connect_and_initialise_locked(self) -> ClientWebSocketResponse:
         """Create and initialise the sole active websocket while holding the lock."""
         previous = self._connection
@@ -435,7 +946,7 @@ class TydomClient:
         candidate: ClientWebSocketResponse | None = None
         initialising_task = asyncio.current_task()
         try:
-            candidate = await self.async_connect()
+            candidate = await self._connect_fastest_path()
             self._connection = candidate
             self._initialising_task = initialising_task
             await self._initialise_connection(candidate)
@@ -443,6 +954,11 @@ class TydomClient:
             if self._connection is candidate:
                 self._connection = None
             self._connection_ready = False
+            if self._switching_path:
+                # The switch hid the reconnection; report the outage now.
+                self._switching_path = False
+                if self.connection_callback is not None:
+                    self.connection_callback(False)
             await self._safe_close_connection(candidate)
             raise
         finally:
@@ -474,6 +990,9 @@ class TydomClient:
             self._connection = None
             self._connection_ready = False
             await self._safe_close_connection(connection)
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
 
     async def _initialise_connection(self, connection: ClientWebSocketResponse) -> None:
         """Send initial requests on the active candidate websocket."""
@@ -489,6 +1008,7 @@ class TydomClient:
             raise TydomClientApiClientCommunicationError(
                 "Cannot initialise a websocket that is not the active candidate"
             )
+        self._message_handler.start_bootstrap()
         await self.ping()
         if self._shutting_down:
             return
@@ -615,15 +1135,16 @@ class TydomClient:
                 )
                 incoming_bytes_str = incoming.encode("utf-8")
                 file_index += 1
-                sanitized_msg = sanitize_log_message(
-                    incoming_bytes_str.decode("utf-8", errors="replace"), self._password
-                )
-                LOGGER.info("Incomming message - message : %s", sanitized_msg)
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug(
+                        "Incoming message - message : %s",
+                        LogFrame(incoming_bytes_str, self._password),
+                    )
             else:
                 await asyncio.sleep(10)
                 return None
             await asyncio.sleep(1)
-            return await self._message_handler.route_response(incoming_bytes_str)
+            return await self._route_recorded(incoming_bytes_str)
         try:
             if self._shutting_down:
                 return None
@@ -646,16 +1167,13 @@ class TydomClient:
                 return None
 
             msg = await connection.receive()
-            # Masquer les informations sensibles dans les messages entrants
-            msg_data_str = (
-                msg.data.decode("utf-8", errors="replace")
-                if isinstance(msg.data, bytes)
-                else str(msg.data)
-            )
-            sanitized_msg = sanitize_log_message(msg_data_str, self._password)
-            LOGGER.info(
-                "Incoming message - type : %s - message : %s", msg.type, sanitized_msg
-            )
+            # Frames are only decoded and redacted when debug logging is on.
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Incoming message - type : %s - message : %s",
+                    msg.type,
+                    LogFrame(msg.data, self._password),
+                )
 
             if (
                 msg.type == WSMsgType.CLOSE
@@ -673,7 +1191,7 @@ class TydomClient:
 
             incoming_bytes_str = cast(bytes, msg.data)
 
-            return await self._message_handler.route_response(incoming_bytes_str)
+            return await self._route_recorded(incoming_bytes_str)
 
         except asyncio.CancelledError:
             raise
@@ -682,32 +1200,90 @@ class TydomClient:
             LOGGER.exception("Unable to handle message")
             return None
 
+    def export_flight_recorder(self) -> dict:
+        """Return the recorded frames, redacted, for diagnostics."""
+        # The alarm PIN is masked by the "pwd" patterns; as a short literal
+        # it would also mask unrelated digits.
+        secrets = (self._password, self._mac)
+        return {
+            "frames": self.flight_recorder.export(secrets),
+            "traces": self.flight_recorder.export_traces(secrets),
+        }
+
+    @property
+    def catalog(self) -> "DeviceCatalog":
+        """Devices, groups and scenarios configured on the gateway."""
+        return self._message_handler.catalog
+
+    @property
+    def bootstrap_timings(self) -> dict[str, float]:
+        """Seconds between connection setup and the first reply of each request."""
+        return self._message_handler.bootstrap_timings
+
+    @property
+    def endpoint_data_stats(self) -> dict[str, int]:
+        """Endpoints of /devices/data skipped as unchanged, and parsed."""
+        return self._message_handler.endpoint_data_stats
+
+    def pop_removed_endpoints(self) -> list[str]:
+        """Return the endpoints removed from the configuration since last call."""
+        removed = self._message_handler.removed_endpoints
+        self._message_handler.removed_endpoints = []
+        return removed
+
+    def export_snapshot(self) -> dict:
+        """Return the device catalogue and last known states for a warm start."""
+        return self._message_handler.export_snapshot()
+
+    async def restore_snapshot(self, snapshot: dict) -> list["TydomDevice"]:
+        """Rebuild devices from a snapshot saved by a previous run."""
+        return await self._message_handler.restore_snapshot(snapshot)
+
+    async def _route_recorded(self, frame: bytes) -> list["TydomDevice"] | None:
+        """Route an incoming frame and keep it in the flight recorder."""
+        # Routing may move to another path: keep the prefix of this frame.
+        cmd_prefix = self._cmd_prefix
+        started = time.perf_counter()
+        try:
+            return await self._message_handler.route_response(frame)
+        finally:
+            self.flight_recorder.record(
+                frame,
+                outgoing=False,
+                parse_duration=time.perf_counter() - started,
+                cmd_prefix=cmd_prefix,
+            )
+
     def receive_pong(self) -> None:
         """Handle a pong response and keep the pending ping counter non-negative."""
         self.pending_pings = max(0, self.pending_pings - 1)
 
     def build_digest_headers(self, nonce):
         """Build the headers of Digest Authentication."""
-        digest_auth = HTTPDigestAuth(self._mac, self._password)
-        chal = {}
-        chal["nonce"] = nonce
-        chal["realm"] = (
-            "ServiceMedia" if self._remote_mode is True else "protected area"
-        )
-        chal["qop"] = "auth"
-        digest_auth._thread_local.chal = chal
-        digest_auth._thread_local.last_nonce = nonce
-        digest_auth._thread_local.nonce_count = 1
-        digest = digest_auth.build_digest_header(
+        return build_digest_authorization(
+            self._mac,
+            self._password,
+            "ServiceMedia" if self._remote_mode is True else "protected area",
             "GET",
-            f"https://{self._host}:443/mediation/client?mac={self._mac}&appli=1",
+            f"/mediation/client?mac={self._mac}&appli=1",
+            nonce,
         )
-        return digest
+
+    @staticmethod
+    def set_send_priority(priority: SendPriority) -> None:
+        """Send the frames of the current task with the given priority.
+
+        Tasks created afterwards by the current task inherit the priority.
+        """
+        _send_priority.set(priority)
 
     async def send_bytes(
         self, a_bytes: bytes, max_retries: int = 3, retry_delay: float = 1.0
     ) -> None:
-        """Send bytes to connection with intelligent retry mechanism.
+        """Queue bytes for the writer task and wait until they are sent.
+
+        Frames are sent by priority class (see set_send_priority), oldest first
+        within a class. A full class queue makes its producers wait.
 
         Args:
             a_bytes: Bytes to send
@@ -721,6 +1297,93 @@ class TydomClient:
         if self._shutting_down:
             raise asyncio.CancelledError()
 
+        if asyncio.current_task() is self._initialising_task:
+            # Initialisation owns the connection lock and the candidate socket;
+            # every other writer is waiting for it to finish.
+            if await self._spend_request_budget():
+                raise asyncio.CancelledError()
+            await self._write_bytes(a_bytes, max_retries, retry_delay)
+            return
+
+        sent = asyncio.get_running_loop().create_future()
+        await self._send_queues[_send_priority.get()].put(
+            (a_bytes, max_retries, retry_delay, sent)
+        )
+        self._send_ready.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(
+                self._write_queued_frames(), name="Tydom writer"
+            )
+        await sent
+
+    async def _write_queued_frames(self) -> None:
+        """Send queued frames, most urgent class first, until shutdown."""
+        try:
+            while not self._shutting_down:
+                queue = next(
+                    (q for q in self._send_queues.values() if not q.empty()), None
+                )
+                if queue is None:
+                    self._send_ready.clear()
+                    await self._send_ready.wait()
+                    continue
+
+                if await self._spend_request_budget():
+                    break
+                # A more urgent frame may have been queued while waiting.
+                queue = next(q for q in self._send_queues.values() if not q.empty())
+                a_bytes, max_retries, retry_delay, sent = queue.get_nowait()
+                if sent.done():
+                    # The caller gave up (cancelled) while the frame was queued.
+                    continue
+                try:
+                    await self._write_bytes(a_bytes, max_retries, retry_delay)
+                except asyncio.CancelledError:
+                    sent.cancel()
+                    raise
+                except Exception as e:
+                    if not sent.done():
+                        sent.set_exception(e)
+                else:
+                    if not sent.done():
+                        sent.set_result(None)
+        finally:
+            for queue in self._send_queues.values():
+                while not queue.empty():
+                    queue.get_nowait()[3].cancel()
+
+    async def _spend_request_budget(self) -> bool:
+        """Wait until the request budget allows one more frame.
+
+        Returns:
+            True if shutdown interrupted the wait.
+
+        """
+        delay = self._request_budget.take()
+        if delay <= 0:
+            return False
+        LOGGER.debug("Request budget exhausted, deferring request by %.2fs", delay)
+        return await self._wait_or_shutdown(delay)
+
+    @property
+    def requests_deferred(self) -> int:
+        """Return how many requests were delayed by the request budget."""
+        return self._request_budget.deferred
+
+    async def _write_bytes(
+        self, a_bytes: bytes, max_retries: int = 3, retry_delay: float = 1.0
+    ) -> None:
+        """Send bytes to connection with intelligent retry mechanism.
+
+        Args:
+            a_bytes: Bytes to send
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries (exponential backoff)
+
+        """
+        if self._shutting_down:
+            raise asyncio.CancelledError()
+
         last_exception: Exception | None = None
         for attempt in range(max_retries + 1):
             initialising = asyncio.current_task() is self._initialising_task
@@ -740,6 +1403,9 @@ class TydomClient:
 
             try:
                 await connection.send_bytes(a_bytes)
+                self.flight_recorder.record(
+                    a_bytes, outgoing=True, cmd_prefix=self._cmd_prefix
+                )
                 if attempt > 0:
                     LOGGER.info(
                         "Successfully sent message after %d retry attempt(s)",
@@ -803,15 +1469,8 @@ class TydomClient:
 
     async def send_message(self, method, msg):
         """Send Generic message to Tydom."""
-        # Transaction ID is currently the current time in ms
-        transaction_id = str(time.time_ns())[:13]
-        message = (
-            method
-            + " "
-            + msg
-            + f" HTTP/1.1\r\nContent-Length: 0\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: {transaction_id}\r\n\r\n"
-        )
-        a_bytes = self._cmd_prefix + bytes(message, "ascii")
+        transaction_id = self._message_handler.next_transaction_id()
+        a_bytes = self._cmd_prefix + encode_request(method, msg, transaction_id)
         LOGGER.debug(
             "Sending message to tydom (%s %s)",
             method,
@@ -870,65 +1529,59 @@ class TydomClient:
             TydomClientApiClientCommunicationError: If timeout or communication error occurs
 
         """
-        event = asyncio.Event()
         # Some official TYXAL configuration endpoints carry the alarm PIN in
         # the query string.  Always redact sensitive query parameters before
         # the URL reaches a log message or an exception.
         safe_url = sanitize_log_message(url)
 
-        transaction_id, request = self._message_handler.prepare_request(
-            method, url, body, headers, reply_event=event
-        )
-
-        try:
-            await self.send_bytes(request)
-        except Exception as e:
-            LOGGER.error(
-                "Failed to send request %s %s: %s",
-                method,
-                safe_url,
-                str(e),
-                exc_info=True,
-            )
-            raise TydomClientApiClientCommunicationError(
-                f"Failed to send request {method} {safe_url}: {str(e)}"
-            ) from e
-
-        # Wait for the reply with timeout
-        try:
-            async with async_timeout.timeout(timeout):
-                await event.wait()
-        except TimeoutError:
-            LOGGER.warning(
-                "Timeout waiting for reply to %s %s (transaction_id: %s, timeout: %.1fs)",
-                method,
-                safe_url,
-                transaction_id,
-                timeout,
-            )
-            # Remove the pending reply to avoid memory leak
-            self._message_handler.remove_reply(transaction_id)
-            raise TydomClientApiClientCommunicationError(
-                f"Timeout waiting for reply to {method} {safe_url}"
+        # The window bounds how many replies the gateway has to interleave on
+        # the single websocket; extra callers wait for a free slot.
+        async with self._message_handler.in_flight_window:
+            transaction_id, request = self._message_handler.prepare_request(
+                method, url, body, headers
             )
+            reply_future = self._message_handler.register_reply(transaction_id, timeout)
 
-        if error := self._message_handler.get_reply_error(transaction_id):
-            raise TydomClientApiClientCommunicationError(
-                f"Request {method} {safe_url} failed: {error}"
-            )
-
-        reply = self._message_handler.get_reply(transaction_id)
+            try:
+                await self.send_bytes(request)
+            except Exception as e:
+                self._message_handler.remove_reply(transaction_id)
+                LOGGER.error(
+                    "Failed to send request %s %s: %s",
+                    method,
+                    safe_url,
+                    str(e),
+                    exc_info=True,
+                )
+                raise TydomClientApiClientCommunicationError(
+                    f"Failed to send request {method} {safe_url}: {str(e)}"
+                ) from e
 
-        if reply is None:
-            LOGGER.warning(
-                "No reply received for %s %s (transaction_id: %s)",
-                method,
-                safe_url,
-                transaction_id,
-            )
-            return None
+            started = time.monotonic()
+            try:
+                reply = await reply_future
+                self._request_budget.record_latency(time.monotonic() - started)
+            except TimeoutError:
+                self._request_budget.record_latency(timeout)
+                LOGGER.warning(
+                    "Timeout waiting for reply to %s %s (transaction_id: %s, timeout: %.1fs)",
+                    method,
+                    safe_url,
+                    transaction_id,
+                    timeout,
+                )
+                raise TydomClientApiClientCommunicationError(
+                    f"Timeout waiting for reply to {method} {safe_url}"
+                ) from None
+            except ReplyError as e:
+                raise TydomClientApiClientCommunicationError(
+                    f"Request {method} {safe_url} failed: {e}"
+                ) from None
+            except asyncio.CancelledError:
+                self._message_handler.remove_reply(transaction_id)
+                raise
 
-        return reply["events"] if reply else None
+        return reply["events"]
 
     # ########################
     # Utils methods
@@ -1049,6 +1702,7 @@ class TydomClient:
         """List the devices to get the endpoint id."""
         msg_type = "/configs/file"
         req = "GET"
+        self._message_handler.expect_configs_file()
         await self.send_message(method=req, msg=msg_type)
 
     async def get_devices_cmeta(self, force_refresh: bool = False):
@@ -1136,8 +1790,9 @@ class TydomClient:
         """Give order to endpoint."""
         # 10 here is the endpoint = the device (shutter in this case) to open.
         safe_device_id = quote(str(id), safe="")
-        str_request = f"GET /devices/{safe_device_id}/endpoints/{safe_device_id}/data HTTP/1.1\r\nContent-Length: 0\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-        a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
+        a_bytes = self._cmd_prefix + encode_request(
+            "GET", f"/devices/{safe_device_id}/endpoints/{safe_device_id}/data", "0"
+        )
         LOGGER.debug("Sending message to tydom (%s)", "GET device data")
         if not file_mode:
             await self.send_bytes(a_bytes)
@@ -1200,14 +1855,9 @@ class TydomClient:
         body = json.dumps(suspend_data)
 
         path = f"/moments/{moment_id}"
-        str_request = (
-            f"PUT {path} HTTP/1.1\r\nContent-Length: "
-            + str(len(body))
-            + "\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-            + body
-            + "\r\n\r\n"
+        a_bytes = self._cmd_prefix + encode_request(
+            "PUT", path, "0", body.encode("ascii")
         )
-        a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
 
         STRUCTURED_LOGGER.api_request(
             "debug", "PUT", path, moment_id=str(moment_id), suspend_to=suspend_to
@@ -1293,7 +1943,7 @@ class TydomClient:
         name,
         value,
         max_retries: int = 2,
-    ):
+    ) -> CommandResult:
         """Give order (name + value) to endpoint with retry mechanism.
 
         Args:
@@ -1303,6 +1953,9 @@ class TydomClient:
             value: Attribute value
             max_retries: Maximum number of retry attempts (default: 2)
 
+        Returns:
+            The command outcome: acknowledgement latency and gateway error
+
         Raises:
             TydomClientApiClientCommunicationError: If all retry attempts fail
 
@@ -1314,14 +1967,7 @@ class TydomClient:
         safe_endpoint_id = quote(str(endpoint_id), safe="")
         # endpoint_id is the endpoint = the device (shutter in this case) to
         # open.
-        str_request = (
-            f"PUT /devices/{safe_device_id}/endpoints/{safe_endpoint_id}/data HTTP/1.1\r\nContent-Length: "
-            + str(len(body))
-            + "\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-            + body
-            + "\r\n\r\n"
-        )
-        a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
+        url = f"/devices/{safe_device_id}/endpoints/{safe_endpoint_id}/data"
 
         # Log the command (masking sensitive data)
         log_value = (
@@ -1337,7 +1983,10 @@ class TydomClient:
 
         # Send with retry mechanism
         try:
-            await self.send_bytes(a_bytes, max_retries=max_retries)
+            return await self._coalesce_command(
+                ("devices", str(device_id), str(endpoint_id), name),
+                partial(self._send_command, "PUT", url, body, max_retries),
+            )
         except TydomClientApiClientCommunicationError as e:
             LOGGER.error(
                 "Failed to send command after retries: device_id=%s, endpoint_id=%s, name=%s, value=%s, error=%s",
@@ -1348,51 +1997,218 @@ class TydomClient:
                 str(e),
             )
             raise
-        LOGGER.debug("Sending message to tydom (%s)", "PUT device data")
-        return 0
 
-    async def put_home_hvac_mode(self, mode: str) -> int:
+    async def put_home_hvac_mode(self, mode: str) -> CommandResult:
         """Set the zone-level HVAC direction (STOP / HEATING / COOLING).
 
         Tydom broadcasts the result to all thermostats via per-device
         authorization updates. Per-thermostat hvacMode writes are ignored.
         """
         body = json.dumps({"mode": mode})
-        str_request = (
-            "PUT /home/hvac/data HTTP/1.1\r\nContent-Length: "
-            + str(len(body))
-            + "\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-            + body
-            + "\r\n\r\n"
-        )
-        a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
         LOGGER.debug("Sending message to tydom (PUT home hvac data %s)", mode)
-        if not file_mode:
-            await self.send_bytes(a_bytes)
-        return 0
+        return await self._send_command("PUT", "/home/hvac/data", body)
 
-    async def put_area_data(self, area_id, name, value, max_retries: int = 2) -> int:
+    async def put_area_data(
+        self, area_id, name, value, max_retries: int = 2
+    ) -> CommandResult:
         """Set one attribute on an area-backed device."""
         body = json.dumps([{"name": name, "value": value}])
         safe_area_id = quote(str(area_id), safe="")
-        path = f"/areas/{safe_area_id}/data"
-        str_request = (
-            f"PUT {path} HTTP/1.1\r\nContent-Length: "
-            + str(len(body))
-            + "\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-            + body
-            + "\r\n\r\n"
-        )
-        a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
         LOGGER.debug(
             "Sending area command: area_id=%s, name=%s, value=%s",
             area_id,
             name,
             value,
         )
-        if not file_mode:
-            await self.send_bytes(a_bytes, max_retries=max_retries)
-        return 0
+        return await self._coalesce_command(
+            ("areas", str(area_id), name),
+            partial(
+                self._send_command,
+                "PUT",
+                f"/areas/{safe_area_id}/data",
+                body,
+                max_retries,
+            ),
+        )
+
+    async def _coalesce_command(
+        self, key: tuple, send: "Callable[[], Awaitable[CommandResult]]"
+    ) -> CommandResult:
+        """Send a write, merging it with other writes of the same attribute.
+
+        The first write goes out immediately. Writes arriving while it is in
+        flight, or within the coalescing window after it, replace each other:
+        only the latest value is sent and every superseded caller receives
+        that final outcome.
+
+        Args:
+            key: Target attribute, e.g. ("devices", device_id, endpoint_id, name)
+            send: Sends this caller's value
+
+        Returns:
+            The outcome of the write that carried the final value.
+
+        """
+        if self._command_coalesce_window <= 0:
+            return await send()
+
+        waiter = asyncio.get_running_loop().create_future()
+        command = self._coalesced_commands.get(key)
+        if command is None:
+            command = self._coalesced_commands[key] = CoalescedCommand()
+            command.task = asyncio.create_task(
+                self._drain_coalesced_commands(key, command)
+            )
+        elif command.waiters:
+            LOGGER.debug("Coalescing command %s with a newer value", key)
+        command.send = send
+        command.waiters.append(waiter)
+        return await waiter
+
+    async def _drain_coalesced_commands(
+        self, key: tuple, command: CoalescedCommand
+    ) -> None:
+        """Send the latest queued value of one attribute until none is left."""
+        try:
+            while command.waiters and command.send is not None:
+                waiters, command.waiters = command.waiters, []
+                try:
+                    result = await command.send()
+                except asyncio.CancelledError:
+                    for waiter in waiters:
+                        waiter.cancel()
+                    raise
+                except Exception as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+                await asyncio.sleep(self._command_coalesce_window)
+        finally:
+            self._coalesced_commands.pop(key, None)
+            for waiter in command.waiters:
+                waiter.cancel()
+
+    async def _send_command(
+        self, method: str, url: str, body: str, max_retries: int = 3
+    ) -> CommandResult:
+        """Send a write command and wait for the gateway acknowledgement.
+
+        A missing acknowledgement is not an error: older firmwares may only
+        confirm through a data push, so the caller gets a result flagged
+        "timeout" and can fall back to polling. Until this gateway has sent an
+        acknowledgement, the command returns once the frame is sent with a
+        pending result: the acknowledgement sets its latency and error in the
+        background, see ``CommandResult.wait_acknowledgement``.
+
+        Args:
+            method: Request method
+            url: Request URL
+            body: JSON request body
+            max_retries: Maximum number of send retry attempts
+
+        Returns:
+            The command outcome with its round-trip latency.
+
+        Raises:
+            TydomClientApiClientCommunicationError: If the command cannot be sent
+
+        """
+        async with self._message_handler.in_flight_window:
+            transaction_id, request = self._message_handler.prepare_request(
+                method,
+                url,
+                body.encode("ascii"),
+                {"Content-Type": "application/json; charset=UTF-8"},
+            )
+            if file_mode:
+                return CommandResult(transaction_id, 0.0)
+
+            reply_future = self._message_handler.register_reply(
+                transaction_id, TIMEOUT_COMMAND_ACK
+            )
+            started = time.monotonic()
+            try:
+                await self.send_bytes(
+                    self._cmd_prefix + request, max_retries=max_retries
+                )
+                # Measure the gateway, not the time spent in the send queues.
+                started = time.monotonic()
+                if not self._command_acks_seen:
+                    result = CommandResult(
+                        transaction_id,
+                        0.0,
+                        pending=True,
+                        settled=asyncio.get_running_loop().create_future(),
+                    )
+                    reply_future.add_done_callback(
+                        partial(
+                            self._command_acknowledged, method, url, result, started
+                        )
+                    )
+                    return result
+                await reply_future
+                error = None
+            except TimeoutError:
+                error = "timeout"
+            except ReplyError as e:
+                error = str(e)
+            except BaseException:
+                self._message_handler.remove_reply(transaction_id)
+                raise
+
+        return self._record_command_result(
+            method,
+            url,
+            CommandResult(transaction_id, time.monotonic() - started, error),
+        )
+
+    def _record_command_result(
+        self, method: str, url: str, result: CommandResult
+    ) -> CommandResult:
+        """Account for and log the acknowledgement of a write command."""
+        if result.error is None:
+            self._command_acks_seen = True
+            self._request_budget.record_latency(result.latency)
+        STRUCTURED_LOGGER.api_request(
+            "debug" if result.error is None else "warning",
+            method,
+            url,
+            transaction_id=result.transaction_id,
+            duration=f"{result.latency:.3f}s",
+            error=result.error,
+        )
+        return result
+
+    def _command_acknowledged(
+        self,
+        method: str,
+        url: str,
+        result: CommandResult,
+        started: float,
+        reply_future: asyncio.Future,
+    ) -> None:
+        """Complete the pending result of a command that did not wait for it."""
+        result.latency = time.monotonic() - started
+        result.pending = False
+        if reply_future.cancelled():
+            result.error = "cancelled"
+        else:
+            error = reply_future.exception()
+            if isinstance(error, TimeoutError):
+                result.error = "timeout"
+            elif error is not None:
+                result.error = str(error)
+            self._record_command_result(method, url, result)
+        if result.settled is not None and not result.settled.done():
+            result.settled.set_result(result)
+
+    def confirms_by_push(self, device_id, endpoint_id) -> bool:
+        """Return whether an endpoint reports its state changes by push."""
+        return f"{endpoint_id}_{device_id}" in self._message_handler.pushed_endpoints
 
     async def put_devices_data_validated(
         self,
@@ -1427,7 +2243,7 @@ class TydomClient:
             max_retries: Maximum number of retry attempts (default: 2)
 
         Returns:
-            0 on success
+            The command outcome (see put_devices_data)
 
         Raises:
             ValueError: If validation fails (with descriptive error message)
@@ -1436,16 +2252,7 @@ class TydomClient:
         """
         # Validate value if device is provided
         if device is not None:
-            is_valid, error_msg = validate_value_with_metadata(device, name, value)
-            if not is_valid:
-                LOGGER.error(
-                    "Validation failed for device_id=%s, name=%s, value=%s: %s",
-                    device_id,
-                    name,
-                    value,
-                    error_msg,
-                )
-                raise ValueError(error_msg or f"Valeur invalide pour {name}: {value}")
+            self._validate_command(device, device_id, name, value)
 
         # If validation passed (or device not provided), send the command
         return await self.put_devices_data(
@@ -1456,6 +2263,71 @@ class TydomClient:
             max_retries=max_retries,
         )
 
+    async def put_devices_data_many(
+        self,
+        device_id,
+        endpoint_id,
+        values: dict,
+        device: "TydomDevice | None" = None,
+        max_retries: int = 2,
+    ) -> CommandResult:
+        """Give several orders (name + value) to one endpoint in a single frame.
+
+        The gateway applies the attributes in the order of the values
+        dictionary, so callers can keep the sequence they used to send as
+        separate commands.
+
+        Args:
+            device_id: Device ID
+            endpoint_id: Endpoint ID
+            values: Attribute values by name
+            device: Optional TydomDevice instance for validation (if None, validation is skipped)
+            max_retries: Maximum number of retry attempts (default: 2)
+
+        Returns:
+            The command outcome (see put_devices_data)
+
+        Raises:
+            ValueError: If validation of any value fails (nothing is sent)
+            TydomClientApiClientCommunicationError: If all retry attempts fail
+
+        """
+        if device is not None:
+            for name, value in values.items():
+                self._validate_command(device, device_id, name, value)
+
+        body = json.dumps(
+            [{"name": name, "value": value} for name, value in values.items()]
+        )
+        safe_device_id = quote(str(device_id), safe="")
+        safe_endpoint_id = quote(str(endpoint_id), safe="")
+        LOGGER.debug(
+            "Sending commands: device_id=%s, endpoint_id=%s, names=%s",
+            device_id,
+            endpoint_id,
+            list(values),
+        )
+        return await self._send_command(
+            "PUT",
+            f"/devices/{safe_device_id}/endpoints/{safe_endpoint_id}/data",
+            body,
+            max_retries,
+        )
+
+    @staticmethod
+    def _validate_command(device: "TydomDevice", device_id, name, value) -> None:
+        """Raise ValueError when a value does not match the device metadata."""
+        is_valid, error_msg = validate_value_with_metadata(device, name, value)
+        if not is_valid:
+            LOGGER.error(
+                "Validation failed for device_id=%s, name=%s, value=%s: %s",
+                device_id,
+                name,
+                value,
+                error_msg,
+            )
+            raise ValueError(error_msg or f"Valeur invalide pour {name}: {value}")
+
     async def put_alarm_cdata(
         self,
         device_id,
@@ -1538,15 +2410,13 @@ class TydomClient:
             safe_device_id = quote(str(device_id), safe="")
             safe_endpoint_id = quote(str(endpoint_id), safe="")
             safe_cmd = quote(str(cmd), safe="")
-            str_request = (
-                f"PUT /devices/{safe_device_id}/endpoints/{safe_endpoint_id}/cdata?name={safe_cmd} HTTP/1.1\r\nContent-Length: "
-                + str(len(body))
-                + "\r\nContent-Type: application/json; charset=UTF-8\r\nTransac-Id: 0\r\n\r\n"
-                + body
-                + "\r\n\r\n"
+            a_bytes = self._cmd_prefix + encode_request(
+                "PUT",
+                f"/devices/{safe_device_id}/endpoints/{safe_endpoint_id}"
+                f"/cdata?name={safe_cmd}",
+                "0",
+                body.encode("ascii"),
             )
-
-            a_bytes = self._cmd_prefix + bytes(str_request, "ascii")
             LOGGER.debug("Sending message to tydom (%s)", "PUT cdata")
 
             try:
@@ -1556,13 +2426,7 @@ class TydomClient:
             except BaseException:
                 LOGGER.error("put_alarm_cdata ERROR !", exc_info=True)
                 # Masquer les informations sensibles dans les bytes loggés
-                a_bytes_str = (
-                    a_bytes.decode("utf-8", errors="replace")
-                    if isinstance(a_bytes, bytes)
-                    else str(a_bytes)
-                )
-                sanitized_bytes = sanitize_log_message(a_bytes_str, self._password)
-                LOGGER.error("Request bytes: %s", sanitized_bytes)
+                LOGGER.error("Request bytes: %s", LogFrame(a_bytes, self._password))
         except BaseException:
             LOGGER.error("put_alarm_cdata ERROR !", exc_info=True)
 
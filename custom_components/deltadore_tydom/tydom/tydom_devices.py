@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
@@ -267,6 +268,7 @@ class TydomDevice:
     """represents a generic device."""
 
     _ha_device: Any = None
+    _last_changes: frozenset[str] | None = None
 
     def __init__(
         self,
@@ -287,7 +289,8 @@ class TydomDevice:
         self._type = device_type
         self._endpoint = endpoint
         self._metadata = metadata
-        self._callbacks: set[DeviceCallback] = set()
+        self._callbacks: dict[DeviceCallback, frozenset[str] | None] = {}
+        self._unpublished: set[str] = set()
         if data is not None:
             for key in data:
                 if isinstance(data[key], dict):
@@ -301,13 +304,21 @@ class TydomDevice:
                 else:
                     setattr(self, key, data[key])
 
-    def register_callback(self, callback: DeviceCallback) -> None:
-        """Register callback, called when state changes."""
-        self._callbacks.add(callback)
+    def register_callback(
+        self, callback: DeviceCallback, attributes: Iterable[str] | None = None
+    ) -> None:
+        """Register callback, called when state changes.
+
+        With ``attributes``, the callback is only called when one of them
+        changes. Without, it is called on every change.
+        """
+        self._callbacks[callback] = (
+            frozenset(attributes) if attributes is not None else None
+        )
 
     def remove_callback(self, callback: DeviceCallback) -> None:
         """Remove previously registered callback."""
-        self._callbacks.discard(callback)
+        self._callbacks.pop(callback, None)
 
     @property
     def device_id(self) -> str:
@@ -371,31 +382,81 @@ class TydomDevice:
             return {"battLevel"}
         return set()
 
-    async def update_device(self, device):
-        """Update the device values from another device."""
-        LOGGER.debug("Update device %s", device.device_id)
-        for attribute, value in device.__dict__.items():
+    @property
+    def last_changes(self) -> frozenset[str] | None:
+        """Return the attributes changed by the update being published.
+
+        ``None`` when the update did not say what changed.
+        """
+        return self._last_changes
+
+    async def update_device(self, device) -> set[str]:
+        """Update the device values from another device.
+
+        ``device`` may be this device, to publish the values applied in place
+        by ``apply_data``. Return the attributes whose value changed.
+        Callbacks are only called when something did.
+        """
+        if device is not self:
             # Mettre à jour tous les attributs publics, même s'ils sont None
             # Cela permet de mettre à jour correctement les valeurs qui passent à None
-            if attribute == "_uid" or attribute[:1] != "_":
-                # Ne pas mettre à jour les attributs internes comme _tydom_client, _callbacks, etc.
-                if attribute not in [
-                    "_tydom_client",
-                    "_callbacks",
-                    "_ha_device",
-                    "_metadata",
-                ]:
-                    setattr(self, attribute, value)
-        await self.publish_updates()
-
-    async def publish_updates(self) -> None:
-        """Schedule call all registered callbacks."""
-        for callback in self._callbacks:
+            self.apply_data(
+                {
+                    attribute: value
+                    for attribute, value in device.__dict__.items()
+                    if attribute[:1] != "_" or attribute == "_uid"
+                }
+            )
+        changes, self._unpublished = self._unpublished, set()
+        if changes:
+            LOGGER.debug("Update device %s: %s", self._uid, sorted(changes))
+            await self.publish_updates(changes)
+        return changes
+
+    def apply_data(self, data: dict[str, Any]) -> set[str]:
+        """Set values parsed from the gateway, returning those that changed.
+
+        The changes are published by the next ``update_device`` call.
+        """
+        changes = self._set_values(data)
+        self._unpublished |= changes
+        return changes
+
+    def _set_values(self, data: dict[str, Any]) -> set[str]:
+        """Set the values that differ from the current ones."""
+        changes = set()
+        current = self.__dict__
+        for attribute, value in data.items():
+            if attribute not in current or current[attribute] != value:
+                setattr(self, attribute, value)
+                changes.add(attribute)
+        return changes
+
+    async def publish_updates(self, changes: set[str] | None = None) -> None:
+        """Call the callbacks subscribed to ``changes``, or all of them."""
+        self._last_changes = frozenset(changes) if changes is not None else None
+        for callback, attributes in list(self._callbacks.items()):
+            if (
+                attributes is not None
+                and self._last_changes is not None
+                and attributes.isdisjoint(self._last_changes)
+            ):
+                continue
             try:
                 callback()
             except Exception:
                 LOGGER.exception("Device callback failed for %s", self.device_id)
 
+    def _refresh_after_command(self, result) -> None:
+        """Poll the endpoint unless the gateway will push the new state."""
+        if result.acknowledged and self._tydom_client.confirms_by_push(
+            self._id, self._endpoint
+        ):
+            return
+        self._tydom_client.add_poll_device_url_1s(
+            f"/devices/{self._id}/endpoints/{self._endpoint}/data"
+        )
+
 
 class Tydom(TydomDevice):
     """Tydom Gateway."""
@@ -577,12 +638,14 @@ class TydomRemoteControl(TydomDevice):
         """Return a monotonically increasing sequence for fresh button actions."""
         return self._event_sequence
 
-    async def update_device(self, device) -> None:
-        """Record fresh remote actions before publishing the endpoint update."""
-        action = getattr(device, "action", None)
+    def _set_values(self, data: dict[str, Any]) -> set[str]:
+        """Record fresh remote actions, even when the action is repeated."""
+        changes = super()._set_values(data)
+        action = data.get("action")
         if action is not None and action != "IDLE":
             self._event_sequence += 1
-        await super().update_device(device)
+            changes.add("event_sequence")
+        return changes
 
 
 class TydomBoiler(TydomDevice):
@@ -805,32 +868,21 @@ class TydomBoiler(TydomDevice):
                 LOGGER.error("Unknown hvac mode: %s", mode)
             return
 
+        # Mode changes touching several registers are sent as one frame, in
+        # the order the registers must be applied.
+        values: dict[str, Any] = {}
         if mode == "ANTI_FROST":
             if hasattr(self, "hvacMode"):
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "thermicLevel", "STOP"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "hvacMode", "ANTI_FROST"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "antifrostOn", True
-                )
+                values = {
+                    "thermicLevel": "STOP",
+                    "hvacMode": "ANTI_FROST",
+                    "antifrostOn": True,
+                }
             else:
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "thermicLevel", "ANTI_FROST"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "comfortMode", "HEATING"
-                )
+                values = {"thermicLevel": "ANTI_FROST", "comfortMode": "HEATING"}
         elif mode == "NORMAL":
             if hasattr(self, "hvacMode"):
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "hvacMode", "NORMAL"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "antifrostOn", False
-                )
+                values = {"hvacMode": "NORMAL", "antifrostOn": False}
             else:
                 if (
                     self._metadata is not None
@@ -838,13 +890,9 @@ class TydomBoiler(TydomDevice):
                     and "enum_values" in self._metadata["thermicLevel"]
                 ):
                     if "COMFORT" in self._metadata["thermicLevel"]["enum_values"]:
-                        await self._tydom_client.put_devices_data(
-                            self._id, self._endpoint, "thermicLevel", "COMFORT"
-                        )
+                        values["thermicLevel"] = "COMFORT"
                     elif "HEATING" in self._metadata["thermicLevel"]["enum_values"]:
-                        await self._tydom_client.put_devices_data(
-                            self._id, self._endpoint, "thermicLevel", "HEATING"
-                        )
+                        values["thermicLevel"] = "HEATING"
 
                 if (
                     self._metadata is not None
@@ -852,32 +900,28 @@ class TydomBoiler(TydomDevice):
                     and "enum_values" in self._metadata["comfortMode"]
                     and "HEATING" in self._metadata["comfortMode"]["enum_values"]
                 ):
-                    await self._tydom_client.put_devices_data(
-                        self._id, self._endpoint, "comfortMode", "HEATING"
-                    )
+                    values["comfortMode"] = "HEATING"
 
         elif mode == "STOP":
             if hasattr(self, "hvacMode"):
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "hvacMode", "STOP"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "antifrostOn", True
-                )
+                values = {"hvacMode": "STOP", "antifrostOn": True}
             else:
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "thermicLevel", "STOP"
-                )
-                await self._tydom_client.put_devices_data(
-                    self._id, self._endpoint, "comfortMode", "STOP"
-                )
+                values = {"thermicLevel": "STOP", "comfortMode": "STOP"}
         elif mode == "COOLING":
-            await self._tydom_client.put_devices_data(
-                self._id, self._endpoint, "comfortMode", "COOLING"
-            )
+            values = {"comfortMode": "COOLING"}
         else:
             LOGGER.error("Unknown hvac mode: %s", mode)
 
+        if len(values) == 1:
+            ((name, value),) = values.items()
+            await self._tydom_client.put_devices_data(
+                self._id, self._endpoint, name, value
+            )
+        elif values:
+            await self._tydom_client.put_devices_data_many(
+                self._id, self._endpoint, values, device=self
+            )
+
     async def set_temperature(self, temperature):
         """Set target temperature."""
         setpoint_attribute = (
@@ -1006,12 +1050,14 @@ class TydomInterrupter(TydomDevice):
         """Return a monotonically increasing sequence for fresh button actions."""
         return self._event_sequence
 
-    async def update_device(self, device) -> None:
-        """Record fresh switch actions before publishing the endpoint update."""
-        action = getattr(device, "action", None)
+    def _set_values(self, data: dict[str, Any]) -> set[str]:
+        """Record fresh switch actions, even when the action is repeated."""
+        changes = super()._set_values(data)
+        action = data.get("action")
         if action is not None and action != "IDLE":
             self._event_sequence += 1
-        await super().update_device(device)
+            changes.add("event_sequence")
+        return changes
 
 
 class TydomDoor(TydomDevice):
@@ -1186,21 +1232,19 @@ class TydomLight(TydomDevice):
                 if "ON" in self._metadata["levelCmd"]["enum_values"]:
                     command = "ON"
 
-                await self._tydom_client.put_devices_data(
+                result = await self._tydom_client.put_devices_data(
                     self._id, self._endpoint, "levelCmd", command
                 )
             else:
-                await self._tydom_client.put_devices_data(
+                result = await self._tydom_client.put_devices_data(
                     self._id, self._endpoint, "level", "100"
                 )
 
         else:
-            await self._tydom_client.put_devices_data(
+            result = await self._tydom_client.put_devices_data(
                 self._id, self._endpoint, "level", str(brightness)
             )
-        self._tydom_client.add_poll_device_url_1s(
-            f"/devices/{self._id}/endpoints/{self._endpoint}/data"
-        )
+        self._refresh_after_command(result)
 
     async def turn_off(self) -> None:
         """Tell light to turn off."""
@@ -1214,17 +1258,15 @@ class TydomLight(TydomDevice):
             if "OFF" in self._metadata["levelCmd"]["enum_values"]:
                 command = "OFF"
 
-            await self._tydom_client.put_devices_data(
+            result = await self._tydom_client.put_devices_data(
                 self._id, self._endpoint, "levelCmd", command
             )
         else:
-            await self._tydom_client.put_devices_data(
+            result = await self._tydom_client.put_devices_data(
                 self._id, self._endpoint, "level", "0"
             )
 
-        self._tydom_client.add_poll_device_url_1s(
-            f"/devices/{self._id}/endpoints/{self._endpoint}/data"
-        )
+        self._refresh_after_command(result)
 
 
 class TydomAlarm(TydomDevice):
@@ -1570,22 +1612,18 @@ class TydomSwitch(TydomDevice):
 
     async def turn_on(self) -> None:
         """Turn the binary output on."""
-        await self._tydom_client.put_devices_data(
-            self._id, self._endpoint, "levelCmd", "ON"
+        self._refresh_after_command(
+            await self._tydom_client.put_devices_data(
+                self._id, self._endpoint, "levelCmd", "ON"
+            )
         )
-        self._schedule_state_refresh()
 
     async def turn_off(self) -> None:
         """Turn the binary output off."""
-        await self._tydom_client.put_devices_data(
-            self._id, self._endpoint, "levelCmd", "OFF"
-        )
-        self._schedule_state_refresh()
-
-    def _schedule_state_refresh(self) -> None:
-        """Poll the regular data endpoint after a command."""
-        self._tydom_client.add_poll_device_url_1s(
-            f"/devices/{self._id}/endpoints/{self._endpoint}/data"
+        self._refresh_after_command(
+            await self._tydom_client.put_devices_data(
+                self._id, self._endpoint, "levelCmd", "OFF"
+            )
         )
 
 
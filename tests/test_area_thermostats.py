@@ -52,6 +52,24 @@ _original_modules.setdefault(
 sys.modules[devices_spec.name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_spec = importlib.util.spec_from_file_location(codec_name, tydom_path / "codec.py")
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, tydom_path / "catalog.py"
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_spec = importlib.util.spec_from_file_location(
     "custom_components.deltadore_tydom.tydom.MessageHandler",
     tydom_path / "MessageHandler.py",
@@ -80,17 +98,15 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
     """Exercise discovery, updates, and writes for area-backed thermostats."""
 
     def setUp(self) -> None:
-        """Reset parser registries before each test."""
-        handler_module.device_name.clear()
-        handler_module.device_type.clear()
-        handler_module.device_endpoint.clear()
-        handler_module.device_metadata.clear()
-        handler_module.device_tutorial_id.clear()
-        handler_module.device_name["10_20"] = "Living room"
-        handler_module.device_type["10_20"] = "re2020ControlBoiler"
-        handler_module.device_metadata["10_20"] = {}
+        """Create a handler with a fresh catalogue before each test."""
         self.client = MagicMock()
         self.handler = MessageHandler(self.client, b"")
+        self._set("10_20", name="Living room", usage="re2020ControlBoiler", metadata={})
+
+    def _set(self, uid: str, **values) -> None:
+        """Configure an endpoint in the catalogue of the handler."""
+        endpoint_id, device_id = uid.split("_", 1)
+        self.handler.catalog.set_endpoint(uid, device_id, endpoint_id, **values)
 
     async def _discover(self):
         """Return the thermostat created from an area-linked endpoint."""
@@ -157,15 +173,18 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
         self,
     ) -> None:
         """A physical Tywell controller keeps its sensors without an area link."""
-        handler_module.device_name["10_20"] = "Tywell Control"
-        handler_module.device_metadata["10_20"] = {
-            "synchroRadio": {"permission": "r"},
-            "battLevel": {"permission": "r"},
-            "ambientTemperature": {"permission": "r", "unit": "degC"},
-            "hygroIn": {"permission": "r", "unit": "%"},
-            "isReference": {"permission": "r"},
-            "shutterCmd": {"permission": "r"},
-        }
+        self._set(
+            "10_20",
+            name="Tywell Control",
+            metadata={
+                "synchroRadio": {"permission": "r"},
+                "battLevel": {"permission": "r"},
+                "ambientTemperature": {"permission": "r", "unit": "degC"},
+                "hygroIn": {"permission": "r", "unit": "%"},
+                "isReference": {"permission": "r"},
+                "shutterCmd": {"permission": "r"},
+            },
+        )
 
         devices = await self.handler.parse_devices_data(
             [
@@ -221,11 +240,12 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
         self,
     ) -> None:
         """The explicit Delta Dore tutorial identifies a physical controller."""
-        handler_module.device_name["10_20"] = "Tywell Control"
-        handler_module.device_tutorial_id["10_20"] = "tywell_control"
-        handler_module.device_metadata["10_20"] = {
-            "ambientTemperature": {"permission": "r", "unit": "degC"}
-        }
+        self._set(
+            "10_20",
+            name="Tywell Control",
+            tutorial_id="tywell_control",
+            metadata={"ambientTemperature": {"permission": "r", "unit": "degC"}},
+        )
 
         devices = await self.handler.parse_devices_data(
             [
@@ -257,8 +277,7 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_linked_passive_control_keeps_sensor_and_adds_climate(self) -> None:
         """A passive Tywell retains its sensor device and gains a climate device."""
-        handler_module.device_name["10_20"] = "Tywell Ctrl RdC"
-        handler_module.device_type["10_20"] = "re2020ControlPassive"
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
 
         devices = await self.handler.parse_devices_data(
             [
@@ -305,26 +324,20 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_passive_climate_inherits_linked_area_control_metadata(self) -> None:
         """The derived climate uses receiver limits rather than passive metadata."""
-        handler_module.device_name.update(
-            {
-                "10_20": "Tywell Ctrl RdC",
-                "11_21": "Tybox 5101 RdC",
-            }
-        )
-        handler_module.device_type.update(
-            {
-                "10_20": "re2020ControlPassive",
-                "11_21": "boiler",
-            }
-        )
-        handler_module.device_metadata.update(
-            {
-                "10_20": {"ambientTemperature": {"min": -327.67, "max": 327.66}},
-                "11_21": {
-                    "authorization": {"enum_values": ["STOP", "HEATING"]},
-                    "setpoint": {"min": 1.0, "max": 50.0, "step": 0.5},
-                },
-            }
+        self._set(
+            "10_20",
+            name="Tywell Ctrl RdC",
+            usage="re2020ControlPassive",
+            metadata={"ambientTemperature": {"min": -327.67, "max": 327.66}},
+        )
+        self._set(
+            "11_21",
+            name="Tybox 5101 RdC",
+            usage="boiler",
+            metadata={
+                "authorization": {"enum_values": ["STOP", "HEATING"]},
+                "setpoint": {"min": 1.0, "max": 50.0, "step": 0.5},
+            },
         )
 
         devices = await self.handler.parse_devices_data(
@@ -397,22 +410,17 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_partial_update_keeps_strongest_area_metadata(self) -> None:
         """A passive-only update must not discard linked controller limits."""
-        handler_module.device_name.update(
-            {"10_20": "Tywell Ctrl RdC", "11_21": "Tybox 5101 RdC"}
-        )
-        handler_module.device_type.update(
-            {"10_20": "re2020ControlPassive", "11_21": "boiler"}
-        )
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
+        self._set("11_21", name="Tybox 5101 RdC", usage="boiler")
         controller_metadata = {
             "authorization": {"enum_values": ["STOP", "HEATING"]},
             "setpoint": {"min": 1.0, "max": 50.0, "step": 0.5},
         }
-        handler_module.device_metadata.update(
-            {
-                "10_20": {"ambientTemperature": {"min": -327.67, "max": 327.66}},
-                "11_21": controller_metadata,
-            }
+        self._set(
+            "10_20",
+            metadata={"ambientTemperature": {"min": -327.67, "max": 327.66}},
         )
+        self._set("11_21", metadata=controller_metadata)
         full_response = [
             {
                 "id": 20,
@@ -438,16 +446,34 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
             },
         ]
         await self.handler.parse_devices_data(full_response, None)
+        passive_update = [
+            {
+                "id": 20,
+                "endpoints": [
+                    {
+                        "id": 10,
+                        "error": 0,
+                        "link": {"type": "area", "id": 7},
+                        "data": [
+                            {
+                                "name": "ambientTemperature",
+                                "value": 20.5,
+                                "validity": "upToDate",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
 
-        devices = await self.handler.parse_devices_data(full_response[:1], None)
+        devices = await self.handler.parse_devices_data(passive_update, None)
 
         derived_climate = devices[1]
         self.assertEqual(derived_climate._metadata, controller_metadata)
 
     async def test_area_state_updates_derived_passive_climate(self) -> None:
         """Area pushes target the derived climate rather than the passive sensor."""
-        handler_module.device_name["10_20"] = "Tywell Ctrl RdC"
-        handler_module.device_type["10_20"] = "re2020ControlPassive"
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
         await self.handler.parse_devices_data(
             [
                 {
@@ -495,8 +521,7 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_unlinked_passive_control_remains_sensor_only(self) -> None:
         """An unlinked passive Tywell must not gain a climate device."""
-        handler_module.device_name["10_20"] = "Tywell Ctrl RdC"
-        handler_module.device_type["10_20"] = "re2020ControlPassive"
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
 
         devices = await self.handler.parse_devices_data(
             [
@@ -528,11 +553,12 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
         self,
     ) -> None:
         """Only the passive wall controller owns the grouped battLevel value."""
-        handler_module.device_name["10_20"] = "Tywell Ctrl RdC"
-        handler_module.device_type["10_20"] = "re2020ControlPassive"
-        handler_module.device_metadata["10_20"] = {
-            "battLevel": {"min": 0, "max": 2, "step": 1, "unit": "NA"}
-        }
+        self._set(
+            "10_20",
+            name="Tywell Ctrl RdC",
+            usage="re2020ControlPassive",
+            metadata={"battLevel": {"min": 0, "max": 2, "step": 1, "unit": "NA"}},
+        )
 
         devices = await self.handler.parse_devices_data(
             [
@@ -597,21 +623,10 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
         self,
     ) -> None:
         """Tywell weather data belongs to the same physical wall controller."""
-        handler_module.device_name.update(
-            {
-                "10_20": "Tywell Ctrl RdC",
-                "30_40": "Produit 1",
-            }
-        )
-        handler_module.device_type.update(
-            {
-                "10_20": "re2020ControlPassive",
-                "30_40": "weather",
-            }
-        )
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
+        self._set("30_40", name="Produit 1", usage="weather")
 
-        weather = await MessageHandler.get_device(
-            self.client,
+        weather = await self.handler.get_device(
             "weather",
             "30_40",
             "40",
@@ -627,22 +642,15 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_weather_uses_unlinked_tywell_boiler_identity(self) -> None:
         """An unlinked controller still owns its weather companion endpoint."""
-        handler_module.device_name.update(
-            {
-                "10_20": "Tywell Ctrl RdC",
-                "30_40": "Produit 1",
-            }
-        )
-        handler_module.device_type.update(
-            {
-                "10_20": "re2020ControlBoiler",
-                "30_40": "weather",
-            }
+        self._set(
+            "10_20",
+            name="Tywell Ctrl RdC",
+            usage="re2020ControlBoiler",
+            tutorial_id="tywell_control",
         )
-        handler_module.device_tutorial_id["10_20"] = "tywell_control"
+        self._set("30_40", name="Produit 1", usage="weather")
 
-        weather = await MessageHandler.get_device(
-            self.client,
+        weather = await self.handler.get_device(
             "weather",
             "30_40",
             "40",
@@ -659,21 +667,10 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
         self,
     ) -> None:
         """Do not guess a physical parent when several Tywell controls exist."""
-        handler_module.device_name.update(
-            {
-                "10_20": "Tywell Ctrl RdC",
-                "11_21": "Tywell Ctrl Étage",
-            }
-        )
-        handler_module.device_type.update(
-            {
-                "10_20": "re2020ControlPassive",
-                "11_21": "re2020ControlPassive",
-            }
-        )
+        self._set("10_20", name="Tywell Ctrl RdC", usage="re2020ControlPassive")
+        self._set("11_21", name="Tywell Ctrl Étage", usage="re2020ControlPassive")
 
-        weather = await MessageHandler.get_device(
-            self.client,
+        weather = await self.handler.get_device(
             "weather",
             "30_40",
             "40",
@@ -709,11 +706,14 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_area_modes_include_only_advertised_cooling(self) -> None:
         """Cooling is exposed only when TYDOM advertises the capability."""
-        handler_module.device_metadata["10_20"] = {
-            "authorization": {
-                "enum_values": ["STOP", "HEATING", "COOLING"],
-            }
-        }
+        self._set(
+            "10_20",
+            metadata={
+                "authorization": {
+                    "enum_values": ["STOP", "HEATING", "COOLING"],
+                }
+            },
+        )
 
         device = await self._discover()
 
@@ -847,11 +847,14 @@ class AreaThermostatTests(IsolatedAsyncioTestCase):
 
     async def test_reversible_area_uses_mode_specific_setpoint(self) -> None:
         """A reversible system writes the register matching its current mode."""
-        handler_module.device_metadata["10_20"] = {
-            "authorization": {"enum_values": ["STOP", "HEATING", "COOLING"]},
-            "heatSetpoint": {"min": 7.0, "max": 32.0, "step": 0.5},
-            "coolSetpoint": {"min": 7.0, "max": 32.0, "step": 0.5},
-        }
+        self._set(
+            "10_20",
+            metadata={
+                "authorization": {"enum_values": ["STOP", "HEATING", "COOLING"]},
+                "heatSetpoint": {"min": 7.0, "max": 32.0, "step": 0.5},
+                "coolSetpoint": {"min": 7.0, "max": 32.0, "step": 0.5},
+            },
+        )
         device = await self._discover()
         device.authorization = "COOLING"
         device.coolSetpoint = 24.0
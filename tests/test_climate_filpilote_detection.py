@@ -211,9 +211,8 @@ _module(
 )
 
 _module(
-    "custom_components.deltadore_tydom.tydom.MessageHandler",
-    device_name={},
-    groups_data={},
+    "custom_components.deltadore_tydom.tydom.catalog",
+    DeviceCatalog=MagicMock,
 )
 
 
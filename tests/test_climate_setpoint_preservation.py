@@ -64,6 +64,7 @@ def _boiler(*, metadata, data):
     """Create a thermostat and its mocked client."""
     client = MagicMock()
     client.put_devices_data = AsyncMock()
+    client.put_devices_data_many = AsyncMock()
     client.put_home_hvac_mode = AsyncMock()
     device = TydomBoiler(
         client,
@@ -95,14 +96,20 @@ class ClimateSetpointPreservationTests(IsolatedAsyncioTestCase):
         await device.set_hvac_mode("NORMAL")
 
         self.assertEqual(
-            client.put_devices_data.await_args_list,
+            client.put_devices_data_many.await_args_list,
             [
-                call("20", "10", "hvacMode", "STOP"),
-                call("20", "10", "antifrostOn", True),
-                call("20", "10", "hvacMode", "NORMAL"),
-                call("20", "10", "antifrostOn", False),
+                call(
+                    "20", "10", {"hvacMode": "STOP", "antifrostOn": True}, device=device
+                ),
+                call(
+                    "20",
+                    "10",
+                    {"hvacMode": "NORMAL", "antifrostOn": False},
+                    device=device,
+                ),
             ],
         )
+        client.put_devices_data.assert_not_awaited()
         self.assertEqual(device.setpoint, 21.5)
 
     async def test_zone_thermostat_keeps_heating_and_cooling_setpoints(self) -> None:
@@ -147,12 +154,13 @@ class ClimateSetpointPreservationTests(IsolatedAsyncioTestCase):
 
         await device.set_hvac_mode("ANTI_FROST")
 
+        values = client.put_devices_data_many.await_args.args[2]
         self.assertEqual(
-            client.put_devices_data.await_args_list,
+            list(values.items()),
             [
-                call("20", "10", "thermicLevel", "STOP"),
-                call("20", "10", "hvacMode", "ANTI_FROST"),
-                call("20", "10", "antifrostOn", True),
+                ("thermicLevel", "STOP"),
+                ("hvacMode", "ANTI_FROST"),
+                ("antifrostOn", True),
             ],
         )
         self.assertEqual(device.setpoint, 20)
@@ -18,11 +18,12 @@ def _load_generic_sensor_class():
         / "ha_entities.py"
     )
     module = ast.parse(source_path.read_text(encoding="utf-8"))
-    class_node = next(
+    class_nodes = [
         node
         for node in module.body
-        if isinstance(node, ast.ClassDef) and node.name == "GenericSensor"
-    )
+        if isinstance(node, ast.ClassDef)
+        and node.name in {"HubBoundEntity", "GenericSensor"}
+    ]
     isolated_module = ast.Module(
         body=[
             ast.ImportFrom(
@@ -30,7 +31,7 @@ def _load_generic_sensor_class():
                 names=[ast.alias(name="annotations")],
                 level=0,
             ),
-            class_node,
+            *class_nodes,
         ],
         type_ignores=[],
     )
@@ -118,6 +119,16 @@ class CoverPositionSensorTests(TestCase):
         self.assertEqual(sensor.entity_description.native_unit_of_measurement, "%")
         self.assertEqual(sensor.native_unit_of_measurement, "%")
 
+    def test_availability_follows_the_bound_hub(self) -> None:
+        """Sensors are available like other entities: only with an online hub."""
+        sensor = self._sensor(SimpleNamespace(device_id="shutter_1", position=64))
+
+        self.assertFalse(sensor.available)
+        sensor._hub = SimpleNamespace(online=True)
+        self.assertTrue(sensor.available)
+        sensor._hub.online = False
+        self.assertFalse(sensor.available)
+
 
 if __name__ == "__main__":
     import unittest
@@ -52,6 +52,24 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_spec = importlib.util.spec_from_file_location(codec_name, protocol_path / "codec.py")
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, protocol_path / "catalog.py"
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_spec = importlib.util.spec_from_file_location(
     handler_name, protocol_path / "MessageHandler.py"
@@ -327,21 +345,21 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
     """Exercise model application when protocol devices are created."""
 
     def setUp(self) -> None:
-        """Reset the protocol descriptors used by the device factory."""
-        handler_module.device_name.clear()
-        handler_module.device_type.clear()
-        handler_module.device_metadata.clear()
-        handler_module.device_tutorial_id.clear()
-        handler_module.endpoint_config.clear()
+        """Create a handler with a fresh catalogue before each test."""
         self.handler = MessageHandler(MagicMock(), b"")
 
+    def _set(self, uid: str, **values) -> None:
+        """Configure an endpoint in the catalogue of the handler."""
+        endpoint_id, device_id = uid.split("_", 1)
+        self.handler.catalog.set_endpoint(uid, device_id, endpoint_id, **values)
+
     async def test_resolved_model_is_added_to_device_data(self) -> None:
         """A descriptor-derived model is exposed through productName."""
         uid = "20_10"
-        handler_module.device_tutorial_id[uid] = "sensor_dfr"
+        self._set(uid, tutorial_id="sensor_dfr")
 
-        device = await MessageHandler.get_device(
-            MagicMock(), "sensorDFR", uid, "10", "Smoke detector", "20", None
+        device = await self.handler.get_device(
+            "sensorDFR", uid, "10", "Smoke detector", "20", None
         )
 
         self.assertIsNotNone(device)
@@ -350,10 +368,9 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
     async def test_reported_product_name_takes_precedence(self) -> None:
         """An explicit model reported by TYDOM is never overwritten."""
         uid = "20_10"
-        handler_module.device_tutorial_id[uid] = "sensor_dfr"
+        self._set(uid, tutorial_id="sensor_dfr")
 
-        device = await MessageHandler.get_device(
-            MagicMock(),
+        device = await self.handler.get_device(
             "sensorDFR",
             uid,
             "10",
@@ -369,7 +386,7 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
         """The observed two-record pairing retains its physical model."""
         device_id = 30
         endpoint_ids = (30, 31)
-        await MessageHandler.parse_config_data(
+        await self.handler.parse_config_data(
             {
                 "endpoints": [
                     {
@@ -391,8 +408,8 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
 
         for endpoint_id in endpoint_ids:
             uid = f"{endpoint_id}_{device_id}"
-            device = await MessageHandler.get_device(
-                MagicMock(), "interrupter", uid, device_id, "Button", endpoint_id
+            device = await self.handler.get_device(
+                "interrupter", uid, device_id, "Button", endpoint_id
             )
             self.assertIsNotNone(device)
             self.assertEqual(device.productName, "TYXIA 2600")
@@ -401,29 +418,19 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
         """Ignore successful endpoints that expose no state or capabilities."""
         real_uid = "20_10"
         placeholder_uid = "11_10"
-        handler_module.device_name.update(
-            {
-                real_uid: "Bedroom shutter",
-                placeholder_uid: "Product 1",
-            }
-        )
-        handler_module.device_type.update(
-            {
-                real_uid: "shutter",
-                placeholder_uid: "shutter",
-            }
+        self._set(
+            real_uid,
+            name="Bedroom shutter",
+            usage="shutter",
+            tutorial_id="profalux_stella",
+            metadata={"position": {"permission": "rw", "unit": "%"}},
         )
-        handler_module.device_tutorial_id.update(
-            {
-                real_uid: "profalux_stella",
-                placeholder_uid: "profalux_stella",
-            }
-        )
-        handler_module.device_metadata.update(
-            {
-                real_uid: {"position": {"permission": "rw", "unit": "%"}},
-                placeholder_uid: {},
-            }
+        self._set(
+            placeholder_uid,
+            name="Product 1",
+            usage="shutter",
+            tutorial_id="profalux_stella",
+            metadata={},
         )
 
         devices = await self.handler.parse_devices_data(
@@ -466,12 +473,13 @@ class TestDeviceModelApplication(IsolatedAsyncioTestCase):
     async def test_silent_endpoint_with_capabilities_is_preserved(self) -> None:
         """Keep a temporarily silent endpoint when its capabilities are known."""
         uid = "20_10"
-        handler_module.device_name[uid] = "Offline shutter"
-        handler_module.device_type[uid] = "shutter"
-        handler_module.device_tutorial_id[uid] = "profalux_stella"
-        handler_module.device_metadata[uid] = {
-            "position": {"permission": "rw", "unit": "%"}
-        }
+        self._set(
+            uid,
+            name="Offline shutter",
+            usage="shutter",
+            tutorial_id="profalux_stella",
+            metadata={"position": {"permission": "rw", "unit": "%"}},
+        )
 
         devices = await self.handler.parse_devices_data(
             [
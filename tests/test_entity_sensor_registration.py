@@ -17,11 +17,12 @@ def _load_ha_entity_class():
         / "ha_entities.py"
     )
     module = ast.parse(source_path.read_text(encoding="utf-8"))
-    class_node = next(
+    class_nodes = [
         node
         for node in module.body
-        if isinstance(node, ast.ClassDef) and node.name == "HAEntity"
-    )
+        if isinstance(node, ast.ClassDef)
+        and node.name in {"HubBoundEntity", "HAEntity"}
+    ]
     isolated_module = ast.Module(
         body=[
             ast.ImportFrom(
@@ -29,7 +30,7 @@ def _load_ha_entity_class():
                 names=[ast.alias(name="annotations")],
                 level=0,
             ),
-            class_node,
+            *class_nodes,
         ],
         type_ignores=[],
     )
@@ -127,7 +128,7 @@ class EntitySensorRegistrationTests(TestCase):
         entity = HAEntity()
         entity._device = Device()
         if supports_generic_sensors:
-            entity._registered_sensors = []
+            entity._registered_sensors = set()
         return entity
 
     def test_same_attribute_is_registered_for_each_device(self) -> None:
@@ -145,6 +146,25 @@ class EntitySensorRegistrationTests(TestCase):
         self.assertEqual(len(entity.get_sensors()), 1)
         self.assertEqual(entity.get_sensors(), [])
 
+    def test_update_only_discovers_the_reported_attributes(self) -> None:
+        """After an update, attributes it did not report are not rescanned."""
+        entity = self._entity("gate_1")
+        entity.get_sensors()
+        entity._device.battDefect = False
+        entity._device.lowBattery = True
+
+        self.assertEqual(len(entity.get_sensors({"battDefect", "thermicDefect"})), 1)
+        self.assertEqual(entity._registered_sensors, {"thermicDefect", "battDefect"})
+        self.assertEqual(len(entity.get_sensors()), 1)
+
+    def test_filtered_base_name_applies_to_suffixed_attributes(self) -> None:
+        """Lookup tables match an attribute by its name before an underscore."""
+        entity = self._entity("gate_1")
+        entity.filtered_attrs = ["thermicDefect"]
+        entity._device.thermicDefect_2 = True
+
+        self.assertEqual(entity.get_sensors(), [])
+
     def test_registration_lists_are_not_shared(self) -> None:
         """Every entity wrapper owns its registration state."""
         first = self._entity("switch_1")
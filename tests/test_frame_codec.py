@@ -0,0 +1,115 @@
+"""Tests for the Tydom websocket frame codec."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+root = Path(__file__).parents[1]
+codec_path = root / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+codec_spec = importlib.util.spec_from_file_location("tydom_codec", codec_path)
+assert codec_spec is not None and codec_spec.loader is not None
+codec = importlib.util.module_from_spec(codec_spec)
+codec_spec.loader.exec_module(codec)
+
+benchmark_path = root / "tools" / "benchmark_codec.py"
+benchmark_spec = importlib.util.spec_from_file_location(
+    "benchmark_codec", benchmark_path
+)
+assert benchmark_spec is not None and benchmark_spec.loader is not None
+benchmark = importlib.util.module_from_spec(benchmark_spec)
+benchmark_spec.loader.exec_module(benchmark)
+
+
+def test_response_headers_are_case_insensitive() -> None:
+    """Gateway firmwares do not agree on header name casing."""
+    response = codec.parse_response(
+        b"HTTP/1.1 200 OK\r\n"
+        b"uri-origin: /info\r\n"
+        b"TRANSAC-ID: 1700000000000\r\n"
+        b"Content-Length: 2\r\n\r\n"
+        b"{}\r\n\r\n"
+    )
+
+    assert response.status == 200
+    assert response.headers.get("Uri-Origin") == "/info"
+    assert response.headers["Transac-Id"] == "1700000000000"
+    assert "content-length" in response.headers
+    assert response.body == b"{}"
+
+
+def test_chunked_push_request_is_decoded() -> None:
+    """Unsolicited pushes are chunked requests without a transaction id."""
+    request = codec.parse_request(
+        b"PUT /devices/data HTTP/1.1\r\n"
+        b"Server: Tydom-001A25000000\r\n"
+        b"content-type: application/json\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        b'3\r\n[{"\r\n4;ext=1\r\nid":\r\n3\r\n1}]\r\n0\r\n\r\n'
+    )
+
+    assert (request.method, request.path) == ("PUT", "/devices/data")
+    assert request.headers.get("Transac-Id") is None
+    assert request.body == b'[{"id":1}]'
+
+
+def test_bodyless_responses_ignore_trailing_bytes() -> None:
+    """A 204 never carries a body, whatever follows its headers."""
+    response = codec.parse_response(b"HTTP/1.1 204 No Content\r\n\r\nnoise")
+
+    assert response.body == b""
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nab",
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n",
+        b"HTTP/1.1 OK\r\n\r\n",
+        b"GET /info\r\n\r\n",
+    ],
+)
+def test_malformed_frames_raise_value_error(frame: bytes) -> None:
+    """Truncated or malformed frames are reported instead of half-parsed."""
+    parse = codec.parse_response if frame.startswith(b"HTTP/") else codec.parse_request
+    with pytest.raises(ValueError):
+        parse(frame)
+
+
+def test_bodyless_request_uses_the_empty_body_template() -> None:
+    """GET requests keep the exact framing the gateway already accepts."""
+    assert codec.encode_request("GET", "/ping", "1700000000000") == (
+        b"GET /ping HTTP/1.1\r\n"
+        b"Content-Length: 0\r\n"
+        b"Content-Type: application/json; charset=UTF-8\r\n"
+        b"Transac-Id: 1700000000000\r\n\r\n"
+    )
+
+
+def test_json_request_announces_its_length() -> None:
+    """Bodies are framed with their length and followed by a blank line."""
+    frame = codec.encode_request(
+        "PUT",
+        "/devices/1/endpoints/1/data",
+        "0",
+        b'[{"name": "level", "value": 42}]',
+        {"Content-Type": "text/plain", "X-Extra": "1"},
+    )
+
+    request = codec.parse_request(frame)
+    assert request.headers["Content-Type"] == "application/json; charset=UTF-8"
+    assert request.headers["X-Extra"] == "1"
+    assert request.headers["Transac-Id"] == "0"
+    assert request.body == b'[{"name": "level", "value": 42}]'
+    assert frame.endswith(b"\r\n\r\n")
+
+
+def test_codec_matches_http_client_on_recorded_traces() -> None:
+    """Every frame of the trace corpus parses as http.client parsed it."""
+    frames = benchmark.load_frames(sorted((root / "tools").glob("traces-*.txt")))
+
+    assert frames
+    for frame in frames:
+        assert benchmark._codec_parse(codec, frame) == benchmark._legacy_parse(frame)
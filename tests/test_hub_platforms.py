@@ -0,0 +1,397 @@
+"""Tests for the registration of entities by platform."""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+from functools import partial
+from pathlib import Path
+import time
+from unittest import TestCase
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+_HUB_MEMBERS = {
+    "_register_platform",
+    "_add_entities",
+    "get_entity",
+    "_forget_entity",
+    "_index_group_members",
+    "_groups_to_refresh",
+    "_refresh_group_members",
+    "_aliases_of",
+    "_add_device",
+    "_remove_device",
+    "resolve_device_id",
+    "resolve_device",
+    "_scenes_to_relate",
+    "_relate_scenes",
+    "refresh_data_1s",
+    "restore_snapshot",
+    "setup",
+}
+
+
+class TydomGroup(SimpleNamespace):
+    """Protocol group with the attributes the hub indexes."""
+
+
+class _Entity(SimpleNamespace):
+    """Entity stand-in running its removal callbacks on demand."""
+
+    def async_on_remove(self, func) -> None:
+        self.__dict__.setdefault("on_remove", []).append(func)
+
+    def remove(self) -> None:
+        for func in self.__dict__.pop("on_remove", []):
+            func()
+
+
+def _load_platform_hub():
+    """Load the platform callback handling of Hub without Home Assistant."""
+    source_path = (
+        Path(__file__).parents[1] / "custom_components" / "deltadore_tydom" / "hub.py"
+    )
+    module = ast.parse(source_path.read_text(encoding="utf-8"))
+    body = []
+    for node in module.body:
+        if isinstance(node, ast.ClassDef) and node.name == "_PlatformCallback":
+            body.append(node)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "_PLATFORM_CALLBACKS"
+            for target in node.targets
+        ):
+            body.append(node)
+        elif isinstance(node, ast.ClassDef) and node.name == "Hub":
+            members = [
+                member
+                for member in node.body
+                if (
+                    isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and member.name in _HUB_MEMBERS
+                )
+                or (
+                    isinstance(member, ast.Assign)
+                    and "_PlatformCallback" in ast.unparse(member.value)
+                )
+            ]
+            body.append(
+                ast.ClassDef(
+                    name="Hub", bases=[], keywords=[], body=members, decorator_list=[]
+                )
+            )
+    isolated_module = ast.Module(body=body, type_ignores=[])
+    ast.fix_missing_locations(isolated_module)
+    namespace = {
+        "__name__": "hub",
+        "asyncio": asyncio,
+        "Callable": object,
+        "LOGGER": MagicMock(),
+        "partial": partial,
+        "SendPriority": SimpleNamespace(INTERACTIVE=0, BOOTSTRAP=1, BACKGROUND=2),
+        "time": time,
+        "TydomGroup": TydomGroup,
+    }
+    exec(compile(isolated_module, source_path, "exec"), namespace)
+    return namespace["Hub"], namespace["_PLATFORM_CALLBACKS"]
+
+
+def _load_scene_relations():
+    """Load the scenario relations of the catalogue on their own."""
+    source_path = (
+        Path(__file__).parents[1]
+        / "custom_components"
+        / "deltadore_tydom"
+        / "tydom"
+        / "catalog.py"
+    )
+    module = ast.parse(source_path.read_text(encoding="utf-8"))
+    body = [
+        node
+        for node in module.body
+        if isinstance(node, ast.ClassDef) and node.name == "SceneRelations"
+    ]
+    namespace = {"__name__": "catalog"}
+    isolated_module = ast.Module(body=body, type_ignores=[])
+    exec(compile(isolated_module, source_path, "exec"), namespace)
+    return namespace["SceneRelations"]
+
+
+Hub, PLATFORM_CALLBACKS = _load_platform_hub()
+SceneRelations = _load_scene_relations()
+
+
+def _hub() -> Hub:
+    hub = Hub()
+    hub._platform_callbacks = {}
+    hub._deferred_entities = {}
+    hub._entities_by_unique_id = {}
+    hub._created_at = time.monotonic()
+    hub.devices = {}
+    hub._device_aliases = {}
+    hub._group_members = {}
+    hub._groups_by_member = {}
+    hub.ha_devices = {}
+    hub.catalog = SimpleNamespace(groups={})
+    hub.scene_relations = SceneRelations()
+    hub._related_groups = {}
+    return hub
+
+
+class HubPlatformTests(TestCase):
+    """Entities created before their platform is set up are not lost."""
+
+    def test_entities_are_queued_until_the_platform_registers(self) -> None:
+        """Queued entities are added in one call when the callback arrives."""
+        hub = _hub()
+        cover_1, cover_2, cover_3 = (
+            _Entity(unique_id=f"cover_{index}") for index in range(3)
+        )
+        hub.add_cover_callback([cover_1])
+        hub.add_cover_callback([cover_2])
+
+        add_covers = MagicMock()
+        hub.add_cover_callback = add_covers
+
+        add_covers.assert_called_once_with([cover_1, cover_2])
+        hub.add_cover_callback([cover_3])
+        add_covers.assert_called_with([cover_3])
+
+    def test_entities_are_bound_to_the_hub_creating_them(self) -> None:
+        """With several gateways, each entity knows and is indexed by its hub."""
+        first, second = _hub(), _hub()
+        first.add_light_callback = MagicMock()
+        light = _Entity(unique_id="light_1")
+        sensor = _Entity(unique_id="light_1_battery")
+
+        first.add_light_callback([light])
+        second.add_sensor_callback([sensor])
+
+        self.assertIs(light._hub, first)
+        self.assertIs(sensor._hub, second)
+        self.assertIs(first.get_entity("light_1"), light)
+        self.assertIsNone(first.get_entity("light_1_battery"))
+        self.assertIs(second.get_entity("light_1_battery"), sensor)
+
+    def test_removed_entities_are_no_longer_found(self) -> None:
+        """An entity removed from Home Assistant leaves the hub index."""
+        hub = _hub()
+        hub.add_light_callback = MagicMock()
+        light = _Entity(unique_id="light_1")
+        replacement = _Entity(unique_id="light_1")
+        hub.add_light_callback([light])
+        hub.add_light_callback([replacement])
+
+        light.remove()
+        self.assertIs(hub.get_entity("light_1"), replacement)
+        replacement.remove()
+        self.assertIsNone(hub.get_entity("light_1"))
+
+
+class HubDeviceResolutionTests(TestCase):
+    """Devices are found by any of the identifiers the gateway uses."""
+
+    def test_devices_resolve_by_unique_id_or_device_id(self) -> None:
+        """A device ID resolves to its first endpoint, as the gateway lists them."""
+        hub = _hub()
+        first = SimpleNamespace(device_id="1_100", _id=100)
+        second = SimpleNamespace(device_id="2_100", _id=100)
+        group = TydomGroup(device_id="10", _id="10")
+        for device in (first, second, group):
+            hub._add_device(device)
+
+        self.assertEqual(hub.resolve_device_id("2_100"), "2_100")
+        self.assertEqual(hub.resolve_device_id(100), "1_100")
+        self.assertIs(hub.resolve_device("10"), group)
+        self.assertEqual(hub._device_aliases, {"100": {"1_100": None, "2_100": None}})
+        self.assertIsNone(hub.resolve_device("3"))
+
+    def test_devices_resolve_by_endpoint_id_or_area_uid(self) -> None:
+        """Endpoint IDs and area thermostat uids resolve until the device goes."""
+        hub = _hub()
+        source = SimpleNamespace(device_id="1_100", _id=100, _endpoint=1)
+        thermostat = SimpleNamespace(
+            device_id="1_100_area_climate", _id=100, _endpoint=1
+        )
+        group = TydomGroup(device_id="10", group_id="10", _id="10")
+        for device in (source, thermostat, group):
+            hub._add_device(device)
+        entity = _Entity(_device=source, hass=None)
+        hub._entities_by_unique_id["light_1"] = entity
+
+        self.assertIs(hub.resolve_device(1), source)
+        self.assertIs(hub.resolve_device("1_100_area_climate"), thermostat)
+        self.assertIs(hub.resolve_device(10), group)
+
+        asyncio.run(hub._remove_device("1_100"))
+
+        self.assertIs(hub.resolve_device(1), thermostat)
+        self.assertIsNone(hub.get_entity("light_1"))
+        asyncio.run(hub._remove_device("1_100_area_climate"))
+
+        self.assertIsNone(hub.resolve_device(1))
+        self.assertIsNone(hub.resolve_device(100))
+        self.assertEqual(hub._device_aliases, {})
+
+
+class HubPollingPriorityTests(TestCase):
+    """Priority of the polling loops of the hub."""
+
+    def test_polls_following_commands_keep_the_command_priority(self) -> None:
+        """Position polls after a command do not queue behind background loops."""
+        hub = Hub()
+        hub._shutting_down = False
+        hub._tydom_client = MagicMock()
+
+        async def poll() -> None:
+            hub._shutting_down = True
+
+        async def sleep(_interval: int) -> None:
+            pass
+
+        hub._tydom_client.poll_devices_data_1s = poll
+        hub._interruptible_sleep = sleep
+
+        asyncio.run(hub.refresh_data_1s())
+
+        hub._tydom_client.set_send_priority.assert_called_once_with(0)
+
+
+class HubSnapshotStartupTests(TestCase):
+    """Start of a hub from the snapshot of the previous run."""
+
+    def _hub(self, snapshot: dict | None) -> Hub:
+        hub = Hub()
+        hub._shutting_down = False
+        hub._snapshot_store = SimpleNamespace(
+            async_load=AsyncMock(return_value=snapshot)
+        )
+        hub._tydom_client = MagicMock()
+        hub._tydom_client.restore_snapshot = AsyncMock(
+            return_value=[SimpleNamespace(device_id="1")]
+        )
+        hub._handle_devices = AsyncMock()
+        return hub
+
+    def test_snapshot_devices_are_created_without_connecting(self) -> None:
+        """Restoring needs the store only, not the gateway."""
+        hub = self._hub({"devices": []})
+
+        self.assertTrue(asyncio.run(hub.restore_snapshot()))
+
+        hub._handle_devices.assert_awaited_once()
+        hub._tydom_client.async_connect_and_initialise.assert_not_called()
+        self.assertFalse(asyncio.run(self._hub(None).restore_snapshot()))
+
+    def test_unreachable_gateway_keeps_restored_entities(self) -> None:
+        """A failed first connection leaves reconnecting to the reader loop."""
+        hub = self._hub({"devices": []})
+        hub._reload_button_created = True
+        hub.connect = AsyncMock(side_effect=OSError("unreachable"))
+        hub._set_online = MagicMock()
+        hub._validate_data_consistency = AsyncMock()
+
+        async def consume_messages() -> None:
+            hub._shutting_down = True
+
+        hub._tydom_client.consume_messages = consume_messages
+
+        asyncio.run(hub.setup())
+
+        hub._set_online.assert_called_once_with(False)
+
+
+class HubGroupMembershipTests(TestCase):
+    """Group members are resolved again only when membership can change."""
+
+    @staticmethod
+    def _group(group_id: str, device_ids: list[str]) -> TydomGroup:
+        group = TydomGroup(device_id=group_id, device_ids=device_ids)
+        group._ha_device = MagicMock()
+        return group
+
+    def test_new_device_refreshes_only_the_groups_listing_it(self) -> None:
+        """A device joins the groups naming its unique ID or device ID."""
+        hub = _hub()
+        lights = self._group("10", ["1_1", "2"])
+        shutters = self._group("20", ["3_3"])
+        for group in (lights, shutters):
+            hub.devices[group.device_id] = group
+            self.assertEqual(hub._groups_to_refresh(group), (group.device_id,))
+
+        light = SimpleNamespace(device_id="2_2", _id=2)
+        hub._refresh_group_members(hub._groups_to_refresh(light))
+
+        lights._ha_device.refresh_members.assert_called_once_with()
+        shutters._ha_device.refresh_members.assert_not_called()
+
+    def test_group_is_refreshed_when_its_members_change(self) -> None:
+        """A groups file listing the same members leaves the group alone."""
+        hub = _hub()
+        group = self._group("10", ["1"])
+        hub._groups_to_refresh(group)
+
+        self.assertEqual(hub._groups_to_refresh(group), ())
+        group.device_ids = ["2"]
+        self.assertEqual(hub._groups_to_refresh(group), ("10",))
+        self.assertEqual(hub._groups_by_member, {"2": {"10": None}})
+
+
+class HubSceneRelationTests(TestCase):
+    """Scenarios are related to their devices once, then looked up."""
+
+    @staticmethod
+    def _scene(hub: Hub, scene_id: str, group_ids, devices, complete=True):
+        actions = [{"id": group_id} for group_id in group_ids]
+        scene = SimpleNamespace(
+            _device=SimpleNamespace(grpAct=actions),
+            resolve_affected_devices=MagicMock(return_value=(devices, complete)),
+            _invalidate_caches=MagicMock(),
+            entity_id=None,
+        )
+        hub.ha_devices[scene_id] = scene
+        return scene
+
+    def test_relations_answer_both_directions(self) -> None:
+        """Devices of a scenario and scenarios of a device need no search."""
+        hub = _hub()
+        self._scene(hub, "1", [10], {"1_1", "2_2"})
+        self._scene(hub, "2", [], {"2_2"})
+
+        asyncio.run(hub._relate_scenes(["1", "2"]))
+
+        self.assertEqual(hub.scene_relations.devices_of("1"), {"1_1", "2_2"})
+        self.assertEqual(hub.scene_relations.scenes_of("2_2"), ("1", "2"))
+        self.assertEqual(hub.scene_relations.scenes_of_group("10"), ("1",))
+
+        hub.ha_devices["1"].resolve_affected_devices.return_value = ({"2_2"}, True)
+        asyncio.run(hub._relate_scenes(["1"]))
+
+        self.assertEqual(hub.scene_relations.scenes_of("1_1"), ())
+        self.assertEqual(hub.scene_relations.scenes_of("2_2"), ("1", "2"))
+
+    def test_only_scenes_of_changed_groups_are_related_again(self) -> None:
+        """A groups file changing one group relates the scenarios acting on it."""
+        hub = _hub()
+        self._scene(hub, "1", [10], {"1_1"})
+        self._scene(hub, "2", [20], {"2_2"})
+        hub.catalog.groups = {"10": {"devices": ["1"]}, "20": {"devices": ["2"]}}
+        # As for a batch creating the scenarios: groups first, then new scenarios
+        scene_ids = hub._scenes_to_relate(False)
+        scene_ids.update({"1": None, "2": None})
+        asyncio.run(hub._relate_scenes(scene_ids))
+        self.assertEqual(hub._scenes_to_relate(False), {})
+
+        hub.catalog.groups = {"10": {"devices": ["1"]}, "20": {"devices": ["3"]}}
+
+        self.assertEqual(hub._scenes_to_relate(False), {"2": None})
+
+    def test_incomplete_scenes_are_related_when_devices_are_added(self) -> None:
+        """A scenario naming a missing endpoint waits for new devices."""
+        hub = _hub()
+        self._scene(hub, "1", [], set(), complete=False)
+        self._scene(hub, "2", [], {"2_2"})
+        asyncio.run(hub._relate_scenes(["1", "2"]))
+
+        self.assertEqual(hub._scenes_to_relate(False), {})
+        self.assertEqual(hub._scenes_to_relate(True), {"1": None})
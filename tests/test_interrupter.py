@@ -49,6 +49,25 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_path = root / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+codec_spec = importlib.util.spec_from_file_location(codec_name, codec_path)
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, codec_path.with_name("catalog.py")
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_path = (
     root / "custom_components" / "deltadore_tydom" / "tydom" / "MessageHandler.py"
@@ -74,17 +93,7 @@ class TestInterrupter(IsolatedAsyncioTestCase):
     """Exercise physical wall-switch and button discovery."""
 
     def setUp(self) -> None:
-        """Reset global protocol metadata."""
-        for mapping_name in (
-            "device_name",
-            "device_type",
-            "device_metadata",
-            "groups_metadata",
-            "groups_data",
-            "interrupter_endpoint_config",
-            "interrupter_info",
-        ):
-            getattr(handler_module, mapping_name).clear()
+        """Create a handler with a fresh catalogue before each test."""
         logger.reset_mock()
         self.handler = MessageHandler(MagicMock(), b"")
 
@@ -163,10 +172,15 @@ class TestInterrupter(IsolatedAsyncioTestCase):
 
         for endpoint_id in endpoint_ids:
             unique_id = f"{endpoint_id}_{device_id}"
-            handler_module.device_metadata[unique_id] = {
-                "battDefect": {"type": "boolean"},
-                "action": {"type": "string"},
-            }
+            self.handler.catalog.set_endpoint(
+                unique_id,
+                device_id,
+                endpoint_id,
+                metadata={
+                    "battDefect": {"type": "boolean"},
+                    "action": {"type": "string"},
+                },
+            )
 
         devices = await self.handler.parse_devices_data(
             [
@@ -227,6 +241,7 @@ class TestInterrupter(IsolatedAsyncioTestCase):
             ),
         )
 
+        names = set()
         for device_id, endpoints, group_id, name in captures:
             await self._configure_switch(
                 device_id=device_id,
@@ -235,10 +250,13 @@ class TestInterrupter(IsolatedAsyncioTestCase):
                 group_id=group_id,
                 group_name=name,
             )
+            names.update(
+                self.handler.catalog.get(uid).interrupter["name"]
+                for uid in self.handler.catalog.by_device(device_id)
+            )
 
         self.assertEqual(
-            {info["name"] for info in handler_module.interrupter_info.values()},
-            {"Portillon/Portail", "S à Manger/Esc Haut", "Cuisine / Esc Bas"},
+            names, {"Portillon/Portail", "S à Manger/Esc Haut", "Cuisine / Esc Bas"}
         )
 
     async def test_separately_paired_outputs_rebuild_tyxia_2600_identity(
@@ -271,18 +289,16 @@ class TestInterrupter(IsolatedAsyncioTestCase):
             None,
         )
 
-        infos = [
-            handler_module.interrupter_info[f"{endpoint_id}_{device_id}"]
+        records = [
+            self.handler.catalog.get(f"{endpoint_id}_{device_id}")
             for endpoint_id in endpoint_ids
         ]
+        infos = [record.interrupter for record in records]
         self.assertEqual([info["button"] for info in infos], ["A", "B"])
         self.assertEqual({info["name"] for info in infos}, {"Interrupteur 1"})
         self.assertEqual({info["model"] for info in infos}, {"TYXIA 2600"})
         self.assertEqual(
-            [
-                handler_module.device_name[f"{endpoint_id}_{device_id}"]
-                for endpoint_id in endpoint_ids
-            ],
+            [record.name for record in records],
             ["Button A", "Button B"],
         )
 
@@ -333,7 +349,7 @@ class TestInterrupter(IsolatedAsyncioTestCase):
         await device.update_device(expired)
 
         self.assertEqual(device.event_sequence, 1)
-        callback.assert_called_once_with()
+        callback.assert_not_called()
 
 
 if __name__ == "__main__":
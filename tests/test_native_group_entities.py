@@ -157,6 +157,23 @@ class MemberDevice:
         self.remove_callback = MagicMock()
 
 
+class Hub:
+    """Stored devices, resolved by unique ID or device ID like the hub."""
+
+    def __init__(self, devices: dict[str, MemberDevice]) -> None:
+        """Initialise the stored devices."""
+        self.devices = devices
+
+    def resolve_device(self, identifier: str) -> MemberDevice | None:
+        """Get a device by its unique ID, or by its device ID."""
+        if identifier in self.devices:
+            return self.devices[identifier]
+        return next(
+            (device for device in self.devices.values() if device._id == identifier),
+            None,
+        )
+
+
 class NativeGroupEntityTests(IsolatedAsyncioTestCase):
     """Exercise aggregate state and command fan-out."""
 
@@ -168,7 +185,7 @@ class NativeGroupEntityTests(IsolatedAsyncioTestCase):
             member_ids.extend([member._id, member.device_id])
             stored_devices[member.device_id] = member
         group = GroupDevice(usage, member_ids)
-        hass = SimpleNamespace(hub=SimpleNamespace(devices=stored_devices))
+        hass = SimpleNamespace(hub=Hub(stored_devices))
         entity = entity_class(group, hass)
         entity.entity_id = f"{usage}.all_{usage}s"
         return entity
@@ -297,7 +314,7 @@ class NativeGroupEntityTests(IsolatedAsyncioTestCase):
     def test_group_registers_members_discovered_after_entity_creation(self) -> None:
         """Recover when TYDOM sends the group before its physical members."""
         group = GroupDevice("light", ["1", "2"])
-        hass = SimpleNamespace(hub=SimpleNamespace(devices={}))
+        hass = SimpleNamespace(hub=Hub({}))
         entity = HALightGroup(group, hass)
         entity.entity_id = "light.all_lights"
         entity.async_write_ha_state = MagicMock()
@@ -2,6 +2,7 @@
 
 import asyncio
 import importlib.util
+import json
 from pathlib import Path
 import sys
 import types
@@ -53,6 +54,24 @@ _original_modules.setdefault(
 sys.modules[devices_spec.name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_spec = importlib.util.spec_from_file_location(codec_name, tydom_path / "codec.py")
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, tydom_path / "catalog.py"
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_spec = importlib.util.spec_from_file_location(
     "custom_components.deltadore_tydom.tydom.MessageHandler",
     tydom_path / "MessageHandler.py",
@@ -69,6 +88,7 @@ MessageHandler = handler_module.MessageHandler
 TydomLight = devices_module.TydomLight
 TydomEnergy = devices_module.TydomEnergy
 TydomAlarm = devices_module.TydomAlarm
+TydomBoiler = devices_module.TydomBoiler
 
 for name, original in _original_modules.items():
     if original is _MISSING:
@@ -80,11 +100,6 @@ for name, original in _original_modules.items():
 class ProtocolResponseTests(IsolatedAsyncioTestCase):
     """Exercise response acknowledgements and light refresh polling."""
 
-    def setUp(self) -> None:
-        """Reset protocol state shared between tests."""
-        handler_module.device_name.clear()
-        handler_module.device_type.clear()
-
     def test_light_brightness_requires_intermediate_levels(self) -> None:
         """Binary level metadata must not advertise variable brightness."""
         client = MagicMock()
@@ -112,6 +127,54 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
         self.assertFalse(binary_light.supports_brightness)
         self.assertTrue(dimmable_light.supports_brightness)
 
+    async def test_update_notifies_only_changed_attributes(self) -> None:
+        """Callbacks run when a value moves and can see which values moved."""
+
+        def light(data: dict) -> TydomLight:
+            return TydomLight(
+                MagicMock(), "10_20", "20", "Kitchen", "light", "10", None, data
+            )
+
+        device = light({"level": 0, "onFavPos": False})
+        seen = []
+        device.register_callback(lambda: seen.append(device.last_changes))
+
+        self.assertEqual(
+            await device.update_device(light({"level": 0, "onFavPos": False})), set()
+        )
+        self.assertEqual(seen, [])
+
+        changes = await device.update_device(light({"level": 40, "onFavPos": False}))
+
+        self.assertEqual(changes, {"level"})
+        self.assertEqual(seen, [frozenset({"level"})])
+        self.assertEqual(device.level, 40)
+
+    async def test_callbacks_subscribe_to_the_attributes_they_render(self) -> None:
+        """Only subscribers of a changed attribute run; the wildcard always does."""
+        device = TydomLight(
+            MagicMock(), "10_20", "20", "Kitchen", "light", "10", None, {"level": 0}
+        )
+        level, battery, everything = MagicMock(), MagicMock(), MagicMock()
+        device.register_callback(level, attributes={"level"})
+        device.register_callback(battery, attributes={"battDefect"})
+        device.register_callback(everything)
+
+        await device.publish_updates({"level"})
+
+        level.assert_called_once_with()
+        battery.assert_not_called()
+        everything.assert_called_once_with()
+
+        await device.publish_updates()
+
+        battery.assert_called_once_with()
+        device.remove_callback(battery)
+        await device.publish_updates({"battDefect"})
+
+        battery.assert_called_once_with()
+        self.assertEqual(everything.call_count, 3)
+
     async def test_alarm_inventory_merges_labels_and_technical_data(self) -> None:
         """Inventory responses should be useful without exposing other labels."""
         client = MagicMock()
@@ -302,8 +365,7 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
         handler = MessageHandler(client, b"")
         handler.get_type_from_id = MagicMock(return_value="alarm")
         handler.get_name_from_id = MagicMock(return_value="Alarm")
-        reply_event = asyncio.Event()
-        handler._end_reply_events["request-1"] = reply_event
+        reply_future = handler.register_reply("request-1", 30)
 
         await handler.parse_devices_cdata(
             [
@@ -326,23 +388,20 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
             "request-1",
         )
 
-        self.assertTrue(reply_event.is_set())
-        self.assertEqual(
-            handler.get_reply("request-1")["events"][0]["name"], "productConf"
-        )
+        self.assertTrue(reply_future.done())
+        self.assertEqual(reply_future.result()["events"][0]["name"], "productConf")
 
     async def test_alarm_data_after_early_eor_is_not_lost(self) -> None:
         """A TYXAL cdata object arriving just after EOR must win the race."""
         handler = MessageHandler(MagicMock(), b"")
         handler.get_type_from_id = MagicMock(return_value="alarm")
         handler.get_name_from_id = MagicMock(return_value="Alarm")
-        reply_event = asyncio.Event()
-        handler._end_reply_events["request-1"] = reply_event
+        reply_future = handler.register_reply("request-1", 30)
         envelope = {"id": 20, "endpoints": [{"id": 10, "error": 0, "cdata": []}]}
 
         envelope["endpoints"][0]["cdata"] = [{"EOR": True}]
         await handler.parse_devices_cdata([envelope], "request-1")
-        self.assertFalse(reply_event.is_set())
+        self.assertFalse(reply_future.done())
 
         envelope["endpoints"][0]["cdata"] = [
             {
@@ -352,18 +411,15 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
         ]
         await handler.parse_devices_cdata([envelope], "request-1")
 
-        self.assertTrue(reply_event.is_set())
-        self.assertEqual(
-            handler.get_reply("request-1")["events"][0]["name"], "productConf"
-        )
+        self.assertTrue(reply_future.done())
+        self.assertEqual(reply_future.result()["events"][0]["name"], "productConf")
 
     async def test_alarm_eor_only_reply_completes_after_grace_period(self) -> None:
         """A genuinely empty TYXAL reply must still complete promptly."""
         handler = MessageHandler(MagicMock(), b"")
         handler.get_type_from_id = MagicMock(return_value="alarm")
         handler.get_name_from_id = MagicMock(return_value="Alarm")
-        reply_event = asyncio.Event()
-        handler._end_reply_events["request-1"] = reply_event
+        reply_future = handler.register_reply("request-1", 30)
 
         await handler.parse_devices_cdata(
             [
@@ -375,76 +431,460 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
             "request-1",
         )
 
-        await asyncio.wait_for(reply_event.wait(), timeout=0.2)
-        self.assertEqual(handler.get_reply("request-1")["events"], [])
+        reply = await asyncio.wait_for(reply_future, timeout=0.2)
+        self.assertEqual(reply["events"], [])
 
-    async def test_alarm_reply_cache_rollover_keeps_new_reply(self) -> None:
-        """Evicting an old reply must not redirect new data into that reply."""
+    async def test_concurrent_alarm_replies_are_not_forgotten(self) -> None:
+        """Many in-flight requests must each receive their own reply."""
         handler = MessageHandler(MagicMock(), b"")
         handler.get_type_from_id = MagicMock(return_value="alarm")
         handler.get_name_from_id = MagicMock(return_value="Alarm")
-        for request_id in range(5):
-            handler._cdata_replies.append(
-                {
-                    "transaction_id": f"old-request-{request_id}",
-                    "events": [],
-                    "done": False,
-                }
+        futures = {
+            f"request-{request_id}": handler.register_reply(
+                f"request-{request_id}", 30
             )
-        reply_event = asyncio.Event()
-        handler._end_reply_events["new-request"] = reply_event
+            for request_id in range(12)
+        }
 
-        await handler.parse_devices_cdata(
-            [
+        for request_id in reversed(range(12)):
+            await handler.parse_devices_cdata(
+                [
+                    {
+                        "id": 20,
+                        "endpoints": [
+                            {
+                                "id": 10,
+                                "error": 0,
+                                "cdata": [
+                                    {
+                                        "name": "productConf",
+                                        "values": {"id": request_id},
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+                f"request-{request_id}",
+            )
+
+        for transaction_id, future in futures.items():
+            self.assertEqual(
+                future.result()["events"][0]["values"]["id"],
+                int(transaction_id.removeprefix("request-")),
+            )
+        self.assertEqual(handler._pending_replies, {})
+
+    async def test_unanswered_request_expires_at_its_deadline(self) -> None:
+        """The deadline sweep must fail only the requests that timed out."""
+        handler = MessageHandler(MagicMock(), b"")
+        short = handler.register_reply("short", 0.01)
+        long = handler.register_reply("long", 30)
+
+        with self.assertRaises(TimeoutError):
+            await asyncio.wait_for(short, timeout=1)
+
+        self.assertFalse(long.done())
+        self.assertEqual(list(handler._pending_replies), ["long"])
+        handler.remove_reply("long")
+        self.assertTrue(long.cancelled())
+
+    def test_transaction_ids_are_unique_within_one_millisecond(self) -> None:
+        """Requests built back to back must never share a transaction id."""
+        handler = MessageHandler(MagicMock(), b"")
+
+        ids = [handler.prepare_request("GET", "/info")[0] for _ in range(100)]
+
+        self.assertEqual(len(set(ids)), 100)
+        self.assertEqual(ids, sorted(ids))
+        self.assertTrue(all(len(transaction_id) == 13 for transaction_id in ids))
+
+    async def test_rejected_alarm_configuration_redacts_pin(self) -> None:
+        """An alarm PIN in Uri-Origin must never be written to the log."""
+        logger.reset_mock()
+        handler = MessageHandler(MagicMock(), b"")
+        reply_future = handler.register_reply("request-1", 30)
+
+        await handler.route_response(
+            b"HTTP/1.1 403 Forbidden\r\n"
+            b"Uri-Origin: /devices/20/endpoints/10/cdata?name=productConf&pwd=123456&id=4\r\n"
+            b"Content-Type: text/html\r\n"
+            b"Content-Length: 6\r\n"
+            b"Transac-Id: request-1\r\n\r\nDenied"
+        )
+
+        warning = str(logger.warning.call_args)
+        self.assertNotIn("123456", warning)
+        self.assertIn("pwd=***", warning)
+        with self.assertRaises(handler_module.ReplyError) as error:
+            reply_future.result()
+        self.assertIn("HTTP 403", str(error.exception))
+        self.assertIn("Denied", str(error.exception))
+
+    async def test_empty_acknowledgement_completes_pending_command(self) -> None:
+        """A bodyless 200 must resolve the write that carried its Transac-Id."""
+        handler = MessageHandler(MagicMock(), b"")
+        ack = handler.register_reply("1700000000000", 5)
+
+        await handler.route_response(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Uri-Origin: /devices/20/endpoints/10/data\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: 0\r\n"
+            b"Transac-Id: 1700000000000\r\n\r\n"
+        )
+
+        self.assertTrue(ack.done())
+        self.assertEqual(ack.result()["events"], [])
+
+    async def test_unsolicited_device_data_marks_pushing_endpoint(self) -> None:
+        """Only gateway pushes prove that an endpoint reports its own state."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("10_20", 20, 10, name="Kitchen", usage="light")
+        body = b'[{"id": 20, "endpoints": [{"id": 10, "error": 0, "data": []}]}]'
+
+        await handler.route_response(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Uri-Origin: /devices/data\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Transac-Id: 1700000000000\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        self.assertEqual(handler.pushed_endpoints, set())
+
+        await handler.route_response(
+            b"PUT /devices/data HTTP/1.1\r\n"
+            b"Content-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        self.assertEqual(handler.pushed_endpoints, {"10_20"})
+
+    async def test_known_endpoint_data_is_applied_in_place(self) -> None:
+        """Later messages update the first device instead of building new ones."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("10_20", 20, 10, name="Kitchen", usage="light")
+
+        def data(level: int) -> list:
+            return [
                 {
                     "id": 20,
                     "endpoints": [
                         {
                             "id": 10,
                             "error": 0,
-                            "cdata": [
+                            "data": [
                                 {
-                                    "name": "productConf",
-                                    "values": {
-                                        "id": 2,
-                                        "common": {"inactive": False},
-                                    },
+                                    "name": "level",
+                                    "value": level,
+                                    "validity": "upToDate",
                                 }
                             ],
                         }
                     ],
                 }
-            ],
-            "new-request",
+            ]
+
+        [device] = await handler.parse_devices_data(data(0), None)
+        callback = MagicMock()
+        device.register_callback(callback)
+
+        self.assertIs((await handler.parse_devices_data(data(60), None))[0], device)
+        self.assertEqual(device.level, 60)
+        callback.assert_not_called()
+        self.assertEqual(await device.update_device(device), {"level"})
+        callback.assert_called_once_with()
+
+        handler.catalog.set_endpoint("10_20", 20, 10, name="Kitchen", usage="others")
+        [rebuilt] = await handler.parse_devices_data(data(70), None)
+
+        self.assertIsNot(rebuilt, device)
+        self.assertEqual(await device.update_device(rebuilt), {"level"})
+
+    async def test_unchanged_endpoints_are_skipped_until_reconfigured(self) -> None:
+        """A repeated full reply only parses the endpoints whose data moved."""
+        handler = MessageHandler(MagicMock(), b"")
+        config = {
+            "endpoints": [
+                {
+                    "id_endpoint": endpoint_id,
+                    "id_device": 20,
+                    "name": name,
+                    "last_usage": "light",
+                }
+                for endpoint_id, name in ((10, "Kitchen"), (11, "Hall"))
+            ]
+        }
+        await handler.parse_config_data(config, None)
+
+        def reply(kitchen: int, hall: int) -> list:
+            return [
+                {
+                    "id": 20,
+                    "endpoints": [
+                        {
+                            "id": endpoint_id,
+                            "error": 0,
+                            "data": [
+                                {
+                                    "name": "level",
+                                    "value": level,
+                                    "validity": "upToDate",
+                                }
+                            ],
+                        }
+                        for endpoint_id, level in ((10, kitchen), (11, hall))
+                    ],
+                }
+            ]
+
+        self.assertEqual(len(await handler.parse_devices_data(reply(0, 0), "1")), 2)
+        self.assertEqual(await handler.parse_devices_data(reply(0, 0), "2"), [])
+        [kitchen] = await handler.parse_devices_data(reply(30, 0), "3")
+
+        self.assertEqual((kitchen.device_id, kitchen.level), ("10_20", 30))
+        self.assertEqual(handler.endpoint_data_stats, {"unchanged": 3, "changed": 3})
+
+        await handler.parse_config_data(config, None)
+
+        self.assertEqual(len(await handler.parse_devices_data(reply(30, 0), "4")), 2)
+
+    async def test_values_sharing_a_hash_are_not_taken_as_unchanged(self) -> None:
+        """An outdoor temperature going from -1 to -2 is still applied."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("10_20", 20, 10, name="Outdoor", usage="light")
+
+        def reply(value) -> list:
+            data = [{"name": "outTemperature", "value": value, "validity": "upToDate"}]
+            return [{"id": 20, "endpoints": [{"id": 10, "error": 0, "data": data}]}]
+
+        self.assertEqual(hash(-1), hash(-2))
+        await handler.parse_devices_data(reply(-1), None)
+        [device] = await handler.parse_devices_data(reply(-2), None)
+
+        self.assertEqual(device.outTemperature, -2)
+        self.assertEqual(len(await handler.parse_devices_data(reply(1), None)), 1)
+        self.assertEqual(len(await handler.parse_devices_data(reply(True), None)), 1)
+        self.assertEqual(handler.endpoint_data_stats, {"unchanged": 0, "changed": 4})
+
+    async def test_device_updates_are_summarised_periodically(self) -> None:
+        """Per-device lines stay at debug; INFO only gets a periodic count."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("10_20", 20, 10, name="Kitchen", usage="light")
+
+        def parsed(level: int) -> list:
+            data = [{"name": "level", "value": level, "validity": "upToDate"}]
+            return [{"id": 20, "endpoints": [{"id": 10, "error": 0, "data": data}]}]
+
+        logger.info.reset_mock()
+
+        await handler.parse_devices_data(parsed(50), None)
+        logger.info.assert_not_called()
+
+        handler._summary_started -= 301
+        await handler.parse_devices_data(parsed(60), None)
+
+        logger.info.assert_called_once()
+        self.assertEqual(logger.info.call_args.args[1], 2)
+        self.assertEqual(handler._summary_updates, 0)
+
+    async def test_snapshot_restores_catalogue_and_last_states(self) -> None:
+        """A warm start rebuilds devices from the previous run's replies."""
+        handler = MessageHandler(MagicMock(), b"")
+        config = (
+            b'{"endpoints": [{"id_endpoint": 10, "id_device": 20,'
+            b' "name": "Kitchen", "last_usage": "light"}]}'
         )
+        data = (
+            b'[{"id": 20, "endpoints": [{"id": 10, "error": 0, "data":'
+            b' [{"name": "level", "value": 50, "validity": "upToDate"}]}]}]'
+        )
+        for uri, body in ((b"/configs/file", config), (b"/devices/data", data)):
+            await handler.route_response(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Uri-Origin: " + uri + b"\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Transac-Id: 1700000000000\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+        snapshot = json.loads(json.dumps(handler.export_snapshot()))
 
-        self.assertTrue(reply_event.is_set())
-        reply = handler.get_reply("new-request")
-        self.assertIsNotNone(reply)
-        self.assertEqual(reply["events"][0]["name"], "productConf")
+        restored = MessageHandler(MagicMock(), b"")
+        devices = await restored.restore_snapshot(snapshot)
 
-    async def test_rejected_alarm_configuration_redacts_pin(self) -> None:
-        """An alarm PIN in Uri-Origin must never be written to the log."""
-        logger.reset_mock()
+        self.assertEqual(len(devices), 1)
+        self.assertIsInstance(devices[0], TydomLight)
+        self.assertEqual(devices[0].device_name, "Kitchen")
+        self.assertEqual(devices[0].level, 50)
+        self.assertEqual(restored.pushed_endpoints, set())
+        self.assertEqual(restored.export_snapshot(), snapshot)
+
+    async def test_snapshot_keeps_area_link_of_endpoints(self) -> None:
+        """Area-linked thermostats are rebuilt from a warm start."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint(
+            "10_20", 20, 10, name="Living room", usage="re2020ControlBoiler"
+        )
+        parsed = [
+            {
+                "id": 20,
+                "endpoints": [
+                    {
+                        "id": 10,
+                        "error": 0,
+                        "link": {"type": "area", "id": 7},
+                        "data": [
+                            {
+                                "name": "temperature",
+                                "value": 20.5,
+                                "validity": "upToDate",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+        [live] = await handler.parse_devices_data(parsed, None)
+        snapshot = json.loads(json.dumps(handler.export_snapshot()))
+
+        restored = MessageHandler(MagicMock(), b"")
+        restored.catalog.set_endpoint(
+            "10_20", 20, 10, name="Living room", usage="re2020ControlBoiler"
+        )
+        [device] = await restored.restore_snapshot(snapshot)
+
+        self.assertIsInstance(live, TydomBoiler)
+        self.assertIsInstance(device, TydomBoiler)
+        self.assertEqual(
+            snapshot["devices"][0]["endpoints"][0]["link"], {"type": "area", "id": 7}
+        )
+
+    async def test_catalogue_is_per_gateway_and_follows_configs_file(self) -> None:
+        """Gateways sharing IDs keep their names; unlisted endpoints are dropped."""
+
+        def config(*names: str) -> dict:
+            return {
+                "endpoints": [
+                    {
+                        "id_endpoint": 10 + index,
+                        "id_device": 20,
+                        "name": name,
+                        "last_usage": "light",
+                    }
+                    for index, name in enumerate(names)
+                ]
+            }
+
+        first = MessageHandler(MagicMock(), b"")
+        second = MessageHandler(MagicMock(), b"")
+        await first.parse_config_data(config("Kitchen", "Hall"), None)
+        await second.parse_config_data(config("Garage"), None)
+
+        self.assertEqual(first.catalog.name("10_20"), "Kitchen")
+        self.assertEqual(second.catalog.name("10_20"), "Garage")
+        self.assertEqual(first.catalog.by_device(20), ("10_20", "11_20"))
+
+        first.catalog.set_endpoint("11_20_area_climate", 20, 11, parent="11_20")
+        await first.parse_config_data(config("Kitchen"), None)
+
+        self.assertNotIn("11_20", first.catalog)
+        self.assertEqual(first.catalog.by_usage("light"), ("10_20",))
+        self.assertEqual(first.removed_endpoints, ["11_20", "11_20_area_climate"])
+
+    async def test_data_received_before_configs_file_is_replayed(self) -> None:
+        """Endpoints are not dropped when /devices/data overtakes the catalogue."""
         handler = MessageHandler(MagicMock(), b"")
-        reply_event = asyncio.Event()
-        handler._end_reply_events["request-1"] = reply_event
+        handler.start_bootstrap()
+        handler.expect_configs_file()
+        data = (
+            b'[{"id": 20, "endpoints": [{"id": 10, "error": 0, "data":'
+            b' [{"name": "level", "value": 50, "validity": "upToDate"}]}]}]'
+        )
+        config = (
+            b'{"endpoints": [{"id_endpoint": 10, "id_device": 20,'
+            b' "name": "Kitchen", "last_usage": "light"}]}'
+        )
+
+        replies = []
+        for uri, body in ((b"/devices/data", data), (b"/configs/file", config)):
+            replies.append(
+                await handler.route_response(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Uri-Origin: " + uri + b"\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Transac-Id: 1700000000000\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+            )
+
+        self.assertEqual(replies[0], [])
+        self.assertEqual([device.device_name for device in replies[1]], ["Kitchen"])
+        self.assertEqual(replies[1][0].level, 50)
+        self.assertEqual(
+            set(handler.bootstrap_timings), {"/devices/data", "/configs/file"}
+        )
+
+    async def test_held_endpoints_are_released_when_configs_file_fails(self) -> None:
+        """Holding logs nothing and a broken catalogue still releases held data."""
+        handler = MessageHandler(MagicMock(), b"")
+        handler.expect_configs_file()
+        data = (
+            b'[{"id": 20, "endpoints": [{"id": 10, "error": 0, "data":'
+            b' [{"name": "level", "value": 50, "validity": "upToDate"}]}]}]'
+        )
+
+        def reply(uri: bytes, body: bytes) -> bytes:
+            return (
+                b"HTTP/1.1 200 OK\r\n"
+                b"Uri-Origin: " + uri + b"\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Transac-Id: 1700000000000\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+
+        with self.assertNoLogs(level="WARNING"):
+            await handler.route_response(reply(b"/devices/data", data))
+        self.assertEqual(len(handler._held_endpoints), 1)
 
         await handler.route_response(
-            b"HTTP/1.1 403 Forbidden\r\n"
-            b"Uri-Origin: /devices/20/endpoints/10/cdata?name=productConf&pwd=123456&id=4\r\n"
-            b"Content-Type: text/html\r\n"
-            b"Content-Length: 6\r\n"
-            b"Transac-Id: request-1\r\n\r\nDenied"
+            reply(b"/configs/file", b'{"endpoints": [{"id_endpoint": 10}]}')
         )
 
-        warning = str(logger.warning.call_args)
-        self.assertNotIn("123456", warning)
-        self.assertIn("pwd=***", warning)
-        self.assertTrue(reply_event.is_set())
-        error = handler.get_reply_error("request-1")
-        self.assertIn("HTTP 403", error)
-        self.assertIn("Denied", error)
+        self.assertEqual(handler._held_endpoints, [])
+        self.assertFalse(handler._configs_file_pending())
+
+    async def test_acknowledged_light_command_skips_poll_for_pushing_device(
+        self,
+    ) -> None:
+        """Devices confirming by push must not be polled after an ack."""
+        client = MagicMock()
+        client.put_devices_data = AsyncMock(
+            return_value=MagicMock(acknowledged=True)
+        )
+        client.confirms_by_push.return_value = True
+        light = TydomLight(
+            client,
+            "10_20",
+            "20",
+            "Kitchen",
+            "light",
+            "10",
+            {"levelCmd": {"enum_values": ["ON", "OFF"]}},
+            {"level": 0},
+        )
+
+        await light.turn_on(None)
+        client.add_poll_device_url_1s.assert_not_called()
+
+        client.put_devices_data.return_value = MagicMock(acknowledged=False)
+        await light.turn_off()
+        client.add_poll_device_url_1s.assert_called_once_with(
+            "/devices/20/endpoints/10/data"
+        )
 
     async def test_empty_ping_acknowledgement_updates_liveness(self) -> None:
         """The gateway's bodyless ping response must clear a pending ping."""
@@ -478,13 +918,35 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
         )
 
         self.assertIsNone(devices)
+        await handler._events_refresh_task
         client.get_devices_data.assert_awaited_once_with()
         logger.warning.assert_not_called()
 
+    async def test_event_refresh_does_not_block_the_reader(self) -> None:
+        """Events are routed while the refresh waits for the request budget."""
+        client = MagicMock()
+        released = asyncio.Event()
+
+        async def get_devices_data() -> None:
+            await released.wait()
+
+        client.get_devices_data = AsyncMock(side_effect=get_devices_data)
+        handler = MessageHandler(client, b"")
+        event = b"POST /events HTTP/1.1\r\nContent-Length: 0\r\n\r\n"
+
+        await handler.route_response(event)
+        await handler.route_response(event)
+        await asyncio.sleep(0)
+        released.set()
+        await handler._events_refresh_task
+
+        client.get_devices_data.assert_awaited_once_with()
+
     async def test_light_commands_poll_regular_data_endpoint(self) -> None:
         """Light state refreshes must use the supported data endpoint."""
         client = MagicMock()
         client.put_devices_data = AsyncMock()
+        client.confirms_by_push.return_value = False
         light = TydomLight(
             client,
             "10_20",
@@ -519,9 +981,8 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
 
     async def test_energy_cdata_combines_supported_readings(self) -> None:
         """Captured TYWATT cdata shapes must become one energy update."""
-        handler_module.device_name["20_10"] = "TYWATT"
-        handler_module.device_type["20_10"] = "conso"
         handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("20_10", 10, 20, name="TYWATT", usage="conso")
 
         devices = await handler.parse_devices_cdata(
             [
@@ -588,9 +1049,8 @@ class ProtocolResponseTests(IsolatedAsyncioTestCase):
 
     async def test_energy_cdata_ignores_failed_and_malformed_values(self) -> None:
         """Unsupported cdata replies must not create misleading sensors."""
-        handler_module.device_name["20_10"] = "TYWATT"
-        handler_module.device_type["20_10"] = "conso"
         handler = MessageHandler(MagicMock(), b"")
+        handler.catalog.set_endpoint("20_10", 10, 20, name="TYWATT", usage="conso")
 
         devices = await handler.parse_devices_cdata(
             [
@@ -51,6 +51,25 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_path = root / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+codec_spec = importlib.util.spec_from_file_location(codec_name, codec_path)
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, codec_path.with_name("catalog.py")
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_path = (
     root / "custom_components" / "deltadore_tydom" / "tydom" / "MessageHandler.py"
@@ -93,17 +112,7 @@ class TestRemoteControl(IsolatedAsyncioTestCase):
     """Exercise physical remote and per-button discovery."""
 
     def setUp(self) -> None:
-        """Reset global protocol metadata."""
-        for mapping_name in (
-            "device_name",
-            "device_type",
-            "device_metadata",
-            "groups_metadata",
-            "groups_data",
-            "endpoint_config",
-            "remote_control_info",
-        ):
-            getattr(handler_module, mapping_name).clear()
+        """Create a handler with a fresh catalogue before each test."""
         logger.reset_mock()
         self.handler = MessageHandler(MagicMock(), b"")
 
@@ -181,10 +190,15 @@ class TestRemoteControl(IsolatedAsyncioTestCase):
 
         for endpoint_id in endpoint_ids:
             unique_id = f"{endpoint_id}_{device_id}"
-            handler_module.device_metadata[unique_id] = {
-                "battDefect": {"type": "boolean"},
-                "action": {"type": "string"},
-            }
+            self.handler.catalog.set_endpoint(
+                unique_id,
+                device_id,
+                endpoint_id,
+                metadata={
+                    "battDefect": {"type": "boolean"},
+                    "action": {"type": "string"},
+                },
+            )
 
         devices = await self.handler.parse_devices_data(
             [
@@ -238,24 +252,12 @@ class TestRemoteControl(IsolatedAsyncioTestCase):
             button_count=4,
         )
 
-        self.assertEqual(
-            [
-                handler_module.remote_control_info[
-                    f"{endpoint_id}_{device_id}"
-                ]["button_number"]
-                for endpoint_id in endpoint_ids
-            ],
-            [1, 2, 3, 4],
-        )
-        self.assertEqual(
-            {
-                handler_module.remote_control_info[
-                    f"{endpoint_id}_{device_id}"
-                ]["model"]
-                for endpoint_id in endpoint_ids
-            },
-            {"TYXIA 1410"},
-        )
+        infos = [
+            self.handler.catalog.get(f"{endpoint_id}_{device_id}").remote_control
+            for endpoint_id in endpoint_ids
+        ]
+        self.assertEqual([info["button_number"] for info in infos], [1, 2, 3, 4])
+        self.assertEqual({info["model"] for info in infos}, {"TYXIA 1410"})
 
     async def test_only_fresh_non_idle_action_advances_event_sequence(self) -> None:
         """Polling without a fresh action must not repeat the previous press."""
@@ -305,7 +307,7 @@ class TestRemoteControl(IsolatedAsyncioTestCase):
         await device.update_device(expired)
 
         self.assertEqual(device.event_sequence, 1)
-        callback.assert_called_once_with()
+        callback.assert_not_called()
 
 
 class _Registry:
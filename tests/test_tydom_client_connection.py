@@ -6,7 +6,7 @@ from pathlib import Path
 import sys
 import types
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 _MISSING = object()
 _original_modules: dict[str, object] = {}
@@ -50,8 +50,6 @@ _module("async_timeout", timeout=MagicMock())
 _module("homeassistant")
 _module("homeassistant.helpers")
 _module("homeassistant.helpers.aiohttp_client", async_create_clientsession=MagicMock())
-_module("requests")
-_module("requests.auth", HTTPDigestAuth=MagicMock())
 _module("urllib3", encode_multipart_formdata=MagicMock())
 
 logger = MagicMock()
@@ -61,6 +59,7 @@ _module(
     LOGGER=logger,
     STRUCTURED_LOGGER=structured_logger,
     validate_value_with_metadata=MagicMock(),
+    TIMEOUT_COMMAND_ACK=5.0,
     TIMEOUT_NORMAL_REQUEST=30.0,
     TIMEOUT_LONG_REQUEST=60.0,
     TIMEOUT_WEBSOCKET_CONNECT=30.0,
@@ -76,19 +75,31 @@ _module(
     DELTADORE_AUTH_URL="",
     MEDIATION_URL="mediation.tydom.com",
 )
+
+
+class _ReplyError(Exception):
+    """Stand-in for MessageHandler.ReplyError."""
+
+
 _module(
     "custom_components.deltadore_tydom.tydom.MessageHandler",
     MessageHandler=MagicMock(),
+    ReplyError=_ReplyError,
 )
 
-module_name = "custom_components.deltadore_tydom.tydom.tydom_client"
-client_path = (
-    Path(__file__).parents[1]
-    / "custom_components"
-    / "deltadore_tydom"
-    / "tydom"
-    / "tydom_client.py"
+tydom_path = (
+    Path(__file__).parents[1] / "custom_components" / "deltadore_tydom" / "tydom"
 )
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_spec = importlib.util.spec_from_file_location(codec_name, tydom_path / "codec.py")
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+module_name = "custom_components.deltadore_tydom.tydom.tydom_client"
+client_path = tydom_path / "tydom_client.py"
 spec = importlib.util.spec_from_file_location(module_name, client_path)
 assert spec is not None and spec.loader is not None
 client_module = importlib.util.module_from_spec(spec)
@@ -201,14 +212,13 @@ class TestManagedConnection(IsolatedAsyncioTestCase):
         """A gateway rejection must not be returned as an empty success."""
         client = self._client()
 
-        def prepare_request(_method, _url, _body, _headers, reply_event):
-            reply_event.set()
-            return "request-1", b"request"
-
-        client._message_handler.prepare_request = MagicMock(side_effect=prepare_request)
-        client._message_handler.get_reply_error = MagicMock(
-            return_value="HTTP 403: The data is not writable"
+        reply_future = asyncio.get_running_loop().create_future()
+        reply_future.set_exception(_ReplyError("HTTP 403: The data is not writable"))
+        client._message_handler.in_flight_window = asyncio.Semaphore(1)
+        client._message_handler.prepare_request = MagicMock(
+            return_value=("request-1", b"request")
         )
+        client._message_handler.register_reply = MagicMock(return_value=reply_future)
         client.send_bytes = AsyncMock()
 
         with self.assertRaisesRegex(TydomClientApiClientCommunicationError, "HTTP 403"):
@@ -216,6 +226,230 @@ class TestManagedConnection(IsolatedAsyncioTestCase):
                 "GET", "/cdata?name=productConf&pwd=123456"
             )
 
+    async def test_in_flight_window_bounds_concurrent_requests(self) -> None:
+        """Requests beyond the window must wait for an earlier reply."""
+        client = self._client()
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future(), loop.create_future()]
+        client._message_handler.in_flight_window = asyncio.Semaphore(1)
+        client._message_handler.prepare_request = MagicMock(
+            side_effect=[("request-1", b"first"), ("request-2", b"second")]
+        )
+        client._message_handler.register_reply = MagicMock(side_effect=futures)
+        client.send_bytes = AsyncMock()
+
+        first = asyncio.create_task(client.get_reply_to_request("GET", "/first"))
+        second = asyncio.create_task(client.get_reply_to_request("GET", "/second"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        client.send_bytes.assert_awaited_once_with(b"first")
+        futures[0].set_result({"events": [{"name": "first"}]})
+        self.assertEqual(await first, [{"name": "first"}])
+        await asyncio.sleep(0)
+        client.send_bytes.assert_awaited_with(b"second")
+        futures[1].set_result({"events": []})
+        self.assertEqual(await second, [])
+
+    def _command_client(self, reply_future: asyncio.Future) -> TydomClient:
+        client = self._client()
+        client._message_handler.in_flight_window = asyncio.Semaphore(1)
+        client._message_handler.prepare_request = MagicMock(
+            return_value=("1700000000000", b"PUT")
+        )
+        client._message_handler.register_reply = MagicMock(return_value=reply_future)
+        client.send_bytes = AsyncMock()
+        client._command_acks_seen = True
+        return client
+
+    async def test_device_command_waits_for_gateway_acknowledgement(self) -> None:
+        """Writes carry a real Transac-Id and report their round-trip latency."""
+        reply_future = asyncio.get_running_loop().create_future()
+        reply_future.set_result({"events": []})
+        client = self._command_client(reply_future)
+
+        result = await client.put_devices_data("20", "10", "level", 42)
+
+        client._message_handler.prepare_request.assert_called_once_with(
+            "PUT",
+            "/devices/20/endpoints/10/data",
+            b'[{"name": "level", "value": 42}]',
+            {"Content-Type": "application/json; charset=UTF-8"},
+        )
+        client._message_handler.register_reply.assert_called_once_with(
+            "1700000000000", 5.0
+        )
+        client.send_bytes.assert_awaited_once_with(b"PUT", max_retries=2)
+        self.assertTrue(result.acknowledged)
+        self.assertEqual(result.transaction_id, "1700000000000")
+        self.assertGreaterEqual(result.latency, 0)
+
+    async def test_rejected_device_command_reports_gateway_error(self) -> None:
+        """A 4xx acknowledgement must reach the caller instead of a poll."""
+        reply_future = asyncio.get_running_loop().create_future()
+        reply_future.set_exception(_ReplyError("HTTP 403: read only"))
+        client = self._command_client(reply_future)
+
+        result = await client.put_area_data("3", "setpoint", 21)
+
+        self.assertFalse(result.acknowledged)
+        self.assertEqual(result.error, "HTTP 403: read only")
+
+    async def test_unacknowledged_device_command_times_out_softly(self) -> None:
+        """Firmwares that never ack a write must fall back to polling."""
+        reply_future = asyncio.get_running_loop().create_future()
+        reply_future.set_exception(TimeoutError())
+        client = self._command_client(reply_future)
+
+        result = await client.put_home_hvac_mode("HEATING")
+
+        self.assertFalse(result.acknowledged)
+        self.assertEqual(result.error, "timeout")
+
+    async def test_command_returns_once_sent_until_gateway_acks(self) -> None:
+        """Gateways not yet seen to ack writes must not block the caller."""
+        reply_future = asyncio.get_running_loop().create_future()
+        client = self._command_client(reply_future)
+        client._command_acks_seen = False
+
+        result = await client.put_devices_data("20", "10", "level", 42)
+
+        self.assertTrue(result.pending)
+        self.assertFalse(result.acknowledged)
+        reply_future.set_exception(_ReplyError("HTTP 403: read only"))
+
+        self.assertIs(await result.wait_acknowledgement(), result)
+        self.assertFalse(result.pending)
+        self.assertEqual(result.error, "HTTP 403: read only")
+        self.assertGreaterEqual(result.latency, 0)
+        self.assertFalse(client._command_acks_seen)
+
+    async def test_background_ack_switches_commands_to_waiting(self) -> None:
+        """Once an ack is seen, later writes wait for their own."""
+        reply_future = asyncio.get_running_loop().create_future()
+        client = self._command_client(reply_future)
+        client._command_acks_seen = False
+
+        result = await client.put_devices_data("20", "10", "level", 42)
+        reply_future.set_result({"events": []})
+        await result.wait_acknowledgement()
+
+        self.assertTrue(result.acknowledged)
+        self.assertTrue(client._command_acks_seen)
+
+    async def test_multi_attribute_write_uses_one_frame(self) -> None:
+        """Several registers of one endpoint are written in a single request."""
+        reply_future = asyncio.get_running_loop().create_future()
+        reply_future.set_result({"events": []})
+        client = self._command_client(reply_future)
+        client_module.validate_value_with_metadata.reset_mock()
+        client_module.validate_value_with_metadata.return_value = (True, None)
+        device = MagicMock()
+
+        result = await client.put_devices_data_many(
+            "20", "10", {"hvacMode": "STOP", "antifrostOn": True}, device=device
+        )
+
+        client._message_handler.prepare_request.assert_called_once_with(
+            "PUT",
+            "/devices/20/endpoints/10/data",
+            b'[{"name": "hvacMode", "value": "STOP"}, '
+            b'{"name": "antifrostOn", "value": true}]',
+            {"Content-Type": "application/json; charset=UTF-8"},
+        )
+        self.assertEqual(
+            client_module.validate_value_with_metadata.call_args_list,
+            [
+                call(device, "hvacMode", "STOP"),
+                call(device, "antifrostOn", True),
+            ],
+        )
+        self.assertTrue(result.acknowledged)
+
+    async def test_invalid_multi_attribute_write_sends_nothing(self) -> None:
+        """One invalid value rejects the whole batch before it reaches the box."""
+        client = self._client()
+        client.send_bytes = AsyncMock()
+        client_module.validate_value_with_metadata.side_effect = [
+            (True, None),
+            (False, "La valeur doit être booléenne pour antifrostOn"),
+        ]
+        try:
+            with self.assertRaisesRegex(ValueError, "antifrostOn"):
+                await client.put_devices_data_many(
+                    "20", "10", {"hvacMode": "STOP", "antifrostOn": 1}, MagicMock()
+                )
+        finally:
+            client_module.validate_value_with_metadata.side_effect = None
+
+        client.send_bytes.assert_not_awaited()
+
+    async def test_burst_of_writes_sends_only_latest_value(self) -> None:
+        """Superseded slider values resolve with the final write outcome."""
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            command_coalesce_window=0.01,
+        )
+        first_ack = asyncio.get_running_loop().create_future()
+        sent: list[bytes] = []
+
+        async def send_command(_method, _url, body, _max_retries):
+            sent.append(body)
+            if len(sent) == 1:
+                await first_ack
+            return body
+
+        client._send_command = AsyncMock(side_effect=send_command)
+
+        calls = [asyncio.create_task(client.put_devices_data("20", "10", "level", 10))]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        calls += [
+            asyncio.create_task(client.put_devices_data("20", "10", "level", level))
+            for level in (20, 30)
+        ]
+        other = asyncio.create_task(client.put_devices_data("20", "11", "level", 5))
+        await asyncio.sleep(0)
+        first_ack.set_result(None)
+        results = await asyncio.gather(*calls, other)
+
+        self.assertEqual(
+            sent,
+            [
+                '[{"name": "level", "value": 10}]',
+                '[{"name": "level", "value": 5}]',
+                '[{"name": "level", "value": 30}]',
+            ],
+        )
+        self.assertEqual(results[0], '[{"name": "level", "value": 10}]')
+        self.assertEqual(results[1], results[2])
+        self.assertEqual(results[2], '[{"name": "level", "value": 30}]')
+        await asyncio.sleep(0.05)
+        self.assertEqual(client._coalesced_commands, {})
+
+    async def test_disabled_coalescing_sends_every_write(self) -> None:
+        """A zero window keeps the historical one-frame-per-call behaviour."""
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            command_coalesce_window=0,
+        )
+        client._send_command = AsyncMock(return_value="ok")
+
+        await asyncio.gather(
+            client.put_area_data("3", "setpoint", 20),
+            client.put_area_data("3", "setpoint", 21),
+        )
+
+        self.assertEqual(client._send_command.await_count, 2)
+
     async def test_alarm_product_configuration_uses_encoded_pin(self) -> None:
         """The read command must follow the official query-string protocol."""
         client = self._client()
@@ -495,6 +729,86 @@ class TestManagedConnection(IsolatedAsyncioTestCase):
         self.assertIs(client._connection, candidate)
         self.assertTrue(client._connection_ready)
 
+    async def test_unreachable_gateway_fails_over_to_standby_path(self) -> None:
+        """The standby path takes over without waiting for the backoff."""
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            standby_host="mediation.tydom.com",
+        )
+        standby = _websocket()
+
+        async def connect():
+            if client._host == "local":
+                raise TydomClientApiClientCommunicationError("unreachable")
+            return standby
+
+        client.async_connect = AsyncMock(side_effect=connect)
+        client._initialise_connection = AsyncMock()
+
+        self.assertIs(await client.async_connect_and_initialise(), standby)
+        self.assertEqual(client._cmd_prefix, b"\x02")
+        self.assertEqual(client._message_handler.cmd_prefix, b"\x02")
+        self.assertEqual(
+            [(path["host"], path["active"]) for path in client.paths],
+            [("mediation.tydom.com", True), ("local", False)],
+        )
+
+    async def test_connection_changes_are_reported_once(self) -> None:
+        """Listeners hear about each change of the connection state only."""
+        states = []
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            connection_callback=states.append,
+        )
+        client.async_connect = AsyncMock(return_value=_websocket())
+        client._initialise_connection = AsyncMock()
+
+        await client.async_connect_and_initialise()
+        await client.async_connect_and_initialise()
+        client._connection_ready = False
+        client._connection_ready = False
+
+        self.assertEqual(states, [True, False])
+
+    async def test_faster_standby_path_takes_over_after_probe(self) -> None:
+        """A recovered local gateway is used again once it answers faster."""
+        states = []
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="cloud",
+            standby_host="local",
+            connection_callback=states.append,
+        )
+        client._paths[0].record_rtt(5.0)
+        client._connection = _websocket()
+        client._connection_ready = True
+        client._session = MagicMock(closed=False)
+        client._request_nonce = AsyncMock(return_value="nonce")
+
+        await client.probe_standby_paths()
+
+        client._request_nonce.assert_awaited_once()
+        self.assertEqual(client._request_nonce.call_args.args[1], "local")
+        self.assertFalse(client._connection_ready)
+        client.async_connect = AsyncMock(return_value=_websocket())
+        client._initialise_connection = AsyncMock()
+        client._wait_or_shutdown = AsyncMock(return_value=False)
+        self.assertTrue(await client._reconnect_with_backoff())
+        self.assertEqual(client._host, "local")
+        # Moving to another path is not reported as an outage.
+        self.assertEqual(states, [True])
+
     async def test_writer_uses_managed_reconnect_after_send_failure(self) -> None:
         """A writer must not create or assign a replacement socket itself."""
         client = self._client()
@@ -517,6 +831,162 @@ class TestManagedConnection(IsolatedAsyncioTestCase):
         client._reconnect_with_backoff.assert_awaited_once()
         replacement.send_bytes.assert_awaited_once_with(b"request")
 
+    async def test_incoming_frame_is_not_rendered_without_debug_logging(self) -> None:
+        """Frames are neither decoded nor redacted when debug logs are off."""
+        client = self._client()
+        frame = b"PUT /devices/data HTTP/1.1\r\n\r\n"
+        client._connection = _websocket()
+        client._connection.receive = AsyncMock(
+            return_value=MagicMock(type="TEXT", data=frame)
+        )
+        client._connection_ready = True
+        client._message_handler.route_response = AsyncMock(return_value=None)
+
+        with (
+            patch.object(logger, "isEnabledFor", return_value=False),
+            patch.object(client_module, "sanitize_log_message") as sanitize,
+        ):
+            await client.consume_messages()
+
+        sanitize.assert_not_called()
+        client._message_handler.route_response.assert_awaited_once_with(frame)
+
+    async def test_flight_recorder_keeps_the_last_frames_both_ways(self) -> None:
+        """Sent and routed frames are kept, bounded and exported redacted."""
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            flight_recorder_size=2,
+        )
+        client._connection = _websocket()
+        client._connection_ready = True
+        client._message_handler.route_response = AsyncMock(return_value=None)
+        frame = (
+            b"HTTP/1.1 200 OK\r\nServer: Tydom-001122334455\r\n"
+            b"Uri-Origin: /info\r\nTransac-Id: 42\r\nContent-Length: 2\r\n\r\n{}"
+        )
+        client._connection.receive = AsyncMock(
+            return_value=MagicMock(type="TEXT", data=frame)
+        )
+
+        await client.send_bytes(b"GET /ping HTTP/1.1\r\n\r\n")
+        await client.send_bytes(
+            b'PUT /x HTTP/1.1\r\nTransac-Id: 41\r\n\r\n{"pwd": "1234"}'
+        )
+        await client.consume_messages()
+
+        exported = client.export_flight_recorder()
+        self.assertEqual(len(client.flight_recorder), 2)
+        sent, received = exported["frames"]
+        self.assertEqual(
+            (sent["direction"], sent["transaction_id"], sent["uri"]),
+            ("out", "41", "/x"),
+        )
+        self.assertNotIn("1234", sent["frame"])
+        self.assertEqual(
+            (received["direction"], received["transaction_id"], received["uri"]),
+            ("in", "42", "/info"),
+        )
+        self.assertIsNotNone(received["parse_duration"])
+        self.assertNotIn("001122334455", received["frame"])
+        self.assertEqual(
+            exported["traces"],
+            "HTTP/1.1 200 OK\\r\\nServer: Tydom-***\\r\\nUri-Origin: /info\\r\\n"
+            "Transac-Id: 42\\r\\nContent-Length: 2\\r\\n\\r\\n{}\n",
+        )
+
+    async def test_flight_recorder_strips_the_prefix_of_each_path(self) -> None:
+        """Frames sent before a failover are decoded with their own prefix."""
+        client = TydomClient(
+            None, "test", "001122334455", "password", host="mediation.tydom.com"
+        )
+        client._connection = _websocket()
+        client._connection_ready = True
+
+        await client.send_bytes(b"\x02PUT /remote HTTP/1.1\r\nTransac-Id: 1\r\n\r\n")
+        client._use_path(client_module.ConnectionPath("local"))
+        await client.send_bytes(b"PUT /local HTTP/1.1\r\nTransac-Id: 2\r\n\r\n")
+
+        self.assertEqual(
+            [frame["frame"] for frame in client.export_flight_recorder()["frames"]],
+            [
+                "PUT /remote HTTP/1.1\r\nTransac-Id: 1\r\n\r\n",
+                "PUT /local HTTP/1.1\r\nTransac-Id: 2\r\n\r\n",
+            ],
+        )
+
+    def test_digest_authorization_matches_rfc_2617_example(self) -> None:
+        """The native digest must match the reference computation."""
+        header = client_module.build_digest_authorization(
+            "Mufasa",
+            "Circle Of Life",
+            "testrealm@host.com",
+            "GET",
+            "/dir/index.html",
+            "dcd98b7102dd2f0e8b11d0f600bfb0c093",
+            cnonce="0a4f113b",
+        )
+
+        self.assertIn('response="6629fae49393a05397450978507c4ef1"', header)
+        self.assertIn('qop="auth", nc=00000001, cnonce="0a4f113b"', header)
+
+    async def test_reconnects_reuse_session_and_tls_context(self) -> None:
+        """Only the first connection pays for the session and TLS setup."""
+        client = self._client()
+        response = MagicMock(
+            status=401,
+            headers={"WWW-Authenticate": 'Digest realm="x", nonce="abc123=="'},
+        )
+        response.text = AsyncMock(return_value="")
+        session = MagicMock(closed=False)
+        session.request.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.request.return_value.__aexit__ = AsyncMock(return_value=False)
+        session.ws_connect = AsyncMock(side_effect=[_websocket(), _websocket()])
+        session.close = AsyncMock()
+        client_module._SSL_CONTEXTS.clear()
+
+        with (
+            patch.object(
+                client_module, "async_create_clientsession", return_value=session
+            ) as create_session,
+            patch.object(
+                client_module.asyncio, "to_thread", wraps=asyncio.to_thread
+            ) as to_thread,
+        ):
+            await client.async_connect()
+            await client.async_connect()
+
+        create_session.assert_called_once()
+        to_thread.assert_called_once()
+        ssl_contexts = {c.kwargs["ssl"] for c in session.ws_connect.call_args_list}
+        self.assertEqual(len(ssl_contexts), 1)
+        authorization = session.ws_connect.call_args.kwargs["headers"]["Authorization"]
+        self.assertTrue(
+            authorization.startswith(
+                'Digest username="001122334455", realm="protected area", '
+                'nonce="abc123==", uri="/mediation/client?mac=001122334455&appli=1"'
+            )
+        )
+        self.assertEqual(
+            set(client.connect_timings), {"handshake", "websocket", "total"}
+        )
+
+        await client.async_disconnect()
+        session.close.assert_awaited_once()
+
+    def test_logged_frame_is_truncated_after_redaction(self) -> None:
+        """A secret straddling the truncation limit must not leak."""
+        frame = b"x" * 1000 + b'{"pwd": "' + b"9" * 40 + b'"}' + b"x" * 2000
+
+        rendered = str(client_module.LogFrame(frame, "password"))
+
+        self.assertNotIn("9999", rendered)
+        self.assertTrue(rendered.endswith(f"... ({len(frame)} bytes)"))
+        self.assertLess(len(rendered), 1100)
+
 
 class TestDevicePolling(IsolatedAsyncioTestCase):
     """Exercise adaptive polling URL construction."""
@@ -524,6 +994,83 @@ class TestDevicePolling(IsolatedAsyncioTestCase):
     def _client(self) -> TydomClient:
         return TydomClient(None, "test", "001122334455", "password", host="local")
 
+    async def test_interactive_frames_preempt_queued_background_polls(self) -> None:
+        """A user command must be written before pending background polls."""
+        client = self._client()
+        connection = _websocket()
+        client._connection = connection
+        client._connection_ready = True
+        release = asyncio.Event()
+        written: list[bytes] = []
+
+        async def send_bytes(frame: bytes) -> None:
+            written.append(frame)
+            if frame == b"poll-0":
+                await release.wait()
+
+        connection.send_bytes = AsyncMock(side_effect=send_bytes)
+
+        async def poll() -> None:
+            client.set_send_priority(client_module.SendPriority.BACKGROUND)
+            await asyncio.gather(
+                *(client.send_bytes(f"poll-{index}".encode()) for index in range(3))
+            )
+
+        polls = asyncio.create_task(poll())
+        while not written:
+            await asyncio.sleep(0)
+        command = asyncio.create_task(client.send_bytes(b"command"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(polls, command)
+
+        self.assertEqual(written, [b"poll-0", b"command", b"poll-1", b"poll-2"])
+        client.begin_shutdown()
+        await client._writer_task
+
+    async def test_request_budget_defers_frames_beyond_burst(self) -> None:
+        """Frames above the burst wait for tokens and are counted."""
+        client = TydomClient(
+            None,
+            "test",
+            "001122334455",
+            "password",
+            host="local",
+            # Slow enough that a late wake-up cannot refill the bucket.
+            request_rate=20.0,
+            request_burst=2,
+        )
+        connection = _websocket()
+        client._connection = connection
+        client._connection_ready = True
+
+        await asyncio.gather(*(client.send_bytes(b"frame") for _ in range(4)))
+
+        self.assertEqual(connection.send_bytes.await_count, 4)
+        self.assertEqual(client.requests_deferred, 2)
+        client.begin_shutdown()
+        await client._writer_task
+
+    def test_request_budget_slows_down_with_gateway_latency(self) -> None:
+        """Slow replies halve the rate, fast replies restore it gradually."""
+        budget = client_module.RequestBudget(rate=8.0, burst=1)
+
+        budget.record_latency(10.0)
+        self.assertEqual(budget.current_rate, 4.0)
+        budget.record_latency(10.0)
+        self.assertEqual(budget.current_rate, 2.0)
+        for _ in range(20):
+            budget.record_latency(10.0)
+        self.assertEqual(budget.current_rate, 1.0)
+
+        for _ in range(40):
+            budget.record_latency(0.05)
+        self.assertEqual(budget.current_rate, 8.0)
+
+        self.assertEqual(budget.take(), 0.0)
+        self.assertGreater(budget.take(), 0.0)
+        self.assertEqual(budget.deferred, 1)
+
     async def test_explicit_protocol_ids_use_correct_url_positions(self) -> None:
         """Canonical device and endpoint ids must retain their URL positions."""
         client = self._client()
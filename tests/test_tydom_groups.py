@@ -52,6 +52,25 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_path = root / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+codec_spec = importlib.util.spec_from_file_location(codec_name, codec_path)
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, codec_path.with_name("catalog.py")
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_path = (
     root / "custom_components" / "deltadore_tydom" / "tydom" / "MessageHandler.py"
@@ -77,11 +96,7 @@ class TydomGroupDiscoveryTests(IsolatedAsyncioTestCase):
     """Exercise membership filtering and names derived from TYDOM metadata."""
 
     def setUp(self) -> None:
-        """Reset global protocol metadata."""
-        handler_module.groups_metadata.clear()
-        handler_module.groups_data.clear()
-        handler_module.endpoint_config.clear()
-        handler_module.remote_control_info.clear()
+        """Create a handler with a fresh catalogue before each test."""
         self.handler = MessageHandler(MagicMock(), b"")
 
     async def test_only_non_empty_supported_total_groups_are_created(self) -> None:
@@ -150,7 +165,7 @@ class TydomGroupDiscoveryTests(IsolatedAsyncioTestCase):
                 ("4", "All shutters", "shutter"),
             ],
         )
-        self.assertEqual(set(handler_module.groups_data), {"1", "2", "3", "4"})
+        self.assertEqual(set(self.handler.catalog.groups), {"1", "2", "3", "4"})
 
     async def test_user_group_name_is_preserved(self) -> None:
         """Retain a meaningful name supplied by the user in the Tydom app."""
@@ -214,7 +229,7 @@ class TydomGroupDiscoveryTests(IsolatedAsyncioTestCase):
         )
 
         self.assertEqual(groups, [])
-        self.assertEqual(handler_module.groups_data["6"]["name"], "Kitchen window")
+        self.assertEqual(self.handler.catalog.groups["6"]["name"], "Kitchen window")
 
 
 if __name__ == "__main__":
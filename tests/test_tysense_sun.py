@@ -49,6 +49,25 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_path = root / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+codec_spec = importlib.util.spec_from_file_location(codec_name, codec_path)
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, codec_path.with_name("catalog.py")
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_path = (
     root / "custom_components" / "deltadore_tydom" / "tydom" / "MessageHandler.py"
@@ -74,13 +93,15 @@ class TestTySenseSun(IsolatedAsyncioTestCase):
     """Exercise discovery and live state for Tysense Sun probes."""
 
     def setUp(self) -> None:
-        """Reset global protocol metadata."""
-        handler_module.device_name.clear()
-        handler_module.device_type.clear()
-        handler_module.device_metadata.clear()
+        """Create a handler with a fresh catalogue before each test."""
         logger.reset_mock()
         self.handler = MessageHandler(MagicMock(), b"")
 
+    def _set(self, uid: str, **values) -> None:
+        """Configure an endpoint in the catalogue of the handler."""
+        endpoint_id, device_id = uid.split("_", 1)
+        self.handler.catalog.set_endpoint(uid, device_id, endpoint_id, **values)
+
     @staticmethod
     def _payload(device_id: int, irradiance: int) -> list[dict]:
         """Build a payload matching the two live Tysense Sun captures."""
@@ -122,19 +143,22 @@ class TestTySenseSun(IsolatedAsyncioTestCase):
         """The sensorSun usage must no longer fall back to a generic sensor."""
         device_id = 1752177761
         unique_id = f"{device_id}_{device_id}"
-        handler_module.device_name[unique_id] = "Sonde Soleil Ouest"
-        handler_module.device_type[unique_id] = "sensorSun"
-        handler_module.device_metadata[unique_id] = {
-            "lightPower": {
-                "type": "numeric",
-                "permission": "r",
-                "validity": "SENSOR_SUPERVISION",
-                "min": 0,
-                "max": 65534,
-                "step": 1,
-                "unit": "W/m2",
-            }
-        }
+        self._set(
+            unique_id,
+            name="Sonde Soleil Ouest",
+            usage="sensorSun",
+            metadata={
+                "lightPower": {
+                    "type": "numeric",
+                    "permission": "r",
+                    "validity": "SENSOR_SUPERVISION",
+                    "min": 0,
+                    "max": 65534,
+                    "step": 1,
+                    "unit": "W/m2",
+                }
+            },
+        )
 
         devices = await self.handler.parse_devices_data(
             self._payload(device_id, 45), None
@@ -164,8 +188,7 @@ class TestTySenseSun(IsolatedAsyncioTestCase):
             (1771919164, "Sonde Soleil Est", 528),
         ):
             unique_id = f"{device_id}_{device_id}"
-            handler_module.device_name[unique_id] = name
-            handler_module.device_type[unique_id] = "sensorSun"
+            self._set(unique_id, name=name, usage="sensorSun")
             devices.extend(
                 await self.handler.parse_devices_data(
                     self._payload(device_id, irradiance), None
@@ -181,8 +204,7 @@ class TestTySenseSun(IsolatedAsyncioTestCase):
         """An expired measurement must not overwrite the last valid reading."""
         device_id = 1752177761
         unique_id = f"{device_id}_{device_id}"
-        handler_module.device_name[unique_id] = "Sonde Soleil Ouest"
-        handler_module.device_type[unique_id] = "sensorSun"
+        self._set(unique_id, name="Sonde Soleil Ouest", usage="sensorSun")
         payload = self._payload(device_id, 45)
         payload[0]["endpoints"][0]["data"][2]["validity"] = "expired"
 
@@ -33,7 +33,7 @@ def _load_refresh_cdata():
     )
     isolated_module = ast.Module(body=[isolated_class], type_ignores=[])
     ast.fix_missing_locations(isolated_module)
-    namespace = {"LOGGER": MagicMock()}
+    namespace = {"LOGGER": MagicMock(), "SendPriority": MagicMock()}
     exec(compile(isolated_module, source_path, "exec"), namespace)
     return namespace["RefreshCdataMixin"]
 
@@ -50,6 +50,26 @@ _original_modules.setdefault(devices_name, sys.modules.get(devices_name, _MISSIN
 sys.modules[devices_name] = devices_module
 devices_spec.loader.exec_module(devices_module)
 
+codec_name = "custom_components.deltadore_tydom.tydom.codec"
+codec_spec = importlib.util.spec_from_file_location(
+    codec_name, protocol_path / "codec.py"
+)
+assert codec_spec is not None and codec_spec.loader is not None
+codec_module = importlib.util.module_from_spec(codec_spec)
+_original_modules.setdefault(codec_name, sys.modules.get(codec_name, _MISSING))
+sys.modules[codec_name] = codec_module
+codec_spec.loader.exec_module(codec_module)
+
+catalog_name = "custom_components.deltadore_tydom.tydom.catalog"
+catalog_spec = importlib.util.spec_from_file_location(
+    catalog_name, protocol_path / "catalog.py"
+)
+assert catalog_spec is not None and catalog_spec.loader is not None
+catalog_module = importlib.util.module_from_spec(catalog_spec)
+_original_modules.setdefault(catalog_name, sys.modules.get(catalog_name, _MISSING))
+sys.modules[catalog_name] = catalog_module
+catalog_spec.loader.exec_module(catalog_module)
+
 handler_name = "custom_components.deltadore_tydom.tydom.MessageHandler"
 handler_spec = importlib.util.spec_from_file_location(
     handler_name, protocol_path / "MessageHandler.py"
@@ -76,18 +96,15 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
     """Exercise the captured binary series-4900 profile."""
 
     def setUp(self) -> None:
-        """Reset module-level protocol state between tests."""
-        handler_module.device_name.clear()
-        handler_module.device_endpoint.clear()
-        handler_module.device_type.clear()
-        handler_module.device_metadata.clear()
-        handler_module.device_tutorial_id.clear()
+        """Create a handler with a fresh catalogue before each test."""
         logger.reset_mock()
+        self.client = MagicMock()
+        self.handler = MessageHandler(self.client, b"")
 
     async def _configure(self, *, step: int = 100) -> str:
         """Install the sanitised configuration and metadata from issue 229."""
         uid = "20_10"
-        await MessageHandler.parse_config_data(
+        await self.handler.parse_config_data(
             {
                 "endpoints": [
                     {
@@ -103,8 +120,7 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
             },
             "transaction",
         )
-        handler = MessageHandler(MagicMock(), b"")
-        await handler.parse_devices_metadata(
+        await self.handler.parse_devices_metadata(
             [
                 {
                     "id": 10,
@@ -142,11 +158,11 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
     async def test_binary_other_profile_creates_tyxia_4910_switch(self) -> None:
         """The captured 'others' profile becomes a controllable switch."""
         uid = await self._configure()
-        client = MagicMock()
+        client = self.client
         client.put_devices_data = AsyncMock()
+        client.confirms_by_push.return_value = False
 
-        device = await MessageHandler.get_device(
-            client,
+        device = await self.handler.get_device(
             "others",
             uid,
             "10",
@@ -177,8 +193,7 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
         """A series-4900 dimmer is not inferred to be a TYXIA 4910."""
         uid = await self._configure(step=1)
 
-        device = await MessageHandler.get_device(
-            MagicMock(),
+        device = await self.handler.get_device(
             "others",
             uid,
             "10",
@@ -192,13 +207,17 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
     async def test_unidentified_other_usage_remains_generic(self) -> None:
         """Unrelated devices using 'others' continue through generic discovery."""
         uid = "40_30"
-        handler_module.device_metadata[uid] = {
-            "levelCmd": {"enum_values": ["ON", "OFF"]},
-            "level": {"min": 0, "max": 100, "step": 100},
-        }
+        self.handler.catalog.set_endpoint(
+            uid,
+            "30",
+            "40",
+            metadata={
+                "levelCmd": {"enum_values": ["ON", "OFF"]},
+                "level": {"min": 0, "max": 100, "step": 100},
+            },
+        )
 
-        device = await MessageHandler.get_device(
-            MagicMock(),
+        device = await self.handler.get_device(
             "others",
             uid,
             "30",
@@ -213,8 +232,7 @@ class Tyxia4910Tests(IsolatedAsyncioTestCase):
         """A TYXIA 4910 configured as lighting retains the light path."""
         uid = await self._configure()
 
-        device = await MessageHandler.get_device(
-            MagicMock(),
+        device = await self.handler.get_device(
             "light",
             uid,
             "10",
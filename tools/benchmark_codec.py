@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# ruff: noqa: T201
+"""Compare the websocket frame codec with the former http.client parser.
+
+Every frame of the ``tools/traces-*.txt`` corpus is parsed by both
+implementations: the results must match, then each parser is timed on the
+whole corpus.
+
+Usage: python3 tools/benchmark_codec.py [--rounds 200] [trace files...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+from http.client import HTTPResponse as CoreHTTPResponse
+import importlib.util
+from io import BytesIO
+from pathlib import Path
+import sys
+import time
+from typing import Any, NamedTuple, cast
+
+_TOOLS_DIR = Path(__file__).parent
+_CODEC_PATH = (
+    _TOOLS_DIR.parent / "custom_components" / "deltadore_tydom" / "tydom" / "codec.py"
+)
+_HTTP_STARTS = (b"HTTP/", b"DELETE ", b"GET ", b"PATCH ", b"POST ", b"PUT ")
+
+
+def _load_codec():
+    """Load the codec module without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location("tydom_codec", _CODEC_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Reference implementation: the http.client based parser used before the codec.
+
+
+class _BytesIOSocket:
+    def __init__(self, content: bytes) -> None:
+        self.handle = BytesIO(content)
+
+    def makefile(self, mode):
+        return self.handle
+
+
+class _FakeHTTPRequest(CoreHTTPResponse):
+    def _read_status(self):
+        line = str(self.fp.readline(65537), "iso-8859-1")
+        if not line:
+            raise ValueError("No request line")
+        words = line.rstrip("\r\n").split()
+        if not words[-1].startswith("HTTP/"):
+            raise ValueError(line)
+        self.method, self.path = words[:2]
+        return words[-1], 200, ""
+
+
+class _Parsed(NamedTuple):
+    start: tuple[Any, ...]
+    headers: dict[str, str]
+    body: bytes
+
+
+def _legacy_parse(frame: bytes) -> _Parsed:
+    if frame.startswith(b"HTTP/"):
+        response = CoreHTTPResponse(cast(Any, _BytesIOSocket(frame)))
+        response.begin()
+        start: tuple[Any, ...] = (response.status,)
+    else:
+        response = _FakeHTTPRequest(cast(Any, _BytesIOSocket(frame)))
+        response.begin()
+        start = (response.method, response.path)
+    headers: dict[str, str] = {}
+    for name, value in response.headers.items():
+        headers.setdefault(name.lower(), value)
+    return _Parsed(start, headers, response.read())
+
+
+def _codec_parse(codec, frame: bytes) -> _Parsed:
+    if frame.startswith(b"HTTP/"):
+        response = codec.parse_response(frame)
+        return _Parsed((response.status,), dict(response.headers), response.body)
+    request = codec.parse_request(frame)
+    return _Parsed((request.method, request.path), dict(request.headers), request.body)
+
+
+def load_frames(paths: list[Path]) -> list[bytes]:
+    """Return the protocol frames of trace files, as file mode replays them."""
+    frames = []
+    for path in paths:
+        for line in path.read_text(encoding="utf-8").splitlines():
+            raw = line.replace("\\r", "\x0d").replace("\\n", "\x0a").encode("utf-8")
+            # Remote captures keep the one-byte command prefix.
+            for candidate in (raw, raw[1:]):
+                if candidate.startswith(_HTTP_STARTS):
+                    frames.append(candidate)
+                    break
+    return frames
+
+
+def _time(parse, frames: list[bytes], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for frame in frames:
+            # Truncated frames raise, and cost time too.
+            with contextlib.suppress(Exception):
+                parse(frame)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    """Run the parity check and the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("traces", nargs="*", type=Path)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    codec = _load_codec()
+    paths = args.traces or sorted(_TOOLS_DIR.glob("traces-*.txt"))
+    frames = load_frames(paths)
+    if not frames:
+        print("No frame found")
+        return 1
+
+    mismatches = 0
+    for frame in frames:
+        try:
+            expected = _legacy_parse(frame)
+        except Exception:  # noqa: BLE001
+            expected = None
+        try:
+            actual = _codec_parse(codec, frame)
+        except ValueError:
+            actual = None
+        if expected != actual:
+            mismatches += 1
+            print(f"Mismatch: {frame[:80]!r}")
+
+    legacy = _time(_legacy_parse, frames, args.rounds)
+    fast = _time(lambda frame: _codec_parse(codec, frame), frames, args.rounds)
+    count = len(frames) * args.rounds
+    print(f"{len(frames)} frames from {len(paths)} traces, {mismatches} mismatches")
+    print(f"http.client: {legacy / count * 1e6:8.2f} µs/frame")
+    print(f"codec:       {fast / count * 1e6:8.2f} µs/frame")
+    print(f"speed-up:    {legacy / fast:8.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
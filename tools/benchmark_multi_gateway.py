@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# ruff: noqa: T201
+"""Run several simulated Tydom gateways in one process.
+
+Every gateway gets its own message handler, as every config entry gets its
+own hub. The gateways share device and endpoint ids, as real installations
+do, but name their devices after themselves: a device named after another
+gateway is cross-talk. Bootstraps are interleaved, then each gateway
+receives state pushes, and the cost per push frame is reported for each
+number of gateways: it should not grow with the number of gateways.
+
+Usage: python3 tools/benchmark_multi_gateway.py [--devices 50] [--rounds 20]
+       [--gateways 1 2 4 8 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+import types
+
+_PACKAGE_DIR = Path(__file__).parents[1] / "custom_components" / "deltadore_tydom"
+_PACKAGES = {
+    "custom_components": _PACKAGE_DIR.parent,
+    "custom_components.deltadore_tydom": _PACKAGE_DIR,
+    "custom_components.deltadore_tydom.tydom": _PACKAGE_DIR / "tydom",
+}
+
+
+def _load_message_handler():
+    """Load the protocol modules without importing Home Assistant."""
+    for name, path in _PACKAGES.items():
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules.setdefault(name, package)
+    return importlib.import_module(
+        "custom_components.deltadore_tydom.tydom.MessageHandler"
+    )
+
+
+class _Client:
+    """The parts of TydomClient used while parsing replies."""
+
+    def __init__(self, mac: str) -> None:
+        self.id = mac
+
+    def add_poll_device_url_5m(self, url: str) -> None:
+        pass
+
+
+def _frame(uri: str, payload, transaction_id: str | None = "1") -> bytes:
+    body = json.dumps(payload).encode()
+    if transaction_id is None:
+        start = f"PUT {uri} HTTP/1.1\r\n"
+        headers = ""
+    else:
+        start = "HTTP/1.1 200 OK\r\n"
+        headers = f"Uri-Origin: {uri}\r\nTransac-Id: {transaction_id}\r\n"
+    return (
+        start
+        + headers
+        + "Content-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+def _configs_file(gateway: int, devices: int) -> bytes:
+    return _frame(
+        "/configs/file",
+        {
+            "endpoints": [
+                {
+                    "id_endpoint": index,
+                    "id_device": index,
+                    "name": f"G{gateway} light {index}",
+                    "last_usage": "light",
+                }
+                for index in range(1, devices + 1)
+            ]
+        },
+    )
+
+
+def _devices_data(devices: int, level: int, transaction_id: str | None) -> bytes:
+    return _frame(
+        "/devices/data",
+        [
+            {
+                "id": index,
+                "endpoints": [
+                    {
+                        "id": index,
+                        "error": 0,
+                        "data": [
+                            {"name": "level", "value": level, "validity": "upToDate"}
+                        ],
+                    }
+                ],
+            }
+            for index in range(1, devices + 1)
+        ],
+        transaction_id,
+    )
+
+
+async def _run(module, gateways: int, devices: int, rounds: int):
+    """Return the cross-talk count and the cost of one push frame."""
+    handlers = [
+        module.MessageHandler(_Client(f"001A25{gateway:06X}"), b"")
+        for gateway in range(gateways)
+    ]
+    configs = [_configs_file(gateway, devices) for gateway in range(gateways)]
+    for handler, frame in zip(handlers, configs):
+        await handler.route_response(frame)
+
+    cross_talk = 0
+    initial = _devices_data(devices, 0, "1")
+    for gateway, handler in enumerate(handlers):
+        for device in await handler.route_response(initial) or []:
+            if not device.device_name.startswith(f"G{gateway} "):
+                cross_talk += 1
+
+    pushes = [_devices_data(devices, level, None) for level in range(rounds)]
+    started = time.perf_counter()
+    for frame in pushes:
+        for handler in handlers:
+            await handler.route_response(frame)
+    elapsed = time.perf_counter() - started
+    return cross_talk, elapsed / (rounds * gateways)
+
+
+def main() -> int:
+    """Run the benchmark for each number of gateways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--gateways", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    module = _load_message_handler()
+    failed = False
+    print(f"{args.devices} devices per gateway, {args.rounds} pushes per gateway")
+    for gateways in args.gateways:
+        cross_talk, per_frame = asyncio.run(
+            _run(module, gateways, args.devices, args.rounds)
+        )
+        failed |= cross_talk > 0
+        print(
+            f"{gateways:3d} gateways: {per_frame * 1e3:8.3f} ms/push frame, "
+            f"{cross_talk} devices named by another gateway"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())